@@ -0,0 +1,29 @@
+import argparse
+import sys
+
+# import logic only; the command line runner must never load PyQt6
+from logic.tab2_batch import CALCULATORS, run_scenarios
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Calculate IPHRA sample sizes for a file of scenarios without starting the GUI.")
+    parser.add_argument("input", help="CSV or Parquet file with one scenario per row")
+    parser.add_argument("output", help="CSV or Parquet file to write the results to")
+    parser.add_argument("--calculator", choices=list(CALCULATORS), default="household",
+                        help="sample size calculator to run (default: household)")
+    parser.add_argument("--sample-design", default="simple_random",
+                        help="sampling design when the input has no sample_design column (default: simple_random)")
+    parser.add_argument("--chunksize", type=int, default=100_000,
+                        help="number of rows processed at a time (default: 100000)")
+    args = parser.parse_args(argv)
+
+    try:
+        rows = run_scenarios(args.input, args.output, args.calculator, args.sample_design, args.chunksize)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Wrote {rows} scenarios to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
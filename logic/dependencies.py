@@ -0,0 +1,52 @@
+# logic/dependencies.py
+
+from collections import defaultdict
+
+class DependencyGraph:
+    """
+    Maps inputs to the outputs that are calculated from them.
+
+    A node names an output and lists what it reads: raw inputs (e.g. widget names) or other nodes. When some
+    inputs change, affected() returns exactly the nodes that have to be recalculated, in an order where every
+    node comes after the nodes it reads.
+
+    Examples
+    --------
+    >>> graph = DependencyGraph()
+    >>> graph.add('household', ['population', 'prevalence'])
+    >>> graph.add('planning', ['household', 'teams'])
+    >>> graph.affected(['prevalence'])
+    ['household', 'planning']
+    """
+
+    def __init__(self):
+        self._inputs = {}
+        self._dependents = defaultdict(set)
+        self._order = []
+
+    def add(self, node, inputs):
+        """Add a node calculated from inputs. Nodes must be added after the nodes they read."""
+        if node in self._inputs:
+            raise ValueError(f"Node {node!r} is already in the graph.")
+        self._inputs[node] = tuple(inputs)
+        for name in inputs:
+            self._dependents[name].add(node)
+        self._order.append(node)
+
+    @property
+    def nodes(self):
+        return list(self._order)
+
+    def inputs(self, node):
+        return self._inputs[node]
+
+    def affected(self, changed):
+        """Return the nodes that depend directly or through other nodes on any of the changed inputs, in order."""
+        pending = list(changed)
+        dirty = set()
+        while pending:
+            for node in self._dependents.get(pending.pop(), ()):
+                if node not in dirty:
+                    dirty.add(node)
+                    pending.append(node)
+        return [node for node in self._order if node in dirty]
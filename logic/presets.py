@@ -0,0 +1,54 @@
+# logic/presets.py
+
+from functools import cache
+from logic.tab4_xlsform import HH_QUESTION_BANK
+from logic.tab5_ki_tools import KI_TOOL_BANKS, KI_TOOL_LISTS
+
+TEMPLATES = ('short', 'recommended', 'full')
+
+# the indicators chosen for each template; required indicators and core modules are added on resolution
+_SHORT = {
+    'hh': ('mortality', 'fcs', 'hhs', 'water_source', 'health_access', 'muac'),
+    'communityki': ('population_movement', 'priority_needs'),
+    'fslki': ('market_functionality', 'staple_prices'),
+    'healthki': ('services_available', 'stockouts'),
+    'healthobs': ('infrastructure',),
+}
+_RECOMMENDED = {
+    'hh': _SHORT['hh'] + ('rcsi', 'lcs', 'water_quantity', 'sanitation', 'handwashing', 'measles_vaccination',
+                          'child_morbidity'),
+    'communityki': _SHORT['communityki'] + ('service_access', 'community_food_security', 'community_health'),
+    'fslki': _SHORT['fslki'] + ('supply_chain',),
+    'healthki': _SHORT['healthki'] + ('staffing',),
+    'healthobs': _SHORT['healthobs'] + ('facility_wash', 'cold_chain'),
+}
+
+_PRESETS = {'short': _SHORT, 'recommended': _RECOMMENDED}
+
+TOOL_BANKS = {'hh': HH_QUESTION_BANK, **{tool: KI_TOOL_BANKS[tool] for tool in KI_TOOL_LISTS}}
+
+@cache
+def resolve_template(template):
+    """
+    Return the indicator selection of every tool builder for a template preset.
+
+    Each bank expands the template's indicators with its precomputed closures and topological order (see
+    QuestionBank.expand), and the result is cached, so switching between templates is a dictionary lookup.
+
+    Parameters
+    ----------
+    template : str
+        One of TEMPLATES: 'short', 'recommended' or 'full'.
+
+    Returns
+    -------
+    dict
+        tool -> tuple of indicator keys, for 'hh' and each tool of KI_TOOL_LISTS.
+    """
+    if template not in TEMPLATES:
+        raise ValueError(f"Invalid template provided. Must be one of {', '.join(TEMPLATES)}.")
+    selections = {}
+    for tool, bank in TOOL_BANKS.items():
+        keys = bank.keys if template == 'full' else _PRESETS[template][tool]
+        selections[tool] = tuple(bank.expand(keys))
+    return selections
@@ -0,0 +1,175 @@
+# logic/strings.py
+
+import numpy as np
+
+# StringArray.hashes
+HASH_MULTIPLIER = 0x100000001B3
+# strings gathered at a time by StringArray.take
+TAKE_BLOCK = 65536
+
+class StringArray:
+    """
+    Immutable strings packed into one UTF-8 buffer (data, uint8) and their boundaries (offsets, int64).
+
+    String i is data[offsets[i]:offsets[i + 1]]. Both arrays can be memory-mapped, and a long answer only
+    costs its own length, unlike a fixed-width numpy bytes array.
+    """
+
+    def __init__(self, data, offsets):
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, strings):
+        strings = list(strings)
+        text = ''.join(strings)
+        data = text.encode('utf-8')
+        if len(data) == len(text):
+            # ASCII only: character counts are byte counts, so no string is encoded on its own
+            lengths = np.fromiter(map(len, strings), dtype=np.int64, count=len(strings))
+        else:
+            lengths = np.fromiter((len(s.encode('utf-8')) for s in strings), dtype=np.int64, count=len(strings))
+        offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        return cls(np.frombuffer(data, dtype=np.uint8).copy(), offsets)
+
+    @classmethod
+    def concatenate(cls, arrays):
+        """Join StringArrays end to end, copying only their packed buffers."""
+        arrays = list(arrays)
+        if not arrays:
+            return cls.from_strings([])
+        data = np.concatenate([array.data for array in arrays])
+        shifts = np.cumsum([0] + [len(array.data) for array in arrays[:-1]])
+        offsets = np.concatenate([arrays[0].offsets[:1]] + [array.offsets[1:] - array.offsets[0] + shift
+                                                          for array, shift in zip(arrays, shifts)])
+        return cls(data, offsets - offsets[0])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.data[self.offsets[i]:self.offsets[i + 1]].tobytes().decode('utf-8')
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes + self.offsets.nbytes
+
+    def tolist(self):
+        buffer, offsets = self.data.tobytes(), self.offsets.tolist()
+        return [buffer[start:end].decode('utf-8') for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def hashes(self):
+        """
+        Return a uint64 hash of each string, computed on the packed buffer without decoding.
+
+        The hash is the sum of (byte + 1) * HASH_MULTIPLIER ** (position in the string + 1), modulo 2 ** 64,
+        taken for all strings at once with one reduceat.
+        """
+        lengths = np.diff(self.offsets)
+        hashes = np.zeros(len(self), dtype=np.uint64)
+        if not len(self.data):
+            return hashes
+        powers = np.cumprod(np.full(int(lengths.max()), HASH_MULTIPLIER, dtype=np.uint64))
+        positions = np.arange(len(self.data)) - np.repeat(self.offsets[:-1], lengths)
+        terms = (self.data.astype(np.uint64) + np.uint64(1)) * powers[positions]
+        nonempty = lengths > 0
+        hashes[nonempty] = np.add.reduceat(terms, self.offsets[:-1][nonempty])
+        return hashes
+
+    def contains(self, substring):
+        """
+        Return a boolean mask of the strings that contain substring, searched on the packed buffer.
+
+        UTF-8 is self-synchronizing, so a byte match is a character match. A match counts only if it lies
+        within one string's bytes.
+        """
+        needle = np.frombuffer(substring.encode('utf-8'), dtype=np.uint8)
+        mask = np.zeros(len(self), dtype=bool)
+        if not len(needle):
+            mask[:] = True
+            return mask
+        count = len(self.data) - len(needle) + 1
+        if count <= 0:
+            return mask
+        hits = self.data[:count] == needle[0]
+        for k in range(1, len(needle)):
+            hits &= self.data[k:k + count] == needle[k]
+        starts = np.flatnonzero(hits)
+        owners = np.searchsorted(self.offsets, starts, side='right') - 1
+        mask[owners[starts + len(needle) <= self.offsets[owners + 1]]] = True
+        return mask
+
+    def take(self, indices):
+        """Return a StringArray of the strings at indices, gathered on the packed buffer."""
+        indices = np.asarray(indices, dtype=np.intp)
+        starts = self.offsets[:-1][indices]
+        lengths = self.offsets[1:][indices] - starts
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        data = np.empty(offsets[-1], dtype=np.uint8)
+        # gathered TAKE_BLOCK strings at a time, so the byte positions never cost 8 bytes per byte of data
+        for block in range(0, len(indices), TAKE_BLOCK):
+            end = min(block + TAKE_BLOCK, len(indices))
+            first, last = offsets[block], offsets[end]
+            shifts = np.repeat(starts[block:end] - offsets[block:end], lengths[block:end])
+            data[first:last] = self.data[np.arange(first, last) + shifts]
+        return StringArray(data, offsets)
+
+    def _words(self, rows, word):
+        # bytes 8 * word to 8 * word + 8 of each string at rows as a big-endian number, zero-padded, so that
+        # comparing the numbers compares the bytes
+        starts = self.offsets[:-1][rows] + 8 * word
+        available = np.clip(self.offsets[1:][rows] - starts, 0, 8)
+        block = np.zeros((len(rows), 8), dtype=np.uint8)
+        for j in range(8):
+            present = available > j
+            block[present, j] = self.data[starts[present] + j]
+        return block.view('>u8').ravel().astype(np.uint64)
+
+    def unique(self):
+        """
+        Return the sorted distinct strings and the position of each string among them.
+
+        Strings are sorted by their UTF-8 bytes, which is also Unicode code point order, eight bytes at a
+        time: each pass only re-sorts the groups still tied on every byte compared so far, so no Python
+        object or fixed-width copy is made per string.
+
+        Returns
+        -------
+        (StringArray, numpy.ndarray of int32)
+            The distinct strings, and for each string its index in them (int32 unless there are 2 ** 31
+            strings or more).
+        """
+        count = len(self)
+        index = np.int32 if count < 2 ** 31 else np.intp
+        lengths = np.diff(self.offsets)
+        order = np.arange(count, dtype=index)
+        # for each sorted position, the position where its group of strings equal so far starts
+        group_start = np.zeros(count, dtype=index)
+        # positions whose group is still tied and has bytes left to compare
+        tied = np.full(count, count > 1)
+        word = 0
+        while tied.any():
+            positions = np.flatnonzero(tied).astype(index)
+            rows, starts = order[positions], group_start[positions]
+            words = self._words(rows, word)
+            # bytes left after this word, 9 for more than 8: orders a string before a longer one it is a prefix of
+            left = np.minimum(lengths[rows] - 8 * word, 9).astype(np.int8)
+            resorted = np.lexsort((left, words, starts))
+            rows, words, left = rows[resorted], words[resorted], left[resorted]
+            del resorted
+            order[positions] = rows
+            new_group = np.ones(len(positions), dtype=bool)
+            new_group[1:] = (starts[1:] != starts[:-1]) | (words[1:] != words[:-1]) | (left[1:] != left[:-1])
+            del rows, starts, words
+            group_start[positions] = np.maximum.accumulate(np.where(new_group, positions, 0))
+            ids = np.cumsum(new_group, dtype=index) - 1
+            tied[positions] = (left == 9) & (np.bincount(ids)[ids] > 1)
+            del positions, left, new_group, ids
+            word += 1
+
+        first = group_start == np.arange(count)
+        inverse = np.empty(count, dtype=index)
+        inverse[order] = np.cumsum(first, dtype=index) - 1
+        return self.take(order[first]), inverse
@@ -0,0 +1,95 @@
+# logic/tab2_allocation.py
+
+import numpy as np
+
+ALLOCATION_METHODS = ('proportional', 'equal', 'neyman')
+
+def _allocation_shares(method, population_size, proportion, design_effect):
+    """Return the share of the total sample given to each stratum (sums to 1)."""
+    if method == 'proportional':
+        weights = population_size
+    elif method == 'equal':
+        weights = np.ones_like(population_size)
+    elif method == 'neyman':
+        # Optimal allocation: n_h proportional to N_h * S_h, with the stratum
+        # standard deviation inflated by its design effect.
+        weights = population_size * np.sqrt(proportion * (1 - proportion) * design_effect)
+    else:
+        raise ValueError(f"Invalid allocation method provided. Must be one of {', '.join(ALLOCATION_METHODS)}.")
+
+    total = weights.sum()
+    if total <= 0:
+        return np.zeros_like(weights)
+    return weights / total
+
+def allocate_stratified_sample(population_size, proportion, total_sample_size, method='proportional', design_effect=1, non_response=0):
+    """
+    Allocate a total sample across strata and adjust each stratum for finite population, design effect and non-response.
+
+    The total sample size is the number of completed interviews needed before any adjustment (n0 in
+    calculate_sample_size). It is split across strata by the chosen method, after which every stratum is
+    adjusted exactly like calculate_sample_size: finite population correction, design effect, then
+    inflation for non-response and rounding up. All strata are processed in a single vectorized pass.
+
+    Parameters
+    ----------
+    population_size : array-like
+        The population of each stratum.
+    proportion : array-like
+        The expected prevalence in each stratum (e.g., 0.3 for 30%). Only used by Neyman allocation.
+    total_sample_size : float
+        The unadjusted total sample size to allocate.
+    method : str, optional
+        One of 'proportional', 'equal' or 'neyman' (default is 'proportional').
+    design_effect : float or array-like, optional
+        The design effect of each stratum (default is 1).
+    non_response : float or array-like, optional
+        The expected rate of non-response in each stratum (default is 0).
+
+    Returns
+    -------
+    numpy.ndarray of int64
+        The sample size of each stratum, never larger than the stratum population.
+    """
+    N = np.asarray(population_size, dtype=np.float64)
+    p = np.broadcast_to(np.asarray(proportion, dtype=np.float64), N.shape)
+    deff = np.broadcast_to(np.asarray(design_effect, dtype=np.float64), N.shape)
+    response_rate = 1 - np.broadcast_to(np.asarray(non_response, dtype=np.float64), N.shape)
+
+    if np.any(N <= 0):
+        raise ValueError("Population size of every stratum must be greater than 0.")
+
+    n0 = total_sample_size * _allocation_shares(method, N, p, deff)
+    n = (n0 / (1 + (n0 - 1) / N)) * deff
+    n_h = np.ceil(n / response_rate)
+
+    return np.minimum(n_h, N).astype(np.int64)
+
+def allocate_strata(strata, total_sample_size, methods=ALLOCATION_METHODS):
+    """
+    Compute several allocations for a table of strata at once.
+
+    Parameters
+    ----------
+    strata : pandas.DataFrame or dict of array-like
+        The strata table. Must have 'population_size' and 'proportion' columns and may have
+        'design_effect' and 'non_response' columns (defaults 1 and 0).
+    total_sample_size : float
+        The unadjusted total sample size to allocate.
+    methods : iterable of str, optional
+        The allocation methods to compute (default is all of ALLOCATION_METHODS).
+
+    Returns
+    -------
+    dict
+        Maps each method name to the array of per-stratum sample sizes.
+    """
+    population_size = np.asarray(strata['population_size'], dtype=np.float64)
+    proportion = np.asarray(strata['proportion'], dtype=np.float64)
+    design_effect = strata['design_effect'] if 'design_effect' in strata else 1
+    non_response = strata['non_response'] if 'non_response' in strata else 0
+
+    return {
+        method: allocate_stratified_sample(population_size, proportion, total_sample_size, method, design_effect, non_response)
+        for method in methods
+    }
@@ -0,0 +1,157 @@
+# logic/tab2_batch.py
+
+import os
+import pandas as pd
+from logic.tab2_cache import SAMPLE_SIZE_CACHE
+from logic.validators import ColumnRule, validate_columns
+
+# calculator name -> scenario columns passed to it, in signature order
+CALCULATORS = {
+    'household': ('population_size', 'proportion', 'margin_of_error', 'non_response', 'design_effect'),
+    'individual': ('population_size', 'proportion', 'margin_of_error', 'non_response', 'household_size', 'prop_subpopulation', 'design_effect'),
+    'mortality': ('population_size', 'mortality_rate', 'margin_of_error', 'recall_period', 'non_response', 'household_size', 'design_effect'),
+}
+
+OPTIONAL_COLUMNS = {'design_effect': 1}
+
+SCENARIO_RULES = {
+    'population_size': ColumnRule(int, min_value=1),
+    'proportion': ColumnRule(float, 0, 1),
+    'margin_of_error': ColumnRule(float, 0, 1, exclusive_min=True),
+    'non_response': ColumnRule(float, 0, 1, exclusive_max=True),
+    'design_effect': ColumnRule(float, min_value=1),
+    'household_size': ColumnRule(float, min_value=0, exclusive_min=True),
+    'prop_subpopulation': ColumnRule(float, 0, 1, exclusive_min=True),
+    'mortality_rate': ColumnRule(float, 0, 10000),
+    'recall_period': ColumnRule(int, min_value=1),
+}
+
+MAX_REPORTED_ERRORS = 5
+
+def _file_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    elif extension in ('.parquet', '.pq'):
+        return 'parquet'
+    else:
+        raise ValueError(f"Unsupported file type {extension!r}. Use .csv or .parquet.")
+
+def _parquet():
+    # pyarrow is only needed for .parquet files, so it is imported on first use
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ValueError("Parquet files need the pyarrow package (pip install pyarrow). Use .csv instead.") from None
+    return pyarrow, pyarrow.parquet
+
+def read_scenarios(path, chunksize=100_000):
+    """
+    Read a CSV or Parquet file of scenarios in chunks.
+
+    Parameters
+    ----------
+    path : str
+        Path to a .csv or .parquet file.
+    chunksize : int, optional
+        The number of rows per chunk (default is 100,000).
+
+    Yields
+    ------
+    pandas.DataFrame
+        Consecutive chunks of the scenario table.
+    """
+    if _file_format(path) == 'csv':
+        yield from pd.read_csv(path, chunksize=chunksize)
+    else:
+        _, pq = _parquet()
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+
+def calculate_scenarios(scenarios, calculator='household', sample_design='simple_random'):
+    """
+    Calculate sample sizes for a table of scenarios in one vectorized pass.
+
+    Results go through the shared SAMPLE_SIZE_CACHE, so repeated scenarios are computed only once.
+
+    Parameters
+    ----------
+    scenarios : pandas.DataFrame
+        One row per scenario, with a column for every parameter of the chosen calculator (see CALCULATORS).
+        'design_effect' and 'sample_design' columns are optional.
+    calculator : str, optional
+        One of 'household', 'individual' or 'mortality' (default is 'household').
+    sample_design : str, optional
+        The sampling design used when the table has no 'sample_design' column (default is 'simple_random').
+
+    Returns
+    -------
+    pandas.DataFrame
+        A copy of scenarios with an added 'sample_size' column (households).
+    """
+    if calculator not in CALCULATORS:
+        raise ValueError(f"Invalid calculator provided. Must be one of {', '.join(CALCULATORS)}.")
+    columns = CALCULATORS[calculator]
+
+    missing = [c for c in columns if c not in scenarios.columns and c not in OPTIONAL_COLUMNS]
+    if missing:
+        raise ValueError(f"Scenario table is missing required columns: {', '.join(missing)}.")
+
+    errors = validate_columns(scenarios, {c: SCENARIO_RULES[c] for c in columns})
+    if errors:
+        shown = '; '.join(str(e) for e in errors[:MAX_REPORTED_ERRORS])
+        raise ValueError(f"{len(errors)} invalid scenario values: {shown}")
+
+    arguments = [scenarios[c].to_numpy() if c in scenarios.columns else OPTIONAL_COLUMNS[c] for c in columns]
+    designs = scenarios['sample_design'].to_numpy() if 'sample_design' in scenarios.columns else sample_design
+
+    result = scenarios.copy()
+    result['sample_size'] = SAMPLE_SIZE_CACHE.calculate_batch(calculator, designs, *arguments)
+    return result
+
+def run_scenarios(input_path, output_path, calculator='household', sample_design='simple_random', chunksize=100_000):
+    """
+    Stream a scenario file through a calculator and write the results chunk by chunk.
+
+    Parameters
+    ----------
+    input_path : str
+        Path to a .csv or .parquet scenario file.
+    output_path : str
+        Path of the .csv or .parquet file to write.
+    calculator : str, optional
+        One of 'household', 'individual' or 'mortality' (default is 'household').
+    sample_design : str, optional
+        The sampling design used when the input has no 'sample_design' column (default is 'simple_random').
+    chunksize : int, optional
+        The number of rows held in memory at a time (default is 100,000).
+
+    Returns
+    -------
+    int
+        The number of scenarios written.
+    """
+    output_format = _file_format(output_path)
+    if output_format == 'parquet':
+        # fail before any input is read
+        pa, pq = _parquet()
+    writer = None
+    rows = 0
+
+    try:
+        for chunk in read_scenarios(input_path, chunksize):
+            result = calculate_scenarios(chunk, calculator, sample_design)
+            if output_format == 'csv':
+                result.to_csv(output_path, mode='w' if rows == 0 else 'a', header=rows == 0, index=False)
+            else:
+                table = pa.Table.from_pandas(result, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table)
+            rows += len(result)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows
@@ -0,0 +1,231 @@
+# logic/tab2_cache.py
+
+from collections import OrderedDict
+import math
+import threading
+import numpy as np
+from logic.tab2_samplesize import (
+    SAMPLE_DESIGNS,
+    calculate_sample_size,
+    calculate_sample_size_ind_to_hh,
+    calculate_sample_size_mortality_rate,
+    calculate_sample_size_batch,
+    calculate_sample_size_ind_to_hh_batch,
+    calculate_sample_size_mortality_rate_batch,
+)
+
+# calculator name -> (scalar function, batch function)
+CALCULATOR_FUNCTIONS = {
+    'household': (calculate_sample_size, calculate_sample_size_batch),
+    'individual': (calculate_sample_size_ind_to_hh, calculate_sample_size_ind_to_hh_batch),
+    'mortality': (calculate_sample_size_mortality_rate, calculate_sample_size_mortality_rate_batch),
+}
+
+def _normalize_design(sample_design):
+    return str(sample_design).strip().lower()
+
+def _design_index(sample_design):
+    design = _normalize_design(sample_design)
+    if design not in SAMPLE_DESIGNS:
+        raise ValueError("Invalid sample design type provided.")
+    return SAMPLE_DESIGNS.index(design)
+
+def _distinct_rows(columns, shape):
+    # The distinct rows of the columns broadcast to shape, as in np.unique(table, axis=0), and the row of
+    # each element. Each column is encoded by its own distinct values before broadcasting, so the rows are
+    # de-duplicated as one int64 code each rather than by sorting the whole float table.
+    values, codes = [], []
+    for column in columns:
+        distinct, inverse = np.unique(column, return_inverse=True)
+        values.append(distinct)
+        codes.append(inverse.reshape(column.shape))
+    radixes = [len(v) for v in values]
+    if math.prod(radixes) >= 2 ** 63:
+        table = np.column_stack([c.ravel() for c in np.broadcast_arrays(*columns)])
+        unique_rows, inverse = np.unique(table, axis=0, return_inverse=True)
+        return unique_rows, inverse.ravel()
+    row_codes = np.zeros(shape, dtype=np.int64)
+    for code, radix in zip(codes, radixes):
+        row_codes = row_codes * radix + code
+    row_codes = row_codes.ravel()
+    if math.prod(radixes) <= 4 * row_codes.size:
+        # few possible codes, e.g. a full grid: mark the ones present instead of sorting
+        present = np.zeros(math.prod(radixes), dtype=bool)
+        present[row_codes] = True
+        unique_codes = np.flatnonzero(present)
+        inverse = (np.cumsum(present, dtype=np.intp) - 1)[row_codes]
+    else:
+        unique_codes, inverse = np.unique(row_codes, return_inverse=True)
+    unique_rows = np.empty((len(unique_codes), len(columns)), dtype=np.float64)
+    for j in reversed(range(len(columns))):
+        unique_codes, digits = np.divmod(unique_codes, radixes[j])
+        unique_rows[:, j] = values[j][digits]
+    return unique_rows, inverse.ravel()
+
+class SampleSizeCache:
+    """
+    Bounded LRU cache of sample size results shared by the scalar and batch calculators.
+
+    Keys are (calculator, sample_design, *parameters) with the design lower-cased and every numeric
+    parameter converted to float, so "0.5", 0.5 and numpy.float64(0.5) hit the same entry. The scalar
+    and batch calculators return identical results, so entries filled by one are reused by the other.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bypassed = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.bypassed = 0
+
+    def stats(self):
+        """Return the hit/miss/eviction/bypass counters, current size and hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bypassed': self.bypassed,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+    def _get(self, key):
+        # caller holds the lock
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key, value):
+        # caller holds the lock
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def calculate(self, calculator, sample_design, *parameters):
+        """
+        Return the scalar sample size for one parameter set, computing it only on a cache miss.
+
+        Parameters
+        ----------
+        calculator : str
+            One of 'household', 'individual' or 'mortality'.
+        sample_design : str
+            The sampling design ('simple_random', 'stratified', 'clustered').
+        *parameters : float
+            The remaining positional arguments of the calculator, in its signature order.
+
+        Returns
+        -------
+        int
+            The calculated sample size.
+        """
+        function = CALCULATOR_FUNCTIONS[calculator][0]
+        design = _normalize_design(sample_design)
+        values = tuple(float(p) for p in parameters)
+        key = (calculator, design) + values
+
+        with self._lock:
+            result = self._get(key)
+            if result is not None:
+                self.hits += 1
+                return result
+
+        result = function(design, *values)
+        with self._lock:
+            self.misses += 1
+            self._put(key, result)
+        return result
+
+    def calculate_batch(self, calculator, sample_design, *parameters):
+        """
+        Vectorized counterpart of calculate: repeated parameter sets are computed once.
+
+        The batch is reduced to its distinct parameter rows first. When they fit in the cache, each one is
+        looked up and only the misses are computed and stored. When there are more distinct rows than the
+        cache holds, they are computed in a single vectorized pass without being looked up or stored, so a
+        large sweep neither runs at Python speed per row nor evicts the entries already cached; those rows
+        are counted as bypassed, not as misses.
+
+        Parameters
+        ----------
+        calculator : str
+            One of 'household', 'individual' or 'mortality'.
+        sample_design : str or array-like of str
+            The sampling design(s).
+        *parameters : scalar or array-like
+            The remaining arguments of the calculator, broadcast against each other.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            The calculated sample sizes.
+        """
+        batch_function = CALCULATOR_FUNCTIONS[calculator][1]
+
+        designs = np.asarray(sample_design, dtype=object)
+        design_names, design_inverse = np.unique(designs.ravel(), return_inverse=True)
+        design_codes = np.array([_design_index(name) for name in design_names], dtype=np.intp)
+        design_index = design_codes[design_inverse.ravel()].reshape(designs.shape)
+
+        parameters = [np.asarray(p, dtype=np.float64) for p in parameters]
+        shape = np.broadcast_shapes(designs.shape, *(p.shape for p in parameters))
+        unique_rows, inverse = _distinct_rows([design_index.astype(np.float64)] + parameters, shape)
+        unique_designs = np.array(SAMPLE_DESIGNS, dtype=object)[unique_rows[:, 0].astype(np.intp)]
+
+        if len(unique_rows) > self.maxsize:
+            # a single design is passed as a string, so it is not checked once per row
+            designs = SAMPLE_DESIGNS[design_codes[0]] if len(design_codes) == 1 else unique_designs
+            unique_results = batch_function(designs, *unique_rows[:, 1:].T).astype(np.int64)
+            with self._lock:
+                self.bypassed += inverse.size
+            return unique_results[inverse].reshape(shape)
+
+        unique_results = np.empty(len(unique_rows), dtype=np.int64)
+        keys = [(calculator, SAMPLE_DESIGNS[int(row[0])]) + tuple(row[1:].tolist()) for row in unique_rows]
+        with self._lock:
+            cached = [self._get(key) for key in keys]
+        missing = np.array([value is None for value in cached], dtype=bool)
+        for i, value in enumerate(cached):
+            if value is not None:
+                unique_results[i] = value
+
+        if missing.any():
+            unique_results[missing] = batch_function(unique_designs[missing], *unique_rows[missing, 1:].T)
+
+        with self._lock:
+            n_computed = int(missing.sum())
+            self.misses += n_computed
+            self.hits += inverse.size - n_computed
+            for i in np.flatnonzero(missing):
+                self._put(keys[i], int(unique_results[i]))
+
+        return unique_results[inverse].reshape(shape)
+
+SAMPLE_SIZE_CACHE = SampleSizeCache()
+
+def calculate_sample_size_cached(sample_design, population_size, proportion, margin_of_error, non_response, design_effect=1):
+    """Memoized calculate_sample_size using the shared SAMPLE_SIZE_CACHE."""
+    return SAMPLE_SIZE_CACHE.calculate('household', sample_design, population_size, proportion, margin_of_error, non_response, design_effect)
+
+def calculate_sample_size_ind_to_hh_cached(sample_design, population_size, proportion, margin_of_error, non_response, household_size, prop_subpopulation, design_effect=1):
+    """Memoized calculate_sample_size_ind_to_hh using the shared SAMPLE_SIZE_CACHE."""
+    return SAMPLE_SIZE_CACHE.calculate('individual', sample_design, population_size, proportion, margin_of_error, non_response, household_size, prop_subpopulation, design_effect)
+
+def calculate_sample_size_mortality_rate_cached(sample_design, population_size, mortality_rate, margin_of_error, recall_period, non_response, household_size, design_effect=1):
+    """Memoized calculate_sample_size_mortality_rate using the shared SAMPLE_SIZE_CACHE."""
+    return SAMPLE_SIZE_CACHE.calculate('mortality', sample_design, population_size, mortality_rate, margin_of_error, recall_period, non_response, household_size, design_effect)
@@ -0,0 +1,165 @@
+# logic/tab2_planning.py
+
+import numpy as np
+
+PLANNING_OBJECTIVES = ('days', 'cost')
+
+def workday_minutes(start_minutes, end_minutes, nonwork_hours):
+    """
+    Return the minutes per day a team can spend travelling and interviewing.
+
+    Parameters
+    ----------
+    start_minutes, end_minutes : int
+        The daily start and end time as minutes after midnight.
+    nonwork_hours : float
+        Hours per day lost to introductions, breaks, etc.
+    """
+    if end_minutes <= start_minutes:
+        raise ValueError("Daily end time must be after the start time.")
+    available = end_minutes - start_minutes - 60 * nonwork_hours
+    if available <= 0:
+        raise ValueError("Non-work hours leave no time for data collection.")
+    return available
+
+class FieldworkPlan:
+    """
+    Fieldwork workload for one or many staffing options (scalars or broadcast arrays).
+
+    Attributes:
+        teams, enumerators, psus_per_day, cluster_size: The staffing option and households per PSU
+        num_psus: The number of PSUs needed to reach the required household count
+        num_days: The number of data collection days
+        team_days: teams x num_days
+    """
+
+    def __init__(self, teams, enumerators, psus_per_day, cluster_size, num_psus, num_days):
+        self.teams = teams
+        self.enumerators = enumerators
+        self.psus_per_day = psus_per_day
+        self.cluster_size = cluster_size
+        self.num_psus = num_psus
+        self.num_days = num_days
+
+    @property
+    def team_days(self):
+        return self.teams * self.num_days
+
+    def cost(self, enumerator_day_cost=1, team_day_cost=0):
+        """Return the staff cost: enumerator-days and team-days (vehicle, supervisor) times their daily costs."""
+        return self.team_days * (self.enumerators * enumerator_day_cost + team_day_cost)
+
+def _schedule(households, teams, psus_per_day, cluster_size):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        num_psus = np.ceil(households / cluster_size)
+        num_days = np.ceil(num_psus / (teams * psus_per_day))
+    feasible = (cluster_size >= 1) & (psus_per_day >= 1)
+    return np.where(feasible, num_psus, np.nan), np.where(feasible, num_days, np.nan)
+
+def plan_fieldwork(households, teams, enumerators, psus_per_day, available_minutes, interview_minutes, travel_minutes,
+                   cluster_size=None):
+    """
+    Calculate the number of PSUs and data collection days for a staffing plan.
+
+    Each team visits psus_per_day PSUs a day, travelling to and from each one. The time left is shared by
+    its enumerators, so the households a team completes in one PSU (the cluster size) follow from it,
+    unless a smaller cluster size is given. All arguments broadcast, so one call can evaluate many plans.
+
+    Parameters
+    ----------
+    households : int
+        The number of households needed.
+    teams, enumerators, psus_per_day : int or numpy.ndarray
+        The number of teams, enumerators per team and PSUs per team per day.
+    available_minutes : float
+        Working minutes per day, see workday_minutes.
+    interview_minutes : float
+        The average interview time plus walking to the next household, in minutes.
+    travel_minutes : float
+        The average travel time to a site and back, in minutes.
+    cluster_size : int, numpy.ndarray or None, optional
+        The households per PSU, e.g. of a plan chosen with optimize_fieldwork; capped at what the working day
+        allows. By default the most the working day allows.
+
+    Returns
+    -------
+    FieldworkPlan
+        num_psus and num_days are NaN where the plan leaves no time to complete a household per PSU.
+    """
+    if households < 1:
+        raise ValueError("Households needed must be at least 1.")
+    if interview_minutes <= 0:
+        raise ValueError("Interview time must be greater than 0.")
+    interview_time = np.asarray(available_minutes - psus_per_day * travel_minutes, dtype=np.float64)
+    interviews_per_enumerator = np.floor(np.maximum(interview_time, 0) / interview_minutes)
+    max_cluster_size = np.floor(enumerators * interviews_per_enumerator / psus_per_day)
+    if cluster_size is None:
+        cluster_size = max_cluster_size
+    else:
+        cluster_size = np.minimum(np.asarray(cluster_size, dtype=np.float64), max_cluster_size)
+    num_psus, num_days = _schedule(households, teams, psus_per_day, cluster_size)
+    return FieldworkPlan(teams, enumerators, psus_per_day, cluster_size, num_psus, num_days)
+
+def optimize_fieldwork(households, available_minutes, interview_minutes, travel_minutes, max_teams, max_enumerators,
+                       cluster_sizes, objective='days', enumerator_day_cost=1, team_day_cost=0, max_days=None):
+    """
+    Search every combination of teams x enumerators per team x cluster size for the best fieldwork plan.
+
+    For a given cluster size, a team of e enumerators needs ceil(m / e) interview slots per PSU plus the
+    travel time, which fixes how many PSUs it can visit a day. The whole grid is evaluated with broadcast
+    arithmetic on a (teams, enumerators, cluster_sizes) array.
+
+    Parameters
+    ----------
+    households : int
+        The number of households needed.
+    available_minutes, interview_minutes, travel_minutes : float
+        See plan_fieldwork.
+    max_teams, max_enumerators : int
+        Search 1..max_teams teams and 1..max_enumerators enumerators per team.
+    cluster_sizes : array-like of int
+        The households per PSU to consider.
+    objective : str, optional
+        'days' minimizes data collection days (then cost); 'cost' minimizes cost (then days).
+    enumerator_day_cost, team_day_cost : float, optional
+        Daily cost of an enumerator and fixed daily cost of a team (default 1 and 0, i.e. enumerator-days).
+    max_days : int or None, optional
+        Only consider plans finishing within this many days.
+
+    Returns
+    -------
+    FieldworkPlan
+        All feasible plans as 1-D arrays, best first.
+    """
+    if objective not in PLANNING_OBJECTIVES:
+        raise ValueError(f"Invalid objective provided. Must be one of {', '.join(PLANNING_OBJECTIVES)}.")
+    if households < 1:
+        raise ValueError("Households needed must be at least 1.")
+    if interview_minutes <= 0:
+        raise ValueError("Interview time must be greater than 0.")
+    if max_teams < 1 or max_enumerators < 1:
+        raise ValueError("Number of teams and enumerators must be at least 1.")
+
+    teams = np.arange(1, max_teams + 1).reshape(-1, 1, 1)
+    enumerators = np.arange(1, max_enumerators + 1).reshape(1, -1, 1)
+    cluster_size = np.asarray(cluster_sizes, dtype=np.float64).reshape(1, 1, -1)
+
+    minutes_per_psu = travel_minutes + np.ceil(cluster_size / enumerators) * interview_minutes
+    psus_per_day = np.floor(available_minutes / minutes_per_psu)
+    num_psus, num_days = _schedule(households, teams, psus_per_day, cluster_size)
+
+    shape = np.broadcast_shapes(teams.shape, enumerators.shape, cluster_size.shape)
+    teams, enumerators, psus_per_day, cluster_size, num_psus, num_days = (
+        np.broadcast_to(a, shape).ravel() for a in (teams, enumerators, psus_per_day, cluster_size, num_psus, num_days))
+    keep = np.isfinite(num_days)
+    if max_days is not None:
+        keep &= num_days <= max_days
+    plans = FieldworkPlan(teams[keep], enumerators[keep], psus_per_day[keep], cluster_size[keep], num_psus[keep], num_days[keep])
+
+    cost = plans.cost(enumerator_day_cost, team_day_cost)
+    staff = plans.teams * plans.enumerators
+    # np.lexsort sorts by the last key first
+    primary, secondary = (plans.num_days, cost) if objective == 'days' else (cost, plans.num_days)
+    order = np.lexsort((plans.num_psus, staff, secondary, primary))
+    return FieldworkPlan(*(getattr(plans, name)[order] for name in
+                           ('teams', 'enumerators', 'psus_per_day', 'cluster_size', 'num_psus', 'num_days')))
@@ -1,7 +1,33 @@
 # logic/samplesize.py
 
 import math
-from logic.validators import validate_type, validate_int, validate_float 
+import numpy as np
+
+# parameter name -> how errors refer to it
+PARAMETER_LABELS = {
+    'population_size': "Population size",
+    'proportion': "Proportion",
+    'mortality_rate': "Mortality rate",
+    'margin_of_error': "Margin of error",
+    'recall_period': "Recall period",
+    'non_response': "Non-response",
+    'household_size': "Household size",
+    'prop_subpopulation': "Proportion of the subpopulation",
+    'design_effect': "Design effect",
+}
+# the parameters the sample size is divided by
+POSITIVE_PARAMETERS = ('population_size', 'margin_of_error', 'recall_period', 'household_size', 'prop_subpopulation')
+
+def _check_parameters(**parameters):
+    """Raise ValueError if any parameter set is not finite, would divide by zero or give a negative sample size."""
+    for name, value in parameters.items():
+        value = np.asarray(value, dtype=np.float64)
+        if not np.all(np.isfinite(value)):
+            raise ValueError(f"{PARAMETER_LABELS[name]} must be a finite number.")
+        if name in POSITIVE_PARAMETERS and not np.all(value > 0):
+            raise ValueError(f"{PARAMETER_LABELS[name]} must be greater than 0.")
+        if name == 'non_response' and not np.all((value >= 0) & (value < 1)):
+            raise ValueError("Non-response must be at least 0 and less than 1.")
 
 def calculate_sample_size(sample_design, population_size, proportion, margin_of_error, non_response, design_effect=1):
     """
@@ -27,7 +53,9 @@ def calculate_sample_size(sample_design, population_size, proportion, margin_of_
     int
         The calculated sample size.
     """
-    
+    _check_parameters(population_size=population_size, proportion=proportion, margin_of_error=margin_of_error,
+                      non_response=non_response, design_effect=design_effect)
+
     Z = 1.96  # default to 95%
     p = proportion
     e = margin_of_error
@@ -69,6 +97,10 @@ def calculate_sample_size_ind_to_hh(sample_design, population_size, proportion,
     int
         The calculated sample size.
     """
+    _check_parameters(population_size=population_size, proportion=proportion, margin_of_error=margin_of_error,
+                      non_response=non_response, household_size=household_size, prop_subpopulation=prop_subpopulation,
+                      design_effect=design_effect)
+
     Z = 1.96  # default to 95%
     p = proportion
     e = margin_of_error
@@ -97,16 +129,16 @@ def calculate_sample_size_mortality_rate(sample_design, population_size, mortali
         The sampling design to use (e.g., 'simple_random', 'stratified', 'clustered').
     population_size : int
         The total population size to determine if finite population correction is needed.
-    proportion : float
-        The estimated proportion of the population that has the attribute of interest.
+    mortality_rate : float
+        The estimated crude mortality rate in deaths per 10,000 people per day.
     margin_of_error : float
-        The desired margin of error (e.g., 0.05 for 5%).
-    recall_days : int
-        The number of days in the recall period for mortality (e.g., 30 for a 30-day recall).
-    household_size : int
-        The average number of individuals per household.
+        The desired precision in deaths per 10,000 people per day (e.g., 0.4).
+    recall_period : int
+        The number of days in the recall period for mortality (e.g., 90 for a 90-day recall).
     non_response : float
         The expected rate of non-response (e.g., 0.1 for 10%).
+    household_size : float
+        The average number of individuals per household.
     design_effect : float, optional
         The design effect for clustered sampling (default is 1 for simple random or systematic random sampling designs).
 
@@ -115,9 +147,13 @@ def calculate_sample_size_mortality_rate(sample_design, population_size, mortali
     int
         The calculated sample size.
     """
+    _check_parameters(population_size=population_size, mortality_rate=mortality_rate, margin_of_error=margin_of_error,
+                      recall_period=recall_period, non_response=non_response, household_size=household_size,
+                      design_effect=design_effect)
 
-    r = cmr_per_10k_day / 10000
-    d = precision_per_10k_day / 10000
+    r = mortality_rate / 10000
+    d = margin_of_error / 10000
+    recall_days = recall_period
 
     Z = 1.96  # default to 95%
     N = population_size
@@ -127,7 +163,7 @@ def calculate_sample_size_mortality_rate(sample_design, population_size, mortali
     numerator = Z**2 * r * (1 - r) * design_effect
     denominator = d**2 * recall_days 
     n_individuals = numerator / denominator
-    n_adj_individuals = (n_individuals * total_population) / (n_individuals + (total_population - 1))
+    n_adj_individuals = (n_individuals * N) / (n_individuals + (N - 1))
 
     # Step 2: Convert to number of households
     n_households = (n_adj_individuals / household_size)
@@ -139,3 +175,127 @@ def calculate_sample_size_mortality_rate(sample_design, population_size, mortali
     else:
         raise ValueError("Invalid sample design type provided.")
 
+
+# --- Batch (vectorized) calculators ---------------------------------------------
+#
+# The batch functions below mirror the scalar calculators above term by term so
+# that each element of the returned array is identical to the scalar result for
+# the same parameter set. Any argument may be a scalar, a NumPy array or a pandas
+# column; arguments are broadcast against each other.
+
+SAMPLE_DESIGNS = ('simple_random', 'stratified', 'clustered')
+
+def _check_sample_design(sample_design):
+    """Raise ValueError if any entry of sample_design is not a supported design."""
+    designs = np.unique(np.asarray(sample_design, dtype=object))
+    invalid = [d for d in designs if d not in SAMPLE_DESIGNS]
+    if invalid:
+        raise ValueError("Invalid sample design type provided.")
+
+def _as_float_array(value):
+    return np.asarray(value, dtype=np.float64)
+
+def _ceil_to_int(n):
+    return np.ceil(n).astype(np.int64)
+
+def calculate_sample_size_batch(sample_design, population_size, proportion, margin_of_error, non_response, design_effect=1):
+    """
+    Vectorized version of calculate_sample_size for many parameter sets at once.
+
+    Parameters
+    ----------
+    sample_design : str or array-like of str
+        The sampling design(s) to use ('simple_random', 'stratified', 'clustered').
+    population_size, proportion, margin_of_error, non_response, design_effect : scalar or array-like
+        Same meaning as in calculate_sample_size. Arrays are broadcast against each other.
+
+    Returns
+    -------
+    numpy.ndarray of int64
+        The calculated sample sizes, one per broadcast parameter set.
+    """
+    _check_sample_design(sample_design)
+    _check_parameters(population_size=population_size, proportion=proportion, margin_of_error=margin_of_error,
+                      non_response=non_response, design_effect=design_effect)
+
+    Z = 1.96  # default to 95%
+    p = _as_float_array(proportion)
+    e = _as_float_array(margin_of_error)
+    N = _as_float_array(population_size)
+    response_rate = 1 - _as_float_array(non_response)
+
+    n0 = (Z**2 * p * (1 - p)) / (e**2)
+    n = (n0 / (1 + (n0 - 1) / N)) * _as_float_array(design_effect)
+
+    return _ceil_to_int(n / response_rate)
+
+def calculate_sample_size_ind_to_hh_batch(sample_design, population_size, proportion, margin_of_error, non_response, household_size, prop_subpopulation, design_effect=1):
+    """
+    Vectorized version of calculate_sample_size_ind_to_hh for many parameter sets at once.
+
+    Parameters
+    ----------
+    sample_design : str or array-like of str
+        The sampling design(s) to use ('simple_random', 'stratified', 'clustered').
+    population_size, proportion, margin_of_error, non_response, household_size, prop_subpopulation, design_effect : scalar or array-like
+        Same meaning as in calculate_sample_size_ind_to_hh. Arrays are broadcast against each other.
+
+    Returns
+    -------
+    numpy.ndarray of int64
+        The calculated number of households, one per broadcast parameter set.
+    """
+    _check_sample_design(sample_design)
+    _check_parameters(population_size=population_size, proportion=proportion, margin_of_error=margin_of_error,
+                      non_response=non_response, household_size=household_size, prop_subpopulation=prop_subpopulation,
+                      design_effect=design_effect)
+
+    Z = 1.96  # default to 95%
+    p = _as_float_array(proportion)
+    e = _as_float_array(margin_of_error)
+    N = _as_float_array(population_size)
+    response_rate = 1 - _as_float_array(non_response)
+
+    n0 = (Z**2 * p * (1 - p)) / (e**2)
+    n_ind = (n0 / (1 + (n0 - 1) / N)) * _as_float_array(design_effect)
+    n_hh = n_ind / (_as_float_array(household_size) * _as_float_array(prop_subpopulation))
+
+    return _ceil_to_int(n_hh / response_rate)
+
+def calculate_sample_size_mortality_rate_batch(sample_design, population_size, mortality_rate, margin_of_error, recall_period, non_response, household_size, design_effect=1):
+    """
+    Vectorized version of calculate_sample_size_mortality_rate for many parameter sets at once.
+
+    Parameters
+    ----------
+    sample_design : str or array-like of str
+        The sampling design(s) to use ('simple_random', 'stratified', 'clustered').
+    population_size, mortality_rate, margin_of_error, recall_period, non_response, household_size, design_effect : scalar or array-like
+        Same meaning as in calculate_sample_size_mortality_rate. Arrays are broadcast against each other.
+
+    Returns
+    -------
+    numpy.ndarray of int64
+        The calculated number of households, one per broadcast parameter set.
+    """
+    _check_sample_design(sample_design)
+    _check_parameters(population_size=population_size, mortality_rate=mortality_rate, margin_of_error=margin_of_error,
+                      recall_period=recall_period, non_response=non_response, household_size=household_size,
+                      design_effect=design_effect)
+
+    r = _as_float_array(mortality_rate) / 10000
+    d = _as_float_array(margin_of_error) / 10000
+    recall_days = _as_float_array(recall_period)
+
+    Z = 1.96  # default to 95%
+    N = _as_float_array(population_size)
+    response_rate = 1 - _as_float_array(non_response)
+
+    numerator = Z**2 * r * (1 - r) * _as_float_array(design_effect)
+    denominator = d**2 * recall_days
+    n_individuals = numerator / denominator
+    n_adj_individuals = (n_individuals * N) / (n_individuals + (N - 1))
+
+    n_households = (n_adj_individuals / _as_float_array(household_size))
+
+    return _ceil_to_int(n_households / response_rate)
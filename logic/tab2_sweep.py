@@ -0,0 +1,134 @@
+# logic/tab2_sweep.py
+
+import numpy as np
+from logic.tab2_batch import CALCULATORS, OPTIONAL_COLUMNS
+from logic.tab2_cache import SAMPLE_SIZE_CACHE
+
+def sweep_count(start, stop, step):
+    """Return the number of values sweep_range(start, stop, step) produces, without building them."""
+    if step <= 0:
+        raise ValueError("Step must be greater than 0.")
+    if stop < start:
+        raise ValueError("Stop must be at least start.")
+    return int(np.floor((stop - start) / step + 1e-9)) + 1
+
+def sweep_range(start, stop, step):
+    """
+    Return evenly spaced values from start to stop inclusive (e.g., sweep_range(0.05, 0.5, 0.05)).
+
+    Values are rounded to 10 decimals so that accumulated floating point error does not
+    produce keys like 0.15000000000000002.
+    """
+    count = sweep_count(start, stop, step)
+    return np.round(start + step * np.arange(count), 10)
+
+class SampleSizeGrid:
+    """
+    The result of a parameter sweep: a dense N-dimensional array of sample sizes, one axis per swept parameter.
+
+    Cells are addressed by their flat (row-major) index so that tables and exports can read any
+    range of cells without expanding the grid into per-cell Python objects.
+    """
+
+    def __init__(self, calculator, axis_names, axis_values, sample_sizes):
+        self.calculator = calculator
+        self.axis_names = tuple(axis_names)
+        self.axis_values = tuple(axis_values)
+        self.sample_sizes = sample_sizes
+
+    @property
+    def shape(self):
+        return self.sample_sizes.shape
+
+    @property
+    def size(self):
+        return self.sample_sizes.size
+
+    def __len__(self):
+        return self.size
+
+    def cell_parameters(self, start, stop):
+        """Return one array per axis with the swept parameter values of cells start..stop-1."""
+        indices = np.unravel_index(np.arange(start, min(stop, self.size)), self.shape)
+        return [values[index] for values, index in zip(self.axis_values, indices)]
+
+    def cell_sample_sizes(self, start, stop):
+        """Return the sample sizes of cells start..stop-1."""
+        return self.sample_sizes.reshape(-1)[start:stop]
+
+    def export_csv(self, path, block_size=100_000):
+        """
+        Write the grid in long format (one row per cell) to a CSV file, block by block.
+
+        Parameters
+        ----------
+        path : str
+            The file to write.
+        block_size : int, optional
+            The number of cells formatted at a time (default is 100,000).
+        """
+        formats = ['%.10g'] * len(self.axis_names) + ['%d']
+        with open(path, 'w', newline='') as f:
+            f.write(','.join(self.axis_names + ('sample_size',)) + '\n')
+            for start in range(0, self.size, block_size):
+                stop = min(start + block_size, self.size)
+                block = np.column_stack(self.cell_parameters(start, stop) + [self.cell_sample_sizes(start, stop)])
+                np.savetxt(f, block, fmt=formats, delimiter=',')
+
+def sweep_sample_size(calculator, sample_design, axes, **fixed):
+    """
+    Calculate sample sizes over the full Cartesian grid of the swept parameters.
+
+    Each swept parameter is reshaped onto its own axis and the batch calculator broadcasts them, so the grid
+    is evaluated in one vectorized pass without building the list of combinations.
+
+    Parameters
+    ----------
+    calculator : str
+        One of 'household', 'individual' or 'mortality'.
+    sample_design : str
+        The sampling design ('simple_random', 'stratified', 'clustered').
+    axes : dict
+        Maps parameter names (see logic.tab2_batch.CALCULATORS) to 1-D arrays of values to sweep, in axis order.
+    **fixed : float
+        Values for every other parameter of the calculator. design_effect defaults to 1.
+
+    Returns
+    -------
+    SampleSizeGrid
+        The grid of sample sizes with shape (len(values) for values in axes.values()).
+
+    Examples
+    --------
+    >>> grid = sweep_sample_size('household', 'clustered',
+    ...     {'proportion': sweep_range(0.05, 0.5, 0.01), 'margin_of_error': sweep_range(0.02, 0.1, 0.005), 'design_effect': sweep_range(1, 3, 0.1)},
+    ...     population_size=100000, non_response=0.1)
+    """
+    if calculator not in CALCULATORS:
+        raise ValueError(f"Invalid calculator provided. Must be one of {', '.join(CALCULATORS)}.")
+    parameters = CALCULATORS[calculator]
+
+    unknown = [name for name in list(axes) + list(fixed) if name not in parameters]
+    if unknown:
+        raise ValueError(f"Unknown parameters for the {calculator} calculator: {', '.join(unknown)}.")
+    missing = [name for name in parameters if name not in axes and name not in fixed and name not in OPTIONAL_COLUMNS]
+    if missing:
+        raise ValueError(f"Missing values for parameters: {', '.join(missing)}.")
+
+    axis_names = list(axes)
+    axis_values = [np.asarray(axes[name], dtype=np.float64).ravel() for name in axis_names]
+    ndim = len(axis_names)
+
+    arguments = []
+    for name in parameters:
+        if name in axes:
+            position = axis_names.index(name)
+            shape = [1] * ndim
+            shape[position] = -1
+            arguments.append(axis_values[position].reshape(shape))
+        else:
+            arguments.append(fixed.get(name, OPTIONAL_COLUMNS.get(name)))
+
+    grid_shape = tuple(len(values) for values in axis_values)
+    sample_sizes = SAMPLE_SIZE_CACHE.calculate_batch(calculator, sample_design, *arguments)
+    return SampleSizeGrid(calculator, axis_names, axis_values, np.broadcast_to(sample_sizes, grid_shape))
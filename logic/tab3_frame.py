@@ -0,0 +1,231 @@
+# logic/tab3_frame.py
+
+import codecs
+import csv
+import io
+import os
+import re
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from logic.strings import StringArray
+
+SNIFF_BLOCK_SIZE = 64 * 1024
+DELIMITERS = ',;\t|'
+NAME_COLUMN_PATTERN = re.compile(r'name|psu|cluster|village|location|site|camp|community', re.IGNORECASE)
+SIZE_COLUMN_PATTERN = re.compile(r'pop|size|mos|household|hh|people|persons|total', re.IGNORECASE)
+
+@dataclass(frozen=True)
+class FrameSchema:
+    """
+    What was detected from the first block of a sampling frame file.
+
+    Attributes:
+        encoding (str): The text encoding
+        delimiter (str): The field delimiter
+        columns (tuple of str): The header row
+        name_column (str): The column holding PSU names
+        size_column (str): The column holding PSU population sizes
+    """
+    encoding: str
+    delimiter: str
+    columns: tuple
+    name_column: str
+    size_column: str
+
+class SamplingFrame:
+    """
+    A sampling frame held as compact typed arrays.
+
+    The sorted distinct PSU names are packed into one UTF-8 buffer (name_labels, a StringArray) and
+    referenced by int32 codes (name_codes); population sizes are int32. A name costs its own length, so the
+    names of a census frame, which are nearly all unique, take about rows x (average name length + 12)
+    bytes instead of rows x longest name. No per-row Python objects are kept.
+
+    folded_labels holds the casefolded name_labels, for case-insensitive search. The loader builds it
+    alongside the labels; a frame built without it folds name_labels on first use.
+    """
+
+    def __init__(self, name_codes, name_labels, populations, schema=None, invalid_rows=0, folded_labels=None):
+        self.name_codes = name_codes
+        self.name_labels = name_labels
+        self._folded_labels = folded_labels
+        self.populations = populations
+        self.schema = schema
+        self.invalid_rows = invalid_rows
+
+    def __len__(self):
+        return len(self.populations)
+
+    @property
+    def nbytes(self):
+        return self.name_codes.nbytes + self.name_labels.nbytes + self.populations.nbytes
+
+    @property
+    def folded_labels(self):
+        if self._folded_labels is None:
+            self._folded_labels = StringArray.from_strings([label.casefold() for label in self.name_labels.tolist()])
+        return self._folded_labels
+
+    def name(self, row):
+        """Return the PSU name of one row."""
+        return self.name_labels[int(self.name_codes[row])]
+
+    def names(self, rows):
+        """Return the PSU names of the given rows (a slice or an index array) as a list of str."""
+        # each distinct name is decoded once
+        codes, inverse = np.unique(self.name_codes[rows], return_inverse=True)
+        labels = [self.name_labels[code] for code in codes.tolist()]
+        return [labels[i] for i in inverse.ravel().tolist()]
+
+def _detect_encoding(raw):
+    if raw.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if raw.startswith(codecs.BOM_UTF16_LE) or raw.startswith(codecs.BOM_UTF16_BE):
+        return 'utf-16'
+    # the block may end inside a multi-byte character, so only check complete lines
+    complete = raw[:raw.rfind(b'\n') + 1] or raw
+    try:
+        complete.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'latin-1'
+
+def _is_number(text):
+    try:
+        float(text)
+        return True
+    except ValueError:
+        return False
+
+def sniff_frame(path, name_column=None, size_column=None, block_size=SNIFF_BLOCK_SIZE):
+    """
+    Detect the encoding, delimiter, header and PSU name/size columns of a sampling frame from its first block.
+
+    Parameters
+    ----------
+    path : str
+        The CSV file.
+    name_column, size_column : str or None, optional
+        Use these columns instead of detecting them.
+    block_size : int, optional
+        The number of bytes to inspect (default is 64 KiB).
+
+    Returns
+    -------
+    FrameSchema
+        The detected layout.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read(block_size)
+    if not raw.strip():
+        raise ValueError("Sampling frame file is empty.")
+
+    encoding = _detect_encoding(raw)
+    text = raw.decode(encoding, errors='ignore')
+    lines = text.splitlines()
+    if len(raw) == block_size and len(lines) > 1:
+        lines = lines[:-1]  # last line may be cut off
+    sample = '\n'.join(lines)
+
+    try:
+        delimiter = csv.Sniffer().sniff(sample, delimiters=DELIMITERS).delimiter
+    except csv.Error:
+        delimiter = ','
+
+    rows = list(csv.reader(io.StringIO(sample), delimiter=delimiter))
+    columns = tuple(c.strip() for c in rows[0])
+    body = rows[1:]
+    # a column is numeric if most of its non-blank sample values parse as numbers
+    numeric = {}
+    for i, c in enumerate(columns):
+        values = [r[i] for r in body if i < len(r) and r[i].strip()]
+        numeric[c] = bool(values) and sum(_is_number(v) for v in values) > len(values) / 2
+
+    for given in (name_column, size_column):
+        if given is not None and given not in columns:
+            raise ValueError(f"Column {given!r} not found in sampling frame. Columns are: {', '.join(columns)}.")
+
+    if size_column is None:
+        numeric_columns = [c for c in columns if numeric[c]]
+        preferred = [c for c in numeric_columns if SIZE_COLUMN_PATTERN.search(c)]
+        size_column = (preferred or numeric_columns or [None])[0]
+    if name_column is None:
+        text_columns = [c for c in columns if c != size_column and not numeric[c]]
+        preferred = [c for c in text_columns if NAME_COLUMN_PATTERN.search(c)]
+        name_column = (preferred or text_columns or [None])[0]
+    if size_column is None or name_column is None:
+        raise ValueError("Sampling frame must have a PSU name column and a population size column.")
+
+    return FrameSchema(encoding, delimiter, columns, name_column, size_column)
+
+def load_sampling_frame(path, name_column=None, size_column=None, chunksize=250_000, progress=None):
+    """
+    Stream a sampling frame CSV into a SamplingFrame.
+
+    The layout is sniffed from the first block, then only the name and size columns are parsed, chunk by
+    chunk, and converted straight to typed arrays. Names are made unique within each chunk, so only int32
+    codes and each chunk's distinct names, packed as UTF-8, are kept until the chunks' labels are merged
+    at the end, by sorting the packed bytes (StringArray.unique) rather than per-name Python strings.
+
+    Parameters
+    ----------
+    path : str
+        The CSV file.
+    name_column, size_column : str or None, optional
+        Use these columns instead of detecting them.
+    chunksize : int, optional
+        The number of rows parsed at a time (default is 250,000).
+    progress : callable or None, optional
+        Called as progress(bytes_read, total_bytes) after every chunk.
+
+    Returns
+    -------
+    SamplingFrame
+        The loaded frame. Rows with a missing or non-numeric size get population 0 and are counted in
+        invalid_rows.
+    """
+    schema = sniff_frame(path, name_column, size_column)
+    total_bytes = os.path.getsize(path)
+
+    code_chunks, label_chunks, folded_chunks, size_chunks = [], [], [], []
+    invalid_rows = 0
+    with open(path, 'rb') as f:
+        reader = pd.read_csv(f, sep=schema.delimiter, encoding=schema.encoding, chunksize=chunksize,
+                             usecols=[schema.name_column, schema.size_column], dtype={schema.name_column: object},
+                             keep_default_na=False)
+        for chunk in reader:
+            sizes = pd.to_numeric(chunk[schema.size_column], errors='coerce').to_numpy(dtype=np.float64)
+            invalid = ~np.isfinite(sizes) | (sizes < 0)
+            invalid_rows += int(invalid.sum())
+            sizes = np.where(invalid, 0, sizes)
+            if sizes.max(initial=0) > np.iinfo(np.int32).max:
+                raise ValueError("PSU population sizes are too large.")
+            size_chunks.append(sizes.astype(np.int32))
+            codes, names = pd.factorize(chunk[schema.name_column].to_numpy(dtype=object))
+            code_chunks.append(codes.astype(np.int32))
+            label_chunks.append(StringArray.from_strings(names))
+            folded_chunks.append(StringArray.from_strings([name.casefold() for name in names]))
+            if progress is not None:
+                progress(f.tell(), total_bytes)
+
+    if not size_chunks:
+        empty = StringArray.from_strings([])
+        return SamplingFrame(np.empty(0, np.int32), empty, np.empty(0, np.int32), schema, folded_labels=empty)
+
+    populations = np.concatenate(size_chunks)
+    del size_chunks
+    # each chunk's labels map onto the sorted labels of the whole frame
+    offsets = np.cumsum([0] + [len(chunk) for chunk in label_chunks])
+    labels = StringArray.concatenate(label_chunks)
+    del label_chunks
+    name_labels, label_codes = labels.unique()
+    del labels
+    # each distinct name's folded form, taken from any chunk label it came from
+    representatives = np.empty(len(name_labels), dtype=np.intp)
+    representatives[label_codes] = np.arange(len(label_codes))
+    folded_labels = StringArray.concatenate(folded_chunks).take(representatives)
+    del folded_chunks, representatives
+    label_codes = label_codes.astype(np.int32)
+    name_codes = np.concatenate([label_codes[offset:][codes] for offset, codes in zip(offsets, code_chunks)])
+    return SamplingFrame(name_codes, name_labels, populations, schema, invalid_rows, folded_labels)
@@ -0,0 +1,247 @@
+# logic/tab3_replicates.py
+
+import atexit
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context, shared_memory
+import os
+import numpy as np
+import pandas as pd
+from logic.tab3_sampling import SAMPLING_METHODS, _certainty_units, _check_sample_size, pps_inclusion_probabilities
+
+# below this many replicate x PSU operations, starting worker processes costs more than it saves
+PARALLEL_MIN_WORK = 500_000_000
+
+# frame sizes attached from shared memory in each worker process
+_worker_state = {}
+
+def inclusion_probabilities(method, sizes, n):
+    """Return the design inclusion probability of every PSU for a sampling method."""
+    if method == 'pps':
+        return pps_inclusion_probabilities(sizes, n)
+    return np.full(len(sizes), n / len(sizes))
+
+def draw_replicates(method, sizes, n, replicates, rng):
+    """
+    Draw many independent samples from the same frame at once.
+
+    PPS and systematic draws only differ in their random start, so all replicates of a batch are located
+    with a single np.searchsorted / floor over a (replicates, n) matrix of selection points. Simple random
+    draws use one call to rng.choice per replicate.
+
+    Parameters
+    ----------
+    method : str
+        One of 'simple_random', 'systematic' or 'pps'.
+    sizes : numpy.ndarray of float64
+        The measure of size of each PSU.
+    n : int
+        The number of PSUs per sample.
+    replicates : int
+        The number of samples to draw.
+    rng : numpy.random.Generator
+        The random stream for this batch.
+
+    Returns
+    -------
+    numpy.ndarray of intp, shape (replicates, n)
+        The frame positions selected in each replicate.
+    """
+    n_units = len(sizes)
+    if method == 'pps':
+        _check_sample_size(sizes, n)
+        certainty, remaining, interval = _certainty_units(sizes, n)
+        selected = np.broadcast_to(np.flatnonzero(certainty), (replicates, n - remaining))
+        if remaining > 0:
+            cumulative = np.cumsum(np.where(certainty, 0.0, sizes))
+            points = rng.uniform(0, interval, size=(replicates, 1)) + interval * np.arange(remaining)
+            selected = np.hstack([selected, np.searchsorted(cumulative, points, side='right')])
+        return selected
+    elif method == 'systematic':
+        interval = n_units / n
+        points = rng.uniform(0, interval, size=(replicates, 1)) + interval * np.arange(n)
+        return np.minimum(np.floor(points).astype(np.intp), n_units - 1)
+    elif method == 'simple_random':
+        return np.vstack([rng.choice(n_units, size=n, replace=False) for _ in range(replicates)])
+    raise ValueError(f"Invalid sampling method provided. Must be one of {', '.join(SAMPLING_METHODS)}.")
+
+def _summarize_batch(method, sizes, probabilities, n, replicates, seed_sequence):
+    """Draw one batch of replicates and reduce it to sums that can be merged across batches."""
+    selected = draw_replicates(method, sizes, n, replicates, np.random.default_rng(seed_sequence))
+    weights = 1 / probabilities[selected]
+    totals = (sizes[selected] * weights).sum(axis=1)
+    return {
+        'counts': np.bincount(selected.ravel(), minlength=len(sizes)),
+        'weight_sum': weights.sum(),
+        'weight_sum_squares': (weights ** 2).sum(),
+        'weight_min': weights.min(),
+        'weight_max': weights.max(),
+        'totals': totals,
+    }
+
+def _attach_shared_sizes(name, length, method, n):
+    shm = shared_memory.SharedMemory(name=name)
+    sizes = np.ndarray((length,), dtype=np.float64, buffer=shm.buf)
+    _worker_state.update(shm=shm, sizes=sizes, probabilities=inclusion_probabilities(method, sizes, n))
+    atexit.register(_detach_shared_sizes)
+
+def _detach_shared_sizes():
+    # the arrays viewing the buffer must go before the segment can be closed
+    shm = _worker_state.pop('shm')
+    _worker_state.clear()
+    shm.close()
+
+def _summarize_shared_batch(method, n, replicates, seed_sequence):
+    return _summarize_batch(method, _worker_state['sizes'], _worker_state['probabilities'], n, replicates, seed_sequence)
+
+class ReplicateSummary:
+    """
+    Aggregated results of many replicate draws from one frame.
+
+    Attributes:
+        replicates (int): The number of samples drawn
+        inclusion_counts (numpy.ndarray of int64): How often each PSU was selected
+        expected_probabilities (numpy.ndarray of float64): The design inclusion probability of each PSU
+        weight_mean, weight_sd, weight_min, weight_max (float): Design weights (1 / inclusion probability) over all selections
+        total_mean, total_sd (float): Horvitz-Thompson estimates of the frame's total size across replicates
+    """
+
+    def __init__(self, replicates, inclusion_counts, expected_probabilities, weight_mean, weight_sd, weight_min, weight_max, total_mean, total_sd):
+        self.replicates = replicates
+        self.inclusion_counts = inclusion_counts
+        self.expected_probabilities = expected_probabilities
+        self.weight_mean = weight_mean
+        self.weight_sd = weight_sd
+        self.weight_min = weight_min
+        self.weight_max = weight_max
+        self.total_mean = total_mean
+        self.total_sd = total_sd
+
+    @property
+    def empirical_probabilities(self):
+        return self.inclusion_counts / self.replicates
+
+    @property
+    def max_probability_error(self):
+        """The largest absolute gap between empirical and design inclusion probabilities."""
+        return float(np.abs(self.empirical_probabilities - self.expected_probabilities).max())
+
+    def table(self, frame):
+        """Return one row per PSU with its design and empirical inclusion probabilities."""
+        return pd.DataFrame({
+            'psu_name': frame.names(slice(None)),
+            'population_size': frame.populations,
+            'expected_inclusion_probability': self.expected_probabilities,
+            'empirical_inclusion_probability': self.empirical_probabilities,
+            'times_selected': self.inclusion_counts,
+        })
+
+def simulate_replicate_draws(method, sizes, n, replicates, seed=None, workers=None, batch_size=500, progress=None):
+    """
+    Draw many replicate samples from a frame and aggregate inclusion and weight statistics.
+
+    Replicates are split into fixed batches. Every batch gets its own child of one SeedSequence, so results
+    are reproducible for a given seed regardless of how many workers run. With more than one worker the
+    batches run in a process pool that reads the frame sizes from shared memory instead of copying them to
+    every task. Only per-PSU counts and running sums are returned, never the individual samples.
+
+    Parameters
+    ----------
+    method : str
+        One of 'simple_random', 'systematic' or 'pps'.
+    sizes : array-like
+        The measure of size of each PSU in frame order.
+    n : int
+        The number of PSUs per sample.
+    replicates : int
+        The number of samples to draw.
+    seed : int or None, optional
+        Seed of the root SeedSequence.
+    workers : int or None, optional
+        The number of worker processes; 1 runs in this process. By default the CPU count is used when
+        replicates x PSUs exceeds PARALLEL_MIN_WORK, and 1 otherwise.
+    batch_size : int, optional
+        The number of replicates per batch (default is 500).
+    progress : callable or None, optional
+        Called as progress(replicates_done, replicates) after every batch.
+
+    Returns
+    -------
+    ReplicateSummary
+        The aggregated statistics.
+    """
+    if method not in SAMPLING_METHODS:
+        raise ValueError(f"Invalid sampling method provided. Must be one of {', '.join(SAMPLING_METHODS)}.")
+    if replicates < 1:
+        raise ValueError("Number of replicates must be at least 1.")
+    sizes = np.ascontiguousarray(sizes, dtype=np.float64)
+    probabilities = inclusion_probabilities(method, sizes, n)
+
+    batches = [min(batch_size, replicates - start) for start in range(0, replicates, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    if workers is None:
+        workers = (os.cpu_count() or 1) if replicates * len(sizes) > PARALLEL_MIN_WORK else 1
+    workers = min(workers, len(batches))
+
+    # running aggregates, updated as each batch finishes so that only one batch's counts are held at a time
+    inclusion_counts = np.zeros(len(sizes), dtype=np.int64)
+    weight_sum = weight_sum_squares = 0.0
+    weight_min, weight_max = np.inf, -np.inf
+    totals = [None] * len(batches)
+
+    def merge(index, result):
+        nonlocal weight_sum, weight_sum_squares, weight_min, weight_max
+        np.add(inclusion_counts, result['counts'], out=inclusion_counts)
+        weight_sum += result['weight_sum']
+        weight_sum_squares += result['weight_sum_squares']
+        weight_min = min(weight_min, result['weight_min'])
+        weight_max = max(weight_max, result['weight_max'])
+        totals[index] = result['totals']
+
+    done = 0
+    if workers == 1:
+        for index, (count, seed_sequence) in enumerate(zip(batches, seeds)):
+            merge(index, _summarize_batch(method, sizes, probabilities, n, count, seed_sequence))
+            done += count
+            if progress is not None:
+                progress(done, replicates)
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=max(sizes.nbytes, 1))
+        try:
+            np.ndarray(sizes.shape, dtype=np.float64, buffer=shm.buf)[:] = sizes
+            with ProcessPoolExecutor(workers, mp_context=get_context('spawn'), initializer=_attach_shared_sizes,
+                                     initargs=(shm.name, len(sizes), method, n)) as executor:
+                futures = {executor.submit(_summarize_shared_batch, method, n, count, seed_sequence): (index, count)
+                           for index, (count, seed_sequence) in enumerate(zip(batches, seeds))}
+                try:
+                    for future in as_completed(futures):
+                        # pop the finished future so that its result is released once merged
+                        index, count = futures.pop(future)
+                        merge(index, future.result())
+                        del future
+                        done += count
+                        if progress is not None:
+                            progress(done, replicates)
+                except BaseException:
+                    # e.g. cancellation raised from progress: drop batches that have not started
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            shm.close()
+            shm.unlink()
+
+    selections = replicates * n
+    weight_mean = weight_sum / selections
+    weight_variance = weight_sum_squares / selections - weight_mean ** 2
+    totals = np.concatenate(totals)
+    return ReplicateSummary(
+        replicates=replicates,
+        inclusion_counts=inclusion_counts,
+        expected_probabilities=probabilities,
+        weight_mean=weight_mean,
+        weight_sd=float(np.sqrt(max(weight_variance, 0.0))),
+        weight_min=weight_min,
+        weight_max=weight_max,
+        total_mean=float(totals.mean()),
+        total_sd=float(totals.std()),
+    )
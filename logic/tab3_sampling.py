@@ -0,0 +1,174 @@
+# logic/tab3_sampling.py
+
+import numpy as np
+import pandas as pd
+
+SAMPLING_METHODS = ('simple_random', 'systematic', 'pps')
+
+def _rng(seed):
+    """Return a NumPy Generator from a seed, an existing Generator or None."""
+    return seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+
+def _certainty_units(sizes, n):
+    """
+    Find the units that are selected with certainty under PPS selection of n units.
+
+    A unit whose size is at least the sampling interval would be hit more than once, so it is taken with
+    certainty and the interval is recomputed over the remaining units until no unit exceeds it.
+
+    Returns
+    -------
+    (numpy.ndarray of bool, int, float)
+        The certainty mask, the number of units still to select and the final sampling interval.
+    """
+    certainty = np.zeros(sizes.shape, dtype=bool)
+    remaining = n
+    interval = sizes.sum() / remaining
+    while remaining > 0:
+        new = ~certainty & (sizes > 0) & (sizes >= interval)
+        if not new.any():
+            break
+        certainty |= new
+        remaining = n - int(certainty.sum())
+        if remaining > 0:
+            interval = sizes[~certainty].sum() / remaining
+    return certainty, remaining, interval
+
+def _check_sample_size(sizes, n):
+    eligible = int(np.count_nonzero(sizes > 0))
+    if n < 1:
+        raise ValueError("Number of PSUs to sample must be at least 1.")
+    if n > eligible:
+        raise ValueError(f"Cannot sample {n} PSUs from a frame with {eligible} PSUs of non-zero size.")
+    if np.any(sizes < 0) or not np.all(np.isfinite(sizes)):
+        raise ValueError("PSU population sizes must be finite and not negative.")
+
+def pps_inclusion_probabilities(sizes, n):
+    """
+    Calculate the first-order inclusion probability of every PSU under PPS selection of n PSUs.
+
+    Parameters
+    ----------
+    sizes : array-like
+        The measure of size (e.g., population) of each PSU in frame order.
+    n : int
+        The number of PSUs to select.
+
+    Returns
+    -------
+    numpy.ndarray of float64
+        The inclusion probabilities; certainty PSUs have probability 1.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    _check_sample_size(sizes, n)
+    certainty, remaining, interval = _certainty_units(sizes, n)
+    probabilities = np.where(certainty, 1.0, 0.0)
+    if remaining > 0:
+        probabilities[~certainty] = sizes[~certainty] / interval
+    return probabilities
+
+def pps_systematic_sample(sizes, n, seed=None):
+    """
+    Select n PSUs with probability proportional to size using systematic selection.
+
+    Certainty PSUs (size at least the sampling interval) are taken first. The remaining PSUs are laid end to
+    end on a cumulative size scale in frame order, and the selection points start, start + I, start + 2I, ...
+    are located with a binary search, so the frame is never iterated row by row.
+
+    Parameters
+    ----------
+    sizes : array-like
+        The measure of size (e.g., population) of each PSU in frame order.
+    n : int
+        The number of PSUs to select.
+    seed : int, numpy.random.Generator or None, optional
+        Seed for a reproducible random start.
+
+    Returns
+    -------
+    (numpy.ndarray of intp, numpy.ndarray of bool)
+        The frame positions of the selected PSUs in frame order, and whether each was a certainty selection.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    _check_sample_size(sizes, n)
+    certainty, remaining, interval = _certainty_units(sizes, n)
+
+    selected = np.flatnonzero(certainty)
+    if remaining > 0:
+        cumulative = np.cumsum(np.where(certainty, 0.0, sizes))
+        points = _rng(seed).uniform(0, interval) + interval * np.arange(remaining)
+        systematic = np.searchsorted(cumulative, points, side='right')
+        selected = np.union1d(selected, systematic)
+
+    return selected, certainty[selected]
+
+def srs_sample(n_units, n, seed=None):
+    """Select n of n_units positions by simple random sampling without replacement, returned in frame order."""
+    if not 1 <= n <= n_units:
+        raise ValueError(f"Cannot sample {n} PSUs from a frame with {n_units} PSUs.")
+    return np.sort(_rng(seed).choice(n_units, size=n, replace=False))
+
+def systematic_sample(n_units, n, seed=None):
+    """Select n of n_units positions with equal probability by systematic sampling from a random start."""
+    if not 1 <= n <= n_units:
+        raise ValueError(f"Cannot sample {n} PSUs from a frame with {n_units} PSUs.")
+    interval = n_units / n
+    points = _rng(seed).uniform(0, interval) + interval * np.arange(n)
+    return np.minimum(np.floor(points).astype(np.intp), n_units - 1)
+
+def draw_sample(method, sizes, n, seed=None):
+    """
+    Draw a sample of PSUs from a frame.
+
+    Parameters
+    ----------
+    method : str
+        One of 'simple_random', 'systematic' (equal probability) or 'pps' (cluster sampling).
+    sizes : array-like
+        The measure of size of each PSU in frame order.
+    n : int
+        The number of PSUs to select.
+    seed : int, numpy.random.Generator or None, optional
+        Seed for reproducible selection.
+
+    Returns
+    -------
+    (numpy.ndarray of intp, numpy.ndarray of float64)
+        The frame positions of the selected PSUs and their inclusion probabilities.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    if method == 'pps':
+        selected, _ = pps_systematic_sample(sizes, n, seed)
+        return selected, pps_inclusion_probabilities(sizes, n)[selected]
+    elif method == 'simple_random':
+        selected = srs_sample(len(sizes), n, seed)
+    elif method == 'systematic':
+        selected = systematic_sample(len(sizes), n, seed)
+    else:
+        raise ValueError(f"Invalid sampling method provided. Must be one of {', '.join(SAMPLING_METHODS)}.")
+    return selected, np.full(len(selected), n / len(sizes))
+
+def sampling_results_table(frame, selected, probabilities):
+    """
+    Build the table of selected PSUs with their inclusion probabilities and design weights.
+
+    Parameters
+    ----------
+    frame : logic.tab3_frame.SamplingFrame
+        The frame the sample was drawn from.
+    selected : numpy.ndarray of intp
+        The frame positions of the selected PSUs.
+    probabilities : numpy.ndarray of float64
+        The inclusion probability of each selected PSU.
+
+    Returns
+    -------
+    pandas.DataFrame
+        One row per selected PSU in frame order.
+    """
+    return pd.DataFrame({
+        'psu_name': frame.names(selected),
+        'population_size': frame.populations[selected],
+        'inclusion_probability': probabilities,
+        'design_weight': 1 / probabilities,
+    })
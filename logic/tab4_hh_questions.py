@@ -0,0 +1,361 @@
+# logic/tab4_hh_questions.py
+#
+# The IPHRA household survey question bank. Each indicator lists its survey rows as
+# (type, name, label) or (type, name, label, {column: value}) and the indicators it
+# requires (e.g. anything per person needs the household roster). Choice lists are
+# shared between indicators. logic.tab4_xlsform compiles this into a QuestionBank.
+
+CHOICES = {
+    'yes_no': (('yes', 'Yes'), ('no', 'No')),
+    'yes_no_dk': (('yes', 'Yes'), ('no', 'No'), ('dk', "Don't know")),
+    'sex': (('male', 'Male'), ('female', 'Female')),
+    'death_cause': (
+        ('injury', 'Injury / trauma'),
+        ('violence', 'Violence'),
+        ('diarrhoea', 'Diarrhoea'),
+        ('fever', 'Fever / malaria'),
+        ('respiratory', 'Respiratory infection'),
+        ('measles', 'Measles'),
+        ('malnutrition', 'Malnutrition'),
+        ('maternal', 'Pregnancy or childbirth'),
+        ('other', 'Other'),
+        ('dk', "Don't know"),
+    ),
+    'death_location': (('here', 'In this location'), ('displacement', 'During displacement'), ('origin', 'In place of origin'), ('dk', "Don't know")),
+    'hhs_frequency': (('rarely', 'Rarely (1-2 times)'), ('sometimes', 'Sometimes (3-10 times)'), ('often', 'Often (more than 10 times)')),
+    'lcs_response': (
+        ('yes', 'Yes'),
+        ('no_not_needed', 'No, because we did not need to'),
+        ('no_exhausted', 'No, because we already used this strategy and cannot continue'),
+        ('not_applicable', 'Not applicable'),
+    ),
+    'water_source': (
+        ('piped', 'Piped water / public tap'),
+        ('borehole', 'Borehole / tube well'),
+        ('protected_well', 'Protected well or spring'),
+        ('rainwater', 'Rainwater collection'),
+        ('water_trucking', 'Tanker truck / water trucking'),
+        ('unprotected_well', 'Unprotected well or spring'),
+        ('surface', 'Surface water (river, lake, pond)'),
+        ('other', 'Other'),
+    ),
+    'water_treatment': (('none', 'No treatment'), ('boil', 'Boil'), ('chlorine', 'Chlorine / tablets'), ('filter', 'Filter'), ('other', 'Other')),
+    'latrine_type': (
+        ('flush', 'Flush or pour-flush toilet'),
+        ('pit_slab', 'Pit latrine with slab'),
+        ('vip', 'Ventilated improved pit latrine'),
+        ('pit_no_slab', 'Pit latrine without slab / open pit'),
+        ('bucket', 'Bucket / hanging toilet'),
+        ('open', 'No facility / open defecation'),
+        ('other', 'Other'),
+    ),
+    'handwashing_observed': (('water_soap', 'Water and soap'), ('water_only', 'Water only'), ('none', 'No water or soap'), ('not_observed', 'Not observed')),
+    'shelter_type': (
+        ('permanent', 'Permanent house / apartment'),
+        ('transitional', 'Transitional shelter'),
+        ('tent', 'Tent'),
+        ('makeshift', 'Makeshift shelter'),
+        ('collective', 'Collective centre'),
+        ('none', 'No shelter / open air'),
+    ),
+    'shelter_damage': (('none', 'No damage'), ('light', 'Light damage'), ('heavy', 'Heavy damage'), ('destroyed', 'Destroyed')),
+    'nfi_item': (
+        ('blanket', 'Blankets'),
+        ('sleeping_mat', 'Sleeping mats'),
+        ('cooking_set', 'Cooking set'),
+        ('jerrycan', 'Jerrycans'),
+        ('mosquito_net', 'Mosquito nets'),
+        ('lamp', 'Lamp or torch'),
+        ('none', 'None of these'),
+    ),
+    'care_location': (
+        ('public', 'Public hospital or health centre'),
+        ('private', 'Private clinic'),
+        ('ngo', 'NGO / mobile clinic'),
+        ('pharmacy', 'Pharmacy'),
+        ('traditional', 'Traditional healer'),
+        ('other', 'Other'),
+    ),
+    'care_barrier': (
+        ('cost', 'Cost of care or medicine'),
+        ('distance', 'Too far / no transport'),
+        ('security', 'Insecurity'),
+        ('closed', 'Facility closed or no staff'),
+        ('no_medicine', 'No medicine available'),
+        ('other', 'Other'),
+    ),
+    'vaccination_evidence': (('card', 'Yes, by card'), ('recall', 'Yes, by recall'), ('no', 'No'), ('dk', "Don't know")),
+}
+
+INDICATORS = (
+    {
+        'key': 'metadata',
+        'label': 'Survey Metadata and Consent',
+        'module': 'general',
+        'tags': ('consent', 'enumerator', 'cluster', 'psu'),
+        'survey': (
+            ('start', 'start', ''),
+            ('end', 'end', ''),
+            ('today', 'today', ''),
+            ('deviceid', 'deviceid', ''),
+            ('integer', 'team_id', 'Team number', {'required': 'yes', 'constraint': '. > 0'}),
+            ('integer', 'enum_id', 'Enumerator number', {'required': 'yes', 'constraint': '. > 0'}),
+            ('integer', 'cluster_id', 'Cluster / PSU number', {'required': 'yes', 'constraint': '. > 0'}),
+            ('integer', 'hh_id', 'Household number', {'required': 'yes', 'constraint': '. > 0'}),
+            ('select_one yes_no', 'consent', 'Does the respondent agree to take part in the survey?', {'required': 'yes'}),
+        ),
+    },
+    {
+        'key': 'hh_roster',
+        'label': 'Household Roster (Demographics)',
+        'module': 'general',
+        'tags': ('demographics', 'household size', 'age', 'sex', 'under 5'),
+        'requires': ('metadata',),
+        'survey': (
+            ('integer', 'hh_size', 'How many people usually live and eat in this household?',
+             {'required': 'yes', 'constraint': '. > 0 and . <= 40',
+              'constraint_message': 'Household size must be between 1 and 40.'}),
+            ('begin_repeat', 'roster', 'Household members', {'repeat_count': '${hh_size}'}),
+            ('text', 'member_name', 'First name of household member', {'required': 'yes'}),
+            ('select_one sex', 'member_sex', 'Sex of ${member_name}', {'required': 'yes'}),
+            ('integer', 'member_age_years', 'Age of ${member_name} in completed years', {'required': 'yes', 'constraint': '. >= 0 and . <= 110'}),
+            ('integer', 'member_age_months', 'Age of ${member_name} in completed months',
+             {'relevant': '${member_age_years} < 5', 'required': 'yes', 'constraint': '. >= 0 and . <= 59'}),
+            ('calculate', 'member_under5', '', {'calculation': 'if(${member_age_years} < 5, 1, 0)'}),
+            ('calculate', 'member_child_6_59', '', {'calculation': 'if(${member_age_months} >= 6 and ${member_age_months} <= 59, 1, 0)'}),
+            ('end_repeat', '', ''),
+            ('calculate', 'num_under5', '', {'calculation': 'sum(${member_under5})'}),
+            ('calculate', 'num_children_6_59', '', {'calculation': 'sum(${member_child_6_59})'}),
+        ),
+    },
+    {
+        'key': 'mortality',
+        'label': 'Retrospective Mortality',
+        'module': 'mortality',
+        'tags': ('cdr', 'u5dr', 'death rate', 'crude mortality'),
+        'requires': ('hh_roster',),
+        'survey': (
+            ('integer', 'num_left', 'How many people left the household since the start of the recall period?', {'constraint': '. >= 0'}),
+            ('integer', 'num_joined', 'How many people joined the household since the start of the recall period?', {'constraint': '. >= 0'}),
+            ('integer', 'num_births', 'How many babies were born in the household since the start of the recall period?', {'constraint': '. >= 0'}),
+            ('integer', 'num_deaths', 'How many household members died since the start of the recall period?', {'constraint': '. >= 0'}),
+            ('begin_repeat', 'deaths', 'Deceased household members', {'relevant': '${num_deaths} > 0', 'repeat_count': '${num_deaths}'}),
+            ('select_one sex', 'death_sex', 'Sex of the deceased', {'required': 'yes'}),
+            ('integer', 'death_age_years', 'Age at death in completed years', {'required': 'yes', 'constraint': '. >= 0 and . <= 110'}),
+            ('select_one death_cause', 'death_cause', 'What was the main cause of death?', {'required': 'yes'}),
+            ('select_one death_location', 'death_location', 'Where did the death happen?', {'required': 'yes'}),
+            ('calculate', 'death_under5', '', {'calculation': 'if(${death_age_years} < 5, 1, 0)'}),
+            ('end_repeat', '', ''),
+            ('calculate', 'deaths_under5', '', {'calculation': 'sum(${death_under5})'}),
+        ),
+    },
+    {
+        'key': 'fcs',
+        'label': 'Food Consumption Score (FCS)',
+        'module': 'fsl',
+        'tags': ('food security', 'diet', 'food groups'),
+        'requires': ('metadata',),
+        'survey': (
+            ('note', 'fcs_intro', 'In the past 7 days, on how many days did your household eat the following foods?'),
+            ('integer', 'fcs_cereals', 'Cereals, grains, roots and tubers', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'fcs_pulses', 'Pulses, beans, nuts and seeds', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'fcs_vegetables', 'Vegetables and leaves', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'fcs_fruit', 'Fruits', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'fcs_meat', 'Meat, fish and eggs', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'fcs_dairy', 'Milk and dairy products', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'fcs_sugar', 'Sugar and sweets', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'fcs_oil', 'Oil and fats', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('calculate', 'fcs', '', {'calculation': '${fcs_cereals} * 2 + ${fcs_pulses} * 3 + ${fcs_vegetables} + ${fcs_fruit} + '
+                                                     '${fcs_meat} * 4 + ${fcs_dairy} * 4 + ${fcs_sugar} * 0.5 + ${fcs_oil} * 0.5'}),
+        ),
+    },
+    {
+        'key': 'rcsi',
+        'label': 'Reduced Coping Strategies Index (rCSI)',
+        'module': 'fsl',
+        'tags': ('food security', 'coping'),
+        'requires': ('metadata',),
+        'survey': (
+            ('note', 'rcsi_intro', 'In the past 7 days, on how many days did your household have to do the following because there was not enough food?'),
+            ('integer', 'rcsi_less_preferred', 'Rely on less preferred or less expensive food', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'rcsi_borrow', 'Borrow food or rely on help from friends or relatives', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'rcsi_portion', 'Limit portion size at meal times', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'rcsi_adults', 'Restrict consumption by adults so small children can eat', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('integer', 'rcsi_meals', 'Reduce the number of meals eaten in a day', {'required': 'yes', 'constraint': '. >= 0 and . <= 7'}),
+            ('calculate', 'rcsi', '', {'calculation': '${rcsi_less_preferred} + ${rcsi_borrow} * 2 + ${rcsi_portion} + ${rcsi_adults} * 3 + ${rcsi_meals}'}),
+        ),
+    },
+    {
+        'key': 'hhs',
+        'label': 'Household Hunger Scale (HHS)',
+        'module': 'fsl',
+        'tags': ('food security', 'hunger'),
+        'requires': ('metadata',),
+        'survey': (
+            ('select_one yes_no', 'hhs_no_food', 'In the past 30 days, was there ever no food to eat of any kind in your house because of lack of resources?', {'required': 'yes'}),
+            ('select_one hhs_frequency', 'hhs_no_food_freq', 'How often did this happen?', {'required': 'yes', 'relevant': "${hhs_no_food} = 'yes'"}),
+            ('select_one yes_no', 'hhs_sleep_hungry', 'In the past 30 days, did any household member go to sleep at night hungry because there was not enough food?', {'required': 'yes'}),
+            ('select_one hhs_frequency', 'hhs_sleep_hungry_freq', 'How often did this happen?', {'required': 'yes', 'relevant': "${hhs_sleep_hungry} = 'yes'"}),
+            ('select_one yes_no', 'hhs_whole_day', 'In the past 30 days, did any household member go a whole day and night without eating anything because there was not enough food?', {'required': 'yes'}),
+            ('select_one hhs_frequency', 'hhs_whole_day_freq', 'How often did this happen?', {'required': 'yes', 'relevant': "${hhs_whole_day} = 'yes'"}),
+            ('calculate', 'hhs', '', {'calculation': "(if(${hhs_no_food_freq} = 'often', 2, if(${hhs_no_food} = 'yes', 1, 0))) + "
+                                                     "(if(${hhs_sleep_hungry_freq} = 'often', 2, if(${hhs_sleep_hungry} = 'yes', 1, 0))) + "
+                                                     "(if(${hhs_whole_day_freq} = 'often', 2, if(${hhs_whole_day} = 'yes', 1, 0)))"}),
+        ),
+    },
+    {
+        'key': 'lcs',
+        'label': 'Livelihood Coping Strategies (LCS)',
+        'module': 'fsl',
+        'tags': ('food security', 'livelihoods', 'coping'),
+        'requires': ('metadata',),
+        'survey': (
+            ('note', 'lcs_intro', 'In the past 30 days, did anyone in your household have to do the following because there was not enough food or money to buy food?'),
+            ('select_one lcs_response', 'lcs_sell_assets', 'Sell household assets or goods (radio, furniture, jewellery, etc.)', {'required': 'yes'}),
+            ('select_one lcs_response', 'lcs_spend_savings', 'Spend savings', {'required': 'yes'}),
+            ('select_one lcs_response', 'lcs_reduce_health', 'Reduce essential non-food expenses such as health or education', {'required': 'yes'}),
+            ('select_one lcs_response', 'lcs_sell_productive', 'Sell productive assets or means of transport', {'required': 'yes'}),
+            ('select_one lcs_response', 'lcs_child_work', 'Withdraw children from school to work', {'required': 'yes'}),
+            ('select_one lcs_response', 'lcs_sell_land', 'Sell house or land', {'required': 'yes'}),
+            ('select_one lcs_response', 'lcs_begging', 'Beg or rely on charity as the main source of food', {'required': 'yes'}),
+        ),
+    },
+    {
+        'key': 'water_source',
+        'label': 'Main Drinking Water Source',
+        'module': 'wash',
+        'tags': ('water', 'drinking water', 'improved source'),
+        'requires': ('metadata',),
+        'survey': (
+            ('select_one water_source', 'water_source', 'What is the main source of drinking water for your household?', {'required': 'yes'}),
+            ('text', 'water_source_other', 'Please specify the other water source', {'relevant': "${water_source} = 'other'"}),
+            ('integer', 'water_time', 'How many minutes does it take to go there, get water and come back?', {'required': 'yes', 'constraint': '. >= 0 and . <= 600'}),
+            ('select_one water_treatment', 'water_treatment', 'What does your household usually do to make drinking water safer?', {'required': 'yes'}),
+        ),
+    },
+    {
+        'key': 'water_quantity',
+        'label': 'Water Quantity per Person per Day',
+        'module': 'wash',
+        'tags': ('water', 'litres', 'lpd'),
+        'requires': ('hh_roster',),
+        'survey': (
+            ('integer', 'water_containers', 'How many containers of water did your household collect yesterday?', {'required': 'yes', 'constraint': '. >= 0 and . <= 100'}),
+            ('decimal', 'water_container_litres', 'What is the usual size of these containers in litres?', {'required': 'yes', 'relevant': '${water_containers} > 0', 'constraint': '. > 0 and . <= 250'}),
+            ('calculate', 'water_lpd', '', {'calculation': 'if(${hh_size} > 0, ${water_containers} * ${water_container_litres} div ${hh_size}, 0)'}),
+        ),
+    },
+    {
+        'key': 'sanitation',
+        'label': 'Sanitation Facility',
+        'module': 'wash',
+        'tags': ('latrine', 'toilet', 'open defecation'),
+        'requires': ('metadata',),
+        'survey': (
+            ('select_one latrine_type', 'latrine_type', 'What kind of toilet facility do members of your household usually use?', {'required': 'yes'}),
+            ('select_one yes_no', 'latrine_shared', 'Do you share this facility with other households?', {'required': 'yes', 'relevant': "${latrine_type} != 'open'"}),
+            ('integer', 'latrine_shared_hh', 'How many households use this facility, including yours?', {'relevant': "${latrine_shared} = 'yes'", 'constraint': '. >= 2'}),
+        ),
+    },
+    {
+        'key': 'handwashing',
+        'label': 'Handwashing Facility',
+        'module': 'wash',
+        'tags': ('hygiene', 'soap'),
+        'requires': ('metadata',),
+        'survey': (
+            ('select_one handwashing_observed', 'handwashing_observed', 'Can you show me where members of your household most often wash their hands? (Observe)', {'required': 'yes'}),
+            ('select_one yes_no', 'soap_available', 'Do you have soap in your household today?', {'required': 'yes'}),
+        ),
+    },
+    {
+        'key': 'shelter',
+        'label': 'Shelter Type and Condition',
+        'module': 'shelter',
+        'tags': ('housing', 'damage'),
+        'requires': ('metadata',),
+        'survey': (
+            ('select_one shelter_type', 'shelter_type', 'What type of shelter does your household live in?', {'required': 'yes'}),
+            ('select_one shelter_damage', 'shelter_damage', 'What is the condition of the shelter?', {'required': 'yes', 'relevant': "${shelter_type} != 'none'"}),
+            ('integer', 'shelter_rooms', 'How many rooms does your household use for sleeping?', {'relevant': "${shelter_type} != 'none'", 'constraint': '. >= 0 and . <= 20'}),
+        ),
+    },
+    {
+        'key': 'nfi',
+        'label': 'Essential Household Items',
+        'module': 'shelter',
+        'tags': ('non-food items', 'nfi', 'blankets'),
+        'requires': ('metadata',),
+        'survey': (
+            ('select_multiple nfi_item', 'nfi_owned', 'Which of these items does your household have in sufficient quantity?',
+             {'required': 'yes', 'constraint': "not(selected(., 'none') and count-selected(.) > 1)"}),
+        ),
+    },
+    {
+        'key': 'health_access',
+        'label': 'Illness and Access to Health Care',
+        'module': 'health',
+        'tags': ('morbidity', 'care seeking', 'barriers'),
+        'requires': ('hh_roster',),
+        'survey': (
+            ('select_one yes_no_dk', 'health_ill', 'In the past 2 weeks, was any household member sick or injured?', {'required': 'yes'}),
+            ('select_one yes_no', 'health_sought_care', 'Did they seek care?', {'required': 'yes', 'relevant': "${health_ill} = 'yes'"}),
+            ('select_one care_location', 'health_care_location', 'Where did they first seek care?', {'required': 'yes', 'relevant': "${health_sought_care} = 'yes'"}),
+            ('select_multiple care_barrier', 'health_barriers', 'Why did they not seek care, or what made it difficult?',
+             {'relevant': "${health_ill} = 'yes'"}),
+        ),
+    },
+    {
+        'key': 'measles_vaccination',
+        'label': 'Measles Vaccination Coverage (9-59 months)',
+        'module': 'health',
+        'tags': ('vaccination', 'immunization', 'epi', 'under 5'),
+        'requires': ('hh_roster',),
+        'survey': (
+            ('begin_repeat', 'measles', 'Measles vaccination', {'relevant': '${num_under5} > 0', 'repeat_count': '${num_under5}'}),
+            ('integer', 'measles_age_months', 'Age of the child in months', {'required': 'yes', 'constraint': '. >= 0 and . <= 59'}),
+            ('select_one vaccination_evidence', 'measles_vaccinated', 'Has this child ever received a measles vaccination?',
+             {'required': 'yes', 'relevant': '${measles_age_months} >= 9'}),
+            ('end_repeat', '', ''),
+        ),
+    },
+    {
+        'key': 'child_morbidity',
+        'label': 'Diarrhoea, Fever and Cough in Children Under 5',
+        'module': 'health',
+        'tags': ('diarrhoea', 'fever', 'ari', 'under 5'),
+        'requires': ('hh_roster',),
+        'survey': (
+            ('integer', 'u5_diarrhoea', 'How many children under 5 had diarrhoea in the past 2 weeks?',
+             {'relevant': '${num_under5} > 0', 'constraint': '. >= 0 and . <= ${num_under5}'}),
+            ('integer', 'u5_fever', 'How many children under 5 had fever in the past 2 weeks?',
+             {'relevant': '${num_under5} > 0', 'constraint': '. >= 0 and . <= ${num_under5}'}),
+            ('integer', 'u5_cough', 'How many children under 5 had a cough with fast or difficult breathing in the past 2 weeks?',
+             {'relevant': '${num_under5} > 0', 'constraint': '. >= 0 and . <= ${num_under5}'}),
+        ),
+    },
+    {
+        'key': 'muac',
+        'label': 'Child MUAC and Oedema (6-59 months)',
+        'module': 'nutrition',
+        'tags': ('malnutrition', 'gam', 'sam', 'oedema', 'anthropometry'),
+        'requires': ('hh_roster',),
+        'survey': (
+            ('begin_repeat', 'muac_children', 'Children 6-59 months', {'relevant': '${num_children_6_59} > 0', 'repeat_count': '${num_children_6_59}'}),
+            ('select_one sex', 'child_sex', 'Sex of the child', {'required': 'yes'}),
+            ('integer', 'child_age_months', 'Age of the child in months', {'required': 'yes', 'constraint': '. >= 6 and . <= 59'}),
+            ('select_one yes_no', 'child_oedema', 'Does the child have bilateral pitting oedema?', {'required': 'yes'}),
+            ('decimal', 'child_muac', 'MUAC measurement (mm)', {'required': 'yes', 'constraint': '. >= 75 and . <= 250',
+                                                                'constraint_message': 'MUAC must be between 75 and 250 mm.'}),
+            ('calculate', 'child_gam', '', {'calculation': "if(${child_muac} < 125 or ${child_oedema} = 'yes', 1, 0)"}),
+            ('calculate', 'child_sam', '', {'calculation': "if(${child_muac} < 115 or ${child_oedema} = 'yes', 1, 0)"}),
+            ('end_repeat', '', ''),
+        ),
+    },
+)
+
+# always included, whatever the user selects
+CORE_INDICATORS = ('metadata',)
+
+# every other indicator is only asked after consent
+GROUP_RELEVANT = "${consent} = 'yes'"
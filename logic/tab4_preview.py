@@ -0,0 +1,90 @@
+# logic/tab4_preview.py
+
+from logic.tab4_xlsform import SURVEY_COLUMNS
+
+_COLUMN = {column: i for i, column in enumerate(SURVEY_COLUMNS)}
+_OPENING_TYPES = {'begin_group': 'group', 'begin_repeat': 'repeat'}
+_CLOSING_TYPES = {'end_group': 'group', 'end_repeat': 'repeat'}
+# choices listed in a question's details before they are elided
+MAX_CHOICES_SHOWN = 8
+
+class PreviewNode:
+    """
+    One row of a form preview: a group, a repeat or a question.
+
+    Attributes:
+        kind (str): 'form', 'group', 'repeat' or 'question'
+        name (str): The survey name
+        label (str): The label shown to enumerators (the name for calculations)
+        type (str): The survey type, e.g. 'select_one yes_no'
+        details (str): Choices, calculation, constraint and relevance in one line
+        parent (PreviewNode or None): The enclosing group, repeat or form
+        row (int): Position among the parent's children
+        children (list of PreviewNode): The nested rows of a group or repeat
+    """
+
+    __slots__ = ('kind', 'name', 'label', 'type', 'details', 'parent', 'row', 'children')
+
+    def __init__(self, kind, name, label, type, details, parent):
+        self.kind = kind
+        self.name = name
+        self.label = label
+        self.type = type
+        self.details = details
+        self.parent = parent
+        self.row = len(parent.children) if parent is not None else 0
+        self.children = []
+
+    def __len__(self):
+        return len(self.children)
+
+def _details(row, choice_labels):
+    parts = []
+    type_parts = row[_COLUMN['type']].split()
+    if type_parts[0] in ('select_one', 'select_multiple') and len(type_parts) > 1:
+        labels = choice_labels.get(type_parts[1], [])
+        shown = ', '.join(labels[:MAX_CHOICES_SHOWN])
+        parts.append(f"Choices: {shown}, ... ({len(labels)})" if len(labels) > MAX_CHOICES_SHOWN else f"Choices: {shown}")
+    for column, prefix in (('calculation', '= '), ('constraint', 'Constraint: '), ('repeat_count', 'Repeats: '),
+                           ('relevant', 'Shown if ')):
+        if row[_COLUMN[column]]:
+            parts.append(prefix + row[_COLUMN[column]])
+    return '; '.join(parts)
+
+def build_preview(form):
+    """
+    Build the preview tree of a compiled form.
+
+    Works straight from the in-memory CompiledForm rows in a single pass, so no workbook is written or read.
+
+    Parameters
+    ----------
+    form : logic.tab4_xlsform.CompiledForm
+        The form to preview.
+
+    Returns
+    -------
+    PreviewNode
+        The root node (kind 'form'); its children are the form's top-level groups.
+    """
+    choice_labels = {}
+    for list_name, _, label in form.choices:
+        choice_labels.setdefault(list_name, []).append(label)
+
+    root = PreviewNode('form', '', '', '', '', None)
+    current = root
+    for row in form.survey:
+        row_type, name, label = row[_COLUMN['type']], row[_COLUMN['name']], row[_COLUMN['label']]
+        if row_type in _CLOSING_TYPES:
+            if current.kind != _CLOSING_TYPES[row_type]:
+                raise ValueError(f"Unexpected {row_type} inside {current.kind} {current.name!r}.")
+            current = current.parent
+            continue
+        kind = _OPENING_TYPES.get(row_type, 'question')
+        node = PreviewNode(kind, name, label or name, row_type, _details(row, choice_labels), current)
+        current.children.append(node)
+        if kind != 'question':
+            current = node
+    if current is not root:
+        raise ValueError(f"Unclosed {current.kind} {current.name!r}.")
+    return root
@@ -0,0 +1,65 @@
+# logic/tab4_search.py
+
+import re
+from bisect import bisect_left
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+def tokenize(text):
+    """Split text into lowercase alphanumeric tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+class IndicatorIndex:
+    """
+    An inverted index from words to the indicators of a question bank.
+
+    Indexed words come from each indicator's label, sector (module), tags and question labels. A query matches
+    the indicators containing every query word as a word prefix, so results narrow while the user types
+    ("wat qua" finds "Water Quantity per Person per Day"). Prefixes are found by binary search over the sorted
+    vocabulary, so a query never scans the indicators.
+
+    Parameters:
+        bank (logic.tab4_xlsform.QuestionBank): The bank to index
+    """
+
+    def __init__(self, bank):
+        self.keys = bank.keys
+        postings = {}
+        for position, key in enumerate(self.keys):
+            definition = bank.definition(key)
+            texts = [definition['label'], definition['module'], *definition.get('tags', ()),
+                     *(row[2] for row in definition['survey'])]
+            for token in set(tokenize(' '.join(texts))):
+                postings.setdefault(token, []).append(position)
+        self._vocabulary = sorted(postings)
+        self._postings = [np.array(postings[token], dtype=np.intp) for token in self._vocabulary]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _prefix_matches(self, prefix):
+        mask = np.zeros(len(self.keys), dtype=bool)
+        start = bisect_left(self._vocabulary, prefix)
+        for i in range(start, len(self._vocabulary)):
+            if not self._vocabulary[i].startswith(prefix):
+                break
+            mask[self._postings[i]] = True
+        return mask
+
+    def match(self, query):
+        """
+        Return a boolean mask over the bank's indicators (in bank order) of those matching query.
+
+        An empty query matches every indicator.
+        """
+        mask = np.ones(len(self.keys), dtype=bool)
+        for token in tokenize(query):
+            mask &= self._prefix_matches(token)
+            if not mask.any():
+                break
+        return mask
+
+    def search(self, query):
+        """Return the keys of the indicators matching query, in bank order."""
+        return [self.keys[i] for i in np.flatnonzero(self.match(query))]
@@ -0,0 +1,310 @@
+# logic/tab4_xlsform.py
+
+import re
+import threading
+from datetime import datetime
+from openpyxl import Workbook
+from logic import tab4_hh_questions
+
+SURVEY_COLUMNS = ('type', 'name', 'label', 'hint', 'required', 'relevant', 'constraint', 'constraint_message',
+                  'calculation', 'appearance', 'repeat_count', 'choice_filter')
+CHOICES_COLUMNS = ('list_name', 'name', 'label')
+SETTINGS_COLUMNS = ('form_title', 'form_id', 'version')
+
+REFERENCE_PATTERN = re.compile(r'\$\{(\w+)\}')
+# rows with these types close a group and have no name of their own
+CLOSING_TYPES = ('end_group', 'end_repeat')
+
+class CompiledIndicator:
+    """
+    One indicator of a question bank, ready to be written.
+
+    Attributes:
+        key (str): Unique identifier
+        label (str): Name shown to users
+        module (str): Sector, e.g. 'fsl' or 'wash'
+        closure (tuple of str): The keys of every indicator it needs, dependencies first, ending with its own key
+        survey (tuple of tuple): Its survey rows in SURVEY_COLUMNS order, wrapped in a group
+        list_names (tuple of str): The choice lists its questions use
+    """
+
+    def __init__(self, key, label, module, closure, survey, list_names):
+        self.key = key
+        self.label = label
+        self.module = module
+        self.closure = closure
+        self.survey = survey
+        self.list_names = list_names
+
+class CompiledForm:
+    """An assembled form: the indicators it contains and its survey and choices rows."""
+
+    def __init__(self, keys, survey, choices):
+        self.keys = keys
+        self.survey = survey
+        self.choices = choices
+
+    def write(self, path, form_title, form_id, version=None):
+        write_xlsform(self, path, form_title, form_id, version)
+
+def _survey_row(row):
+    row_type, name, label = row[:3]
+    extra = row[3] if len(row) > 3 else {}
+    unknown = set(extra) - set(SURVEY_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown survey columns for {name!r}: {', '.join(sorted(unknown))}.")
+    values = {'type': row_type, 'name': name, 'label': label, **extra}
+    return tuple(values.get(column, '') for column in SURVEY_COLUMNS)
+
+def _list_name(row_type):
+    parts = row_type.split()
+    if parts[0] in ('select_one', 'select_multiple') and len(parts) > 1:
+        return parts[1]
+    return None
+
+class FragmentCache:
+    """
+    Compiled indicator fragments, keyed by (bank name, indicator key).
+
+    One cache is shared by every tool builder, so a fragment is compiled the first time any form needs it
+    and reused afterwards; adding an indicator to a selection only compiles that indicator.
+    """
+
+    def __init__(self):
+        self._fragments = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, bank_name, key, compile_fragment):
+        """Return the cached fragment, compiling it with compile_fragment(key) on a miss."""
+        with self._lock:
+            fragment = self._fragments.get((bank_name, key))
+            if fragment is not None:
+                self.hits += 1
+                return fragment
+        fragment = compile_fragment(key)
+        with self._lock:
+            self.misses += 1
+            return self._fragments.setdefault((bank_name, key), fragment)
+
+    def __len__(self):
+        return len(self._fragments)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._fragments)}
+
+    def clear(self):
+        with self._lock:
+            self._fragments.clear()
+            self.hits = self.misses = 0
+
+FRAGMENT_CACHE = FragmentCache()
+
+class QuestionBank:
+    """
+    A question bank indexed by indicator key.
+
+    Construction checks that indicators and question names are unique and precomputes each indicator's
+    dependency closure and a topological order of the whole bank (every indicator after the ones it requires,
+    otherwise in bank order), with each closure kept as a bitset over that order. It also checks every
+    indicator's choice lists and that every ${name} reference is defined by the indicator or one of the
+    indicators it requires, so a broken bank fails when it is built. Each indicator's fragment
+    (CompiledIndicator) is compiled on first use and then kept in the fragment cache. Assembling a form is a
+    concatenation of fragments.
+
+    Parameters:
+        indicators (iterable of dict): Definitions with key, label, module, survey and optional requires and tags
+        choices (dict): list_name -> tuple of (name, label)
+        core (tuple of str): Indicators included in every form, first
+        group_relevant (str): Relevance condition of every non-core indicator group
+        name (str or None): Identifies the bank in a shared cache
+        cache (FragmentCache or None): Where fragments are kept; a private cache by default
+    """
+
+    def __init__(self, indicators, choices, core=(), group_relevant='', name=None, cache=None):
+        self._definitions = {}
+        for definition in indicators:
+            if definition['key'] in self._definitions:
+                raise ValueError(f"Duplicate indicator {definition['key']!r}.")
+            self._definitions[definition['key']] = definition
+        self.name = name
+        self.core = tuple(core)
+        self.group_relevant = group_relevant
+        self.choices = {list_name: tuple((list_name, value, label) for value, label in options) for list_name, options in choices.items()}
+        self._cache = cache if cache is not None else FragmentCache()
+
+        self._closures = {}
+        for key in self._definitions:
+            self._closure(key, self._definitions, ())
+        for key in self.core:
+            if key not in self._definitions:
+                raise ValueError(f"Unknown core indicator {key!r}.")
+        order = {}
+        for key in self._definitions:
+            for required in self._closures[key]:
+                order.setdefault(required, None)
+        self._order = tuple(order)
+        rank = {key: i for i, key in enumerate(self._order)}
+        self._closure_bits = {key: sum(1 << rank[required] for required in closure) for key, closure in self._closures.items()}
+        self._core_bits = 0
+        for key in self.core:
+            self._core_bits |= self._closure_bits[key]
+
+        self._owner = {}
+        for key, definition in self._definitions.items():
+            names = [row[1] for row in definition['survey'] if row[0] not in CLOSING_TYPES]
+            for name in names + [f'grp_{key}']:
+                if name in self._owner:
+                    raise ValueError(f"Question name {name!r} is used by both {self._owner[name]!r} and {key!r}.")
+                self._owner[name] = key
+        self._list_names = {key: self._validate(key) for key in self._definitions}
+
+    def _validate(self, key):
+        # returns the choice lists the indicator uses, in first-use order
+        closure = self._closures[key]
+        rows = [_survey_row(row) for row in self._definitions[key]['survey']]
+        for row in rows:
+            for name in REFERENCE_PATTERN.findall(' '.join(row)):
+                if self._owner.get(name) not in closure:
+                    raise ValueError(f"Indicator {key!r} refers to ${{{name}}}, which none of the indicators it requires define.")
+        list_names = tuple(dict.fromkeys(name for name in map(_list_name, (row[0] for row in rows)) if name))
+        missing = [name for name in list_names if name not in self.choices]
+        if missing:
+            raise ValueError(f"Indicator {key!r} uses undefined choice lists: {', '.join(missing)}.")
+        return list_names
+
+    def _compile(self, key):
+        definition = self._definitions[key]
+        rows = tuple(_survey_row(row) for row in definition['survey'])
+        relevant = '' if key in self.core else self.group_relevant
+        survey = ((_survey_row(('begin_group', f'grp_{key}', definition['label'], {'relevant': relevant})),)
+                  + rows + (_survey_row(('end_group', '', '')),))
+        return CompiledIndicator(key, definition['label'], definition['module'], self._closures[key], survey,
+                                 self._list_names[key])
+
+    def _closure(self, key, definitions, path):
+        if key in self._closures:
+            return self._closures[key]
+        if key not in definitions:
+            raise ValueError(f"Unknown indicator {key!r} required by {path[-1]!r}.")
+        if key in path:
+            raise ValueError(f"Circular indicator requirements: {' -> '.join(path + (key,))}.")
+        closure = []
+        for required in definitions[key].get('requires', ()):
+            closure.extend(k for k in self._closure(required, definitions, path + (key,)) if k not in closure)
+        closure.append(key)
+        self._closures[key] = tuple(closure)
+        return self._closures[key]
+
+    def __contains__(self, key):
+        return key in self._definitions
+
+    def __len__(self):
+        return len(self._definitions)
+
+    @property
+    def keys(self):
+        """All indicator keys in bank order."""
+        return list(self._definitions)
+
+    def indicator(self, key):
+        """Return the compiled fragment of one indicator."""
+        if key not in self._definitions:
+            raise ValueError(f"Unknown indicator {key!r}.")
+        return self._cache.get(self.name, key, self._compile)
+
+    def label(self, key):
+        return self._definitions[key]['label']
+
+    def definition(self, key):
+        """The indicator's definition as given to the bank (key, label, module, survey, requires, tags)."""
+        return self._definitions[key]
+
+    def closure(self, key):
+        """The keys of every indicator key needs, dependencies first, ending with key."""
+        if key not in self._closures:
+            raise ValueError(f"Unknown indicator {key!r}.")
+        return self._closures[key]
+
+    @property
+    def order(self):
+        """All indicator keys in the precomputed topological order."""
+        return list(self._order)
+
+    def expand(self, keys):
+        """
+        Return the core indicators, keys and every indicator they require, in the precomputed topological order.
+
+        Unlike resolve, the order of keys does not matter: the closures are unioned as bitsets and read back in
+        one pass over the order, so whole sets of indicators (e.g. template presets) resolve without any traversal.
+        """
+        bits = self._core_bits
+        for key in keys:
+            if key not in self._closure_bits:
+                raise ValueError(f"Unknown indicator {key!r}.")
+            bits |= self._closure_bits[key]
+        flags = bin(bits)[:1:-1]
+        return [key for key, flag in zip(self._order, flags) if flag == '1']
+
+    def compile_all(self):
+        """Compile every fragment, e.g. to fill the fragment cache ahead of exporting."""
+        return [self.indicator(key) for key in self._definitions]
+
+    def resolve(self, keys):
+        """
+        Return the core indicators, then keys in the given order with every required indicator inserted before
+        the first indicator that needs it. Duplicates are dropped.
+        """
+        resolved = {}
+        for key in self.core + tuple(keys):
+            for required in self.closure(key):
+                resolved.setdefault(required, None)
+        return list(resolved)
+
+    def compile_form(self, keys):
+        """
+        Assemble a form from the selected indicators (see resolve for ordering).
+
+        Returns
+        -------
+        CompiledForm
+            The resolved keys, the survey rows and the rows of every choice list used, in first-use order.
+        """
+        resolved = self.resolve(keys)
+        indicators = [self.indicator(key) for key in resolved]
+        survey = [row for indicator in indicators for row in indicator.survey]
+        list_names = dict.fromkeys(name for indicator in indicators for name in indicator.list_names)
+        choices = [row for name in list_names for row in self.choices[name]]
+        return CompiledForm(resolved, survey, choices)
+
+def write_xlsform(form, path, form_title, form_id, version=None):
+    """
+    Write a compiled form as an XLSForm workbook (survey, choices and settings sheets).
+
+    The workbook is created in openpyxl's write-only mode, so rows are streamed to the file instead of being
+    kept as cell objects.
+
+    Parameters
+    ----------
+    form : CompiledForm
+        The form to write.
+    path : str
+        The .xlsx file to create.
+    form_title, form_id : str
+        The settings sheet title and ID.
+    version : str or None, optional
+        The form version; defaults to the current time as yyyymmddHHMM.
+    """
+    workbook = Workbook(write_only=True)
+    for title, columns, rows in (('survey', SURVEY_COLUMNS, form.survey), ('choices', CHOICES_COLUMNS, form.choices),
+                                 ('settings', SETTINGS_COLUMNS, [(form_title, form_id, version or datetime.now().strftime('%Y%m%d%H%M'))])):
+        sheet = workbook.create_sheet(title)
+        sheet.append(columns)
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+
+HH_QUESTION_BANK = QuestionBank(tab4_hh_questions.INDICATORS, tab4_hh_questions.CHOICES,
+                                tab4_hh_questions.CORE_INDICATORS, tab4_hh_questions.GROUP_RELEVANT,
+                                name='hh', cache=FRAGMENT_CACHE)
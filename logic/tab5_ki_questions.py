@@ -0,0 +1,413 @@
+# logic/tab5_ki_questions.py
+#
+# Question banks of the IPHRA key informant and observation tools, in the same
+# format as logic.tab4_hh_questions. TOOLS maps a tool key to its form title,
+# form ID, indicators, choices and core indicators. Observation tools without an
+# indicator list in the UI are exported with all of their indicators.
+
+def _metadata(location_label, *rows, consent=True):
+    survey = (
+        ('start', 'start', ''),
+        ('end', 'end', ''),
+        ('today', 'today', ''),
+        ('deviceid', 'deviceid', ''),
+        ('integer', 'team_id', 'Team number', {'required': 'yes', 'constraint': '. > 0'}),
+        ('integer', 'enum_id', 'Enumerator number', {'required': 'yes', 'constraint': '. > 0'}),
+        ('text', 'location', location_label, {'required': 'yes'}),
+        ('geopoint', 'gps', 'GPS location', {'required': 'no'}),
+    ) + rows
+    if consent:
+        survey += (('select_one yes_no', 'consent', 'Does the key informant agree to be interviewed?', {'required': 'yes'}),)
+    return {'key': 'metadata', 'label': 'Interview Metadata' + (' and Consent' if consent else ''), 'module': 'general', 'survey': survey}
+
+YES_NO = {'yes_no': (('yes', 'Yes'), ('no', 'No')), 'yes_no_dk': (('yes', 'Yes'), ('no', 'No'), ('dk', "Don't know"))}
+CONSENT_RELEVANT = "${consent} = 'yes'"
+
+COMMUNITY_KI = {
+    'title': 'IPHRA Community Key Informant Interview',
+    'form_id': 'iphra_community_ki',
+    'core': ('metadata',),
+    'group_relevant': CONSENT_RELEVANT,
+    'choices': {
+        **YES_NO,
+        'ki_role': (('leader', 'Community leader'), ('elder', 'Elder'), ('religious', 'Religious leader'),
+                    ('health_worker', 'Community health worker'), ('teacher', 'Teacher'), ('other', 'Other')),
+        'population_trend': (('increase', 'Increased'), ('same', 'About the same'), ('decrease', 'Decreased'), ('dk', "Don't know")),
+        'distance': (('lt_30', 'Less than 30 minutes'), ('30_60', '30 minutes to 1 hour'), ('1_3', '1 to 3 hours'),
+                     ('gt_3', 'More than 3 hours'), ('none', 'No access')),
+        'priority_need': (('food', 'Food'), ('water', 'Drinking water'), ('health', 'Health care'), ('shelter', 'Shelter'),
+                          ('sanitation', 'Sanitation'), ('protection', 'Protection / safety'), ('livelihoods', 'Livelihoods'),
+                          ('education', 'Education')),
+        'safety_concern': (('none', 'No major concerns'), ('armed_conflict', 'Armed conflict'), ('crime', 'Crime / theft'),
+                           ('gbv', 'Gender-based violence'), ('eviction', 'Eviction'), ('landmines', 'Landmines / UXO'), ('other', 'Other')),
+    },
+    'indicators': (
+        _metadata('Community / site name',
+                  ('select_one ki_role', 'ki_role', 'What is your role in the community?', {'required': 'yes'})),
+        {
+            'key': 'population_movement',
+            'label': 'Population and Displacement',
+            'module': 'general',
+            'requires': ('metadata',),
+            'survey': (
+                ('integer', 'pop_households', 'About how many households live in this community now?', {'constraint': '. >= 0'}),
+                ('select_one population_trend', 'pop_trend', 'Compared to 3 months ago, has the population increased, decreased or stayed the same?', {'required': 'yes'}),
+                ('select_one yes_no_dk', 'pop_new_arrivals', 'Have displaced people arrived in the past 30 days?', {'required': 'yes'}),
+                ('integer', 'pop_new_arrivals_hh', 'About how many households arrived?', {'relevant': "${pop_new_arrivals} = 'yes'", 'constraint': '. >= 0'}),
+            ),
+        },
+        {
+            'key': 'service_access',
+            'label': 'Access to Basic Services',
+            'module': 'general',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one distance', 'access_health', 'How long does it take most people to walk to the nearest functioning health facility?', {'required': 'yes'}),
+                ('select_one distance', 'access_market', 'How long does it take most people to walk to the nearest functioning market?', {'required': 'yes'}),
+                ('select_one distance', 'access_water', 'How long does it take most people to walk to their main water point?', {'required': 'yes'}),
+                ('select_one yes_no_dk', 'access_school', 'Is there a functioning primary school within walking distance?', {'required': 'yes'}),
+            ),
+        },
+        {
+            'key': 'community_food_security',
+            'label': 'Food Security Situation',
+            'module': 'fsl',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one yes_no_dk', 'food_shortage', 'In the past 30 days, have most households in this community had difficulty getting enough food?', {'required': 'yes'}),
+                ('select_one yes_no_dk', 'food_assistance', 'Has food assistance been distributed in this community in the past 30 days?', {'required': 'yes'}),
+            ),
+        },
+        {
+            'key': 'community_health',
+            'label': 'Disease Outbreaks and Deaths',
+            'module': 'health',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one yes_no_dk', 'health_outbreak', 'In the past 30 days, have many people had the same illness at the same time (e.g. diarrhoea, measles, fever)?', {'required': 'yes'}),
+                ('text', 'health_outbreak_desc', 'Please describe the illness and how many people are affected', {'relevant': "${health_outbreak} = 'yes'"}),
+                ('select_one yes_no_dk', 'health_unusual_deaths', 'In the past 30 days, have there been more deaths than usual in this community?', {'required': 'yes'}),
+            ),
+        },
+        {
+            'key': 'safety',
+            'label': 'Safety and Protection',
+            'module': 'protection',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_multiple safety_concern', 'safety_concerns', 'What are the main safety concerns for people in this community?',
+                 {'required': 'yes', 'constraint': "not(selected(., 'none') and count-selected(.) > 1)"}),
+            ),
+        },
+        {
+            'key': 'priority_needs',
+            'label': 'Priority Needs',
+            'module': 'general',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one priority_need', 'need_first', 'What is the most important need of this community now?', {'required': 'yes'}),
+                ('select_one priority_need', 'need_second', 'What is the second most important need?', {'required': 'yes', 'choice_filter': 'name != ${need_first}'}),
+            ),
+        },
+    ),
+}
+
+FSL_KI = {
+    'title': 'IPHRA FSL Provider Key Informant Interview',
+    'form_id': 'iphra_fsl_ki',
+    'core': ('metadata',),
+    'group_relevant': CONSENT_RELEVANT,
+    'choices': {
+        **YES_NO,
+        'trader_type': (('wholesaler', 'Wholesaler'), ('retailer', 'Retailer'), ('producer', 'Producer / farmer'), ('other', 'Other')),
+        'availability': (('available', 'Widely available'), ('limited', 'Limited'), ('unavailable', 'Not available')),
+        'price_trend': (('increase', 'Increased'), ('same', 'About the same'), ('decrease', 'Decreased'), ('dk', "Don't know")),
+        'supply_constraint': (('none', 'No constraints'), ('roads', 'Roads / transport'), ('insecurity', 'Insecurity'), ('fuel', 'Fuel prices'),
+                              ('credit', 'Lack of credit / cash'), ('border', 'Border or checkpoint closures'), ('other', 'Other')),
+    },
+    'indicators': (
+        _metadata('Market name',
+                  ('select_one trader_type', 'trader_type', 'What type of trader are you?', {'required': 'yes'})),
+        {
+            'key': 'market_functionality',
+            'label': 'Market Functionality',
+            'module': 'fsl',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one yes_no', 'market_open', 'Has the market been open every usual market day in the past 30 days?', {'required': 'yes'}),
+                ('integer', 'market_traders', 'About how many traders are selling in the market today?', {'constraint': '. >= 0'}),
+            ),
+        },
+        {
+            'key': 'staple_availability',
+            'label': 'Availability of Staple Foods',
+            'module': 'fsl',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one availability', 'avail_cereal', 'Availability of the main cereal', {'required': 'yes'}),
+                ('select_one availability', 'avail_pulses', 'Availability of pulses / beans', {'required': 'yes'}),
+                ('select_one availability', 'avail_oil', 'Availability of cooking oil', {'required': 'yes'}),
+            ),
+        },
+        {
+            'key': 'staple_prices',
+            'label': 'Staple Food Prices',
+            'module': 'fsl',
+            'requires': ('staple_availability',),
+            'survey': (
+                ('decimal', 'price_cereal', 'Price of 1 kg of the main cereal today', {'relevant': "${avail_cereal} != 'unavailable'", 'constraint': '. > 0'}),
+                ('select_one price_trend', 'price_cereal_trend', 'Compared to 1 month ago, has this price changed?', {'relevant': "${avail_cereal} != 'unavailable'"}),
+                ('decimal', 'price_pulses', 'Price of 1 kg of pulses / beans today', {'relevant': "${avail_pulses} != 'unavailable'", 'constraint': '. > 0'}),
+                ('decimal', 'price_oil', 'Price of 1 litre of cooking oil today', {'relevant': "${avail_oil} != 'unavailable'", 'constraint': '. > 0'}),
+            ),
+        },
+        {
+            'key': 'supply_chain',
+            'label': 'Supply Constraints',
+            'module': 'fsl',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_multiple supply_constraint', 'supply_constraints', 'What has made it difficult to restock in the past 30 days?',
+                 {'required': 'yes', 'constraint': "not(selected(., 'none') and count-selected(.) > 1)"}),
+                ('integer', 'supply_restock_days', 'How many days does it take to restock the main cereal?', {'constraint': '. >= 0'}),
+            ),
+        },
+    ),
+}
+
+HEALTH_KI = {
+    'title': 'IPHRA Health Service Provider Key Informant Interview',
+    'form_id': 'iphra_health_ki',
+    'core': ('metadata',),
+    'group_relevant': CONSENT_RELEVANT,
+    'choices': {
+        **YES_NO,
+        'facility_type': (('hospital', 'Hospital'), ('health_centre', 'Health centre'), ('health_post', 'Health post'),
+                          ('mobile', 'Mobile clinic'), ('other', 'Other')),
+        'ki_position': (('doctor', 'Doctor'), ('nurse', 'Nurse'), ('midwife', 'Midwife'), ('clinical_officer', 'Clinical officer'),
+                        ('manager', 'Facility manager'), ('other', 'Other')),
+        'health_service': (('opd', 'Outpatient consultations'), ('imci', 'Integrated management of childhood illness'),
+                           ('epi', 'Routine immunization'), ('anc', 'Antenatal care'), ('delivery', 'Skilled delivery'),
+                           ('cmam', 'Malnutrition treatment'), ('mhpss', 'Mental health support'), ('referral', 'Referral / ambulance')),
+        'stock_item': (('ors', 'ORS / zinc'), ('antibiotics', 'Amoxicillin'), ('antimalarials', 'Antimalarials'),
+                       ('rutf', 'RUTF'), ('vaccines', 'Vaccines'), ('none', 'None of these')),
+        'disease': (('awd', 'Acute watery diarrhoea / cholera'), ('measles', 'Measles'), ('malaria', 'Malaria'),
+                    ('ari', 'Acute respiratory infection'), ('malnutrition', 'Acute malnutrition'), ('other', 'Other')),
+    },
+    'indicators': (
+        _metadata('Health facility name',
+                  ('select_one facility_type', 'facility_type', 'Type of health facility', {'required': 'yes'}),
+                  ('select_one ki_position', 'ki_position', 'Position of the key informant', {'required': 'yes'})),
+        {
+            'key': 'services_available',
+            'label': 'Services Available',
+            'module': 'health',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_multiple health_service', 'services_available', 'Which of these services does the facility provide now?', {'required': 'yes'}),
+                ('select_one yes_no', 'services_24h', 'Is the facility open 24 hours a day?', {'required': 'yes'}),
+            ),
+        },
+        {
+            'key': 'staffing',
+            'label': 'Health Staff',
+            'module': 'health',
+            'requires': ('metadata',),
+            'survey': (
+                ('integer', 'staff_qualified', 'How many qualified health workers (doctors, nurses, midwives) work here now?', {'required': 'yes', 'constraint': '. >= 0'}),
+                ('select_one yes_no', 'staff_paid', 'Have staff been paid in the past month?', {'required': 'yes'}),
+            ),
+        },
+        {
+            'key': 'stockouts',
+            'label': 'Essential Medicine Stock-outs',
+            'module': 'health',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_multiple stock_item', 'stockouts', 'Which of these items have been out of stock in the past 30 days?',
+                 {'required': 'yes', 'constraint': "not(selected(., 'none') and count-selected(.) > 1)"}),
+            ),
+        },
+        {
+            'key': 'caseload',
+            'label': 'Consultations and Disease Trends',
+            'module': 'health',
+            'requires': ('metadata',),
+            'survey': (
+                ('integer', 'consultations_week', 'How many outpatient consultations were there in the past 7 days?', {'constraint': '. >= 0'}),
+                ('select_multiple disease', 'diseases_increasing', 'Which diseases have increased in the past 30 days?'),
+                ('select_one yes_no', 'surveillance_reporting', 'Does the facility report cases to a disease surveillance system?', {'required': 'yes'}),
+            ),
+        },
+    ),
+}
+
+HEALTH_OBS = {
+    'title': 'IPHRA Health Facility Observation',
+    'form_id': 'iphra_health_obs',
+    'core': ('metadata',),
+    'group_relevant': '',
+    'choices': {
+        **YES_NO,
+        'power_source': (('grid', 'Electricity grid'), ('generator', 'Generator'), ('solar', 'Solar'), ('none', 'None')),
+        'water_availability': (('piped', 'Piped water on site'), ('storage', 'Water stored on site'), ('none', 'No water on site')),
+        'waste_disposal': (('incinerator', 'Incinerator'), ('pit', 'Burning / burial pit'), ('open', 'Open dumping'), ('none', 'No disposal')),
+    },
+    'indicators': (
+        _metadata('Health facility name', consent=False),
+        {
+            'key': 'infrastructure',
+            'label': 'Building and Power',
+            'module': 'health',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one yes_no', 'building_damaged', 'Is the building visibly damaged?', {'required': 'yes'}),
+                ('select_one power_source', 'power_source', 'Main source of power', {'required': 'yes'}),
+                ('integer', 'inpatient_beds', 'Number of inpatient beds', {'constraint': '. >= 0'}),
+            ),
+        },
+        {
+            'key': 'facility_wash',
+            'label': 'Water, Sanitation and Infection Control',
+            'module': 'wash',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one water_availability', 'facility_water', 'Water available at the facility', {'required': 'yes'}),
+                ('select_one yes_no', 'facility_latrines', 'Are there functioning latrines for patients?', {'required': 'yes'}),
+                ('select_one yes_no', 'facility_handwashing', 'Is there soap and water at the points of care?', {'required': 'yes'}),
+                ('select_one waste_disposal', 'waste_disposal', 'How is medical waste disposed of?', {'required': 'yes'}),
+            ),
+        },
+        {
+            'key': 'cold_chain',
+            'label': 'Vaccine Cold Chain',
+            'module': 'health',
+            'requires': ('infrastructure',),
+            'survey': (
+                ('select_one yes_no', 'fridge_present', 'Is there a vaccine refrigerator?', {'required': 'yes'}),
+                ('decimal', 'fridge_temperature', 'Refrigerator temperature (degrees C)',
+                 {'relevant': "${fridge_present} = 'yes' and ${power_source} != 'none'", 'constraint': '. >= -30 and . <= 40'}),
+                ('select_one yes_no', 'fridge_log', 'Is a temperature log kept up to date?', {'relevant': "${fridge_present} = 'yes'"}),
+            ),
+        },
+        {
+            'key': 'nutrition_supplies',
+            'label': 'Nutrition Screening Equipment',
+            'module': 'nutrition',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one yes_no', 'muac_tapes', 'Are MUAC tapes available?', {'required': 'yes'}),
+                ('select_one yes_no', 'scales', 'Is a working scale for children available?', {'required': 'yes'}),
+                ('select_one yes_no', 'height_board', 'Is a height / length board available?', {'required': 'yes'}),
+            ),
+        },
+    ),
+}
+
+COMMUNITY_OBS = {
+    'title': 'IPHRA Community Observation',
+    'form_id': 'iphra_community_obs',
+    'core': ('metadata', 'settlement', 'environment'),
+    'group_relevant': '',
+    'choices': {
+        **YES_NO,
+        'settlement_type': (('village', 'Village / town'), ('camp', 'Planned camp'), ('informal', 'Informal settlement'),
+                            ('collective', 'Collective centre'), ('host', 'Host community')),
+        'density': (('low', 'Low'), ('medium', 'Medium'), ('high', 'High / overcrowded')),
+    },
+    'indicators': (
+        _metadata('Community / site name', consent=False),
+        {
+            'key': 'settlement',
+            'label': 'Settlement',
+            'module': 'shelter',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one settlement_type', 'settlement_type', 'Type of settlement', {'required': 'yes'}),
+                ('select_one density', 'settlement_density', 'How crowded is the settlement?', {'required': 'yes'}),
+                ('select_one yes_no', 'makeshift_shelters', 'Are there many makeshift shelters or tents?', {'required': 'yes'}),
+            ),
+        },
+        {
+            'key': 'environment',
+            'label': 'Environmental Health',
+            'module': 'wash',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one yes_no', 'open_defecation', 'Is there visible open defecation?', {'required': 'yes'}),
+                ('select_one yes_no', 'solid_waste', 'Is there uncollected solid waste?', {'required': 'yes'}),
+                ('select_one yes_no', 'stagnant_water', 'Is there stagnant water near shelters?', {'required': 'yes'}),
+            ),
+        },
+    ),
+}
+
+LATRINE_OBS = {
+    'title': 'IPHRA Latrine Observation',
+    'form_id': 'iphra_latrine_obs',
+    'core': ('metadata', 'latrine_condition'),
+    'group_relevant': '',
+    'choices': {
+        **YES_NO,
+        'latrine_kind': (('flush', 'Flush / pour-flush'), ('pit_slab', 'Pit latrine with slab'), ('vip', 'VIP latrine'),
+                         ('pit_no_slab', 'Pit latrine without slab'), ('trench', 'Trench latrine')),
+        'cleanliness': (('clean', 'Clean'), ('somewhat', 'Somewhat dirty'), ('dirty', 'Very dirty / faeces visible')),
+    },
+    'indicators': (
+        _metadata('Site name', consent=False),
+        {
+            'key': 'latrine_condition',
+            'label': 'Latrine Condition',
+            'module': 'wash',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one latrine_kind', 'latrine_kind', 'Type of latrine', {'required': 'yes'}),
+                ('select_one yes_no', 'latrine_functional', 'Is the latrine functional?', {'required': 'yes'}),
+                ('select_one cleanliness', 'latrine_clean', 'How clean is the latrine?', {'required': 'yes', 'relevant': "${latrine_functional} = 'yes'"}),
+                ('select_one yes_no', 'latrine_lock', 'Does the door lock from the inside?', {'required': 'yes'}),
+                ('select_one yes_no', 'latrine_light', 'Is the latrine lit at night?', {'required': 'yes'}),
+                ('select_one yes_no', 'latrine_gender', 'Are there separate latrines for men and women?', {'required': 'yes'}),
+                ('select_one yes_no', 'latrine_handwashing', 'Is there a handwashing station with water and soap nearby?', {'required': 'yes'}),
+            ),
+        },
+    ),
+}
+
+WATERPOINT_OBS = {
+    'title': 'IPHRA Water Point Observation',
+    'form_id': 'iphra_waterpoint_obs',
+    'core': ('metadata', 'waterpoint_condition'),
+    'group_relevant': '',
+    'choices': {
+        **YES_NO,
+        'waterpoint_type': (('tapstand', 'Tap stand'), ('handpump', 'Hand pump'), ('protected_well', 'Protected well'),
+                            ('tank', 'Storage tank / bladder'), ('unprotected', 'Unprotected well or spring'), ('surface', 'Surface water')),
+    },
+    'indicators': (
+        _metadata('Site name', consent=False),
+        {
+            'key': 'waterpoint_condition',
+            'label': 'Water Point Condition',
+            'module': 'wash',
+            'requires': ('metadata',),
+            'survey': (
+                ('select_one waterpoint_type', 'waterpoint_type', 'Type of water point', {'required': 'yes'}),
+                ('select_one yes_no', 'waterpoint_functional', 'Is water flowing / available now?', {'required': 'yes'}),
+                ('integer', 'waterpoint_queue', 'Number of people waiting in line', {'constraint': '. >= 0'}),
+                ('decimal', 'waterpoint_frc', 'Free residual chlorine (mg/L)',
+                 {'relevant': "${waterpoint_functional} = 'yes'", 'constraint': '. >= 0 and . <= 5'}),
+                ('select_one yes_no', 'waterpoint_drainage', 'Is there standing water or poor drainage around the water point?', {'required': 'yes'}),
+            ),
+        },
+    ),
+}
+
+TOOLS = {
+    'communityki': COMMUNITY_KI,
+    'fslki': FSL_KI,
+    'healthki': HEALTH_KI,
+    'healthobs': HEALTH_OBS,
+    'communityobs': COMMUNITY_OBS,
+    'latrineobs': LATRINE_OBS,
+    'waterpointobs': WATERPOINT_OBS,
+}
@@ -0,0 +1,88 @@
+# logic/tab5_ki_tools.py
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logic.tab4_xlsform import FRAGMENT_CACHE, QuestionBank
+from logic.tab5_ki_questions import TOOLS
+
+KI_TOOL_BANKS = {
+    tool: QuestionBank(spec['indicators'], spec['choices'], spec['core'], spec['group_relevant'], name=tool, cache=FRAGMENT_CACHE)
+    for tool, spec in TOOLS.items()
+}
+
+# the builders with indicator lists; the other tools are always exported with every indicator
+KI_TOOL_LISTS = ('communityki', 'fslki', 'healthki', 'healthobs')
+
+def _bank(tool):
+    if tool not in KI_TOOL_BANKS:
+        raise ValueError(f"Invalid tool provided. Must be one of {', '.join(KI_TOOL_BANKS)}.")
+    return KI_TOOL_BANKS[tool]
+
+def compile_tool(tool, keys=None):
+    """
+    Assemble a KI or observation tool from its cached indicator fragments.
+
+    Parameters
+    ----------
+    tool : str
+        A key of logic.tab5_ki_questions.TOOLS, e.g. 'communityki'.
+    keys : list of str or None, optional
+        The selected indicators in order; None selects every indicator of the tool.
+
+    Returns
+    -------
+    logic.tab4_xlsform.CompiledForm
+        The assembled form.
+    """
+    bank = _bank(tool)
+    return bank.compile_form(bank.keys if keys is None else keys)
+
+def export_tool(tool, path, keys=None, version=None):
+    """Compile a tool and write it as an XLSForm to path."""
+    form = compile_tool(tool, keys)
+    form.write(path, TOOLS[tool]['title'], TOOLS[tool]['form_id'], version)
+    return path
+
+def export_tools(selections, directory, workers=None, version=None, progress=None):
+    """
+    Write several tools at once, one <form_id>.xlsx per tool in directory.
+
+    Each tool is compiled and written by its own worker thread. Fragments come from the shared cache, so a
+    batch mostly costs the workbook writing, whose zip compression runs outside the GIL.
+
+    Parameters
+    ----------
+    selections : dict
+        tool -> list of selected indicator keys, or None for every indicator.
+    directory : str
+        The folder to write to.
+    workers : int or None, optional
+        The number of threads (default: one per tool, up to the CPU count).
+    version : str or None, optional
+        The form version written to every tool.
+    progress : callable or None, optional
+        Called as progress(tools_done, tools) after every tool.
+
+    Returns
+    -------
+    dict
+        tool -> path of the written file, in the order of selections.
+    """
+    for tool in selections:
+        _bank(tool)
+    paths = {tool: os.path.join(directory, f"{TOOLS[tool]['form_id']}.xlsx") for tool in selections}
+    workers = workers or min(len(selections), os.cpu_count() or 1) or 1
+    done = 0
+    with ThreadPoolExecutor(workers) as executor:
+        futures = [executor.submit(export_tool, tool, paths[tool], keys, version) for tool, keys in selections.items()]
+        try:
+            for future in as_completed(futures):
+                future.result()
+                done += 1
+                if progress is not None:
+                    progress(done, len(futures))
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return paths
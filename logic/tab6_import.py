@@ -0,0 +1,427 @@
+# logic/tab6_import.py
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from datetime import date, datetime
+from xml.etree import ElementTree
+import numpy as np
+from openpyxl import load_workbook
+from logic.strings import StringArray
+
+COLUMN_KINDS = ('number', 'datetime', 'category')
+# cells parsed before a chunk is converted to typed arrays; bounds the Python objects alive at once
+CHUNK_CELLS = 1_000_000
+HASH_BLOCK_SIZE = 1024 * 1024
+CACHE_FORMAT_VERSION = 1
+SPREADSHEET_NAMESPACE = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.iphra_app', 'import_cache')
+# disk space the import cache may use before the least recently used entries are deleted
+DEFAULT_CACHE_BYTES = 2 * 1024 ** 3
+
+_NUMBER_TYPES = (int, float, bool)
+_DATETIME_TYPES = (datetime, date)
+
+class SurveyColumn:
+    """
+    One typed column of an imported sheet.
+
+    Attributes:
+        kind (str): 'number' (float64, NaN if blank), 'datetime' (datetime64[s], NaT if blank) or
+            'category' (integer codes into labels, -1 if blank)
+        values (numpy.ndarray): The numbers, datetimes or codes
+        labels (StringArray or None): The sorted distinct values of a category column
+    """
+
+    def __init__(self, kind, values, labels=None):
+        if kind not in COLUMN_KINDS:
+            raise ValueError(f"Invalid column kind provided. Must be one of {', '.join(COLUMN_KINDS)}.")
+        self.kind = kind
+        self.values = values
+        self.labels = labels
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + (self.labels.nbytes if self.labels is not None else 0)
+
+    def missing(self):
+        """Return a boolean mask of the blank cells."""
+        if self.kind == 'number':
+            return np.isnan(self.values)
+        if self.kind == 'datetime':
+            return np.isnat(self.values)
+        return self.values < 0
+
+    def text(self, rows):
+        """Return the cells at rows (a slice or an index array) formatted as a list of str; blank cells are ''."""
+        values = self.values[rows]
+        if self.kind == 'category':
+            return ['' if code < 0 else self.labels[code] for code in values.tolist()]
+        if self.kind == 'datetime':
+            return ['' if np.isnat(value) else str(value).replace('T', ' ') for value in values]
+        return ['' if value != value else _format_number(value) for value in values.tolist()]
+
+    def take(self, rows):
+        """Return a new column with the cells at rows (an index array); position -1 gives a blank cell."""
+        rows = np.asarray(rows, dtype=np.intp)
+        blank = {'number': np.nan, 'datetime': np.datetime64('NaT', 's'), 'category': -1}[self.kind]
+        values = np.where(rows >= 0, self.values[np.maximum(rows, 0)] if len(self.values) else blank, blank)
+        return SurveyColumn(self.kind, values.astype(self.values.dtype), self.labels)
+
+class SurveyData:
+    """
+    An imported sheet: typed columns of equal length in sheet order.
+
+    Parameters:
+        columns (dict): column name -> SurveyColumn
+        rows (int): The number of data rows
+        sheet (str or None): The sheet the data came from
+    """
+
+    def __init__(self, columns, rows, sheet=None):
+        self.columns = columns
+        self.rows = rows
+        self.sheet = sheet
+
+    def __len__(self):
+        return self.rows
+
+    @property
+    def names(self):
+        return list(self.columns)
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+    def column(self, name):
+        if name not in self.columns:
+            raise ValueError(f"Column {name!r} not found in sheet {self.sheet!r}.")
+        return self.columns[name]
+
+def _format_number(value):
+    return str(int(value)) if value.is_integer() and abs(value) < 1e15 else f"{value:.10g}"
+
+def _text(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, float):
+        return _format_number(value)
+    if isinstance(value, _DATETIME_TYPES):
+        return str(np.datetime64(value, 's')).replace('T', ' ')
+    return str(value)
+
+class _ColumnBuilder:
+    # Converts one column chunk by chunk. A chunk of only numbers or only datetimes is stored typed; any other
+    # chunk is encoded against the column's shared label dictionary. If chunks disagree, the column becomes a
+    # category column when it is finished.
+
+    def __init__(self):
+        self.chunks = []
+        self.index = {}
+
+    def _code(self, value):
+        return self.index.setdefault(value, len(self.index))
+
+    def _encode(self, values):
+        return np.fromiter((-1 if v is None else self._code(v if type(v) is str else _text(v)) for v in values),
+                           dtype=np.int32, count=len(values))
+
+    def append(self, values):
+        types = set(map(type, values))
+        if str in types and '' in values:
+            values = [None if v == '' else v for v in values]
+            types = set(map(type, values))
+        types.discard(type(None))
+        if not types:
+            self.chunks.append(('empty', len(values)))
+        elif all(issubclass(t, _NUMBER_TYPES) for t in types):
+            self.chunks.append(('number', np.fromiter((np.nan if v is None else v for v in values), dtype=np.float64,
+                                                      count=len(values))))
+        elif all(issubclass(t, _DATETIME_TYPES) for t in types):
+            self.chunks.append(('datetime', np.array(values, dtype='datetime64[s]')))
+        else:
+            self.chunks.append(('category', self._encode(values)))
+
+    def finish(self):
+        kinds = {kind for kind, _ in self.chunks} - {'empty'}
+        kind = kinds.pop() if len(kinds) == 1 else 'category'
+        arrays = []
+        for chunk_kind, chunk in self.chunks:
+            if chunk_kind == 'empty':
+                arrays.append(np.full(chunk, {'number': np.nan, 'datetime': np.datetime64('NaT', 's'), 'category': -1}[kind],
+                                      dtype={'number': np.float64, 'datetime': 'datetime64[s]', 'category': np.int32}[kind]))
+            elif chunk_kind == kind:
+                arrays.append(chunk)
+            elif chunk_kind == 'number':
+                arrays.append(self._encode([None if v != v else v for v in chunk.tolist()]))
+            else:
+                arrays.append(self._encode([None if np.isnat(v) else str(v).replace('T', ' ') for v in chunk]))
+        self.chunks = None
+        values = np.concatenate(arrays) if arrays else np.empty(0, dtype=np.float64 if kind == 'number' else np.int32)
+        if kind != 'category':
+            return SurveyColumn(kind, values)
+        # sort the labels so that ordering codes orders values
+        labels = list(self.index)
+        order = sorted(range(len(labels)), key=labels.__getitem__)
+        remap = np.empty(len(labels) + 1, dtype=np.int32)
+        remap[np.array(order, dtype=np.intp)] = np.arange(len(labels), dtype=np.int32)
+        remap[-1] = -1
+        codes = remap[values].astype(np.min_scalar_type(-max(len(labels), 1)))
+        return SurveyColumn('category', codes, StringArray.from_strings([labels[i] for i in order]))
+
+def list_sheets(path):
+    """
+    Return the sheet names of an Excel workbook without loading any cells.
+
+    Only the workbook part of the .xlsx package is parsed; the sheets and the shared strings, which openpyxl
+    reads even in read-only mode, are not touched.
+    """
+    try:
+        with zipfile.ZipFile(path) as package:
+            with package.open('xl/workbook.xml') as f:
+                return [element.get('name') for _, element in ElementTree.iterparse(f)
+                        if element.tag == f'{{{SPREADSHEET_NAMESPACE}}}sheet']
+    except (zipfile.BadZipFile, KeyError):
+        raise ValueError(f"{os.path.basename(path)} is not an Excel (.xlsx) workbook.") from None
+
+def _unique_names(header):
+    names, seen = [], set()
+    for i, name in enumerate(header):
+        name = _text(name).strip() if name is not None else ''
+        name = name or f'column_{i + 1}'
+        base, n = name, 1
+        while name in seen:
+            name = f'{base}.{n}'
+            n += 1
+        seen.add(name)
+        names.append(name)
+    return names
+
+def read_sheet(path, sheet, chunk_cells=CHUNK_CELLS, progress=None):
+    """
+    Stream one sheet of an Excel workbook into typed columns.
+
+    The sheet is read row by row in openpyxl's read-only mode. Rows are gathered into chunks of about
+    chunk_cells cells, and each chunk is converted to numpy arrays before the next is read, so only one chunk
+    of Python cell values exists at a time. Text columns are stored as integer codes into their distinct
+    values. The first row is the header; blank rows are skipped.
+
+    Parameters
+    ----------
+    path : str
+        The .xlsx file.
+    sheet : str
+        The sheet name.
+    chunk_cells : int, optional
+        The number of cells converted at a time (default is 1,000,000).
+    progress : callable or None, optional
+        Called as progress(rows_read, total_rows) after every chunk; total_rows is the sheet's declared size.
+
+    Returns
+    -------
+    SurveyData
+        The typed sheet.
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet not in workbook.sheetnames:
+            raise ValueError(f"Sheet {sheet!r} not found. Sheets are: {', '.join(workbook.sheetnames)}.")
+        worksheet = workbook[sheet]
+        total_rows = max((worksheet.max_row or 1) - 1, 0)
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return SurveyData({}, 0, sheet)
+        names = _unique_names(header)
+        width = len(names)
+        builders = [_ColumnBuilder() for _ in names]
+        chunk_rows = max(chunk_cells // max(width, 1), 1)
+
+        count = 0
+        chunk = []
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            if len(row) != width:
+                row = (tuple(row) + (None,) * width)[:width]
+            chunk.append(row)
+            if len(chunk) == chunk_rows:
+                for builder, values in zip(builders, zip(*chunk)):
+                    builder.append(values)
+                count += len(chunk)
+                chunk = []
+                if progress is not None:
+                    progress(count, max(total_rows, count))
+        if chunk:
+            for builder, values in zip(builders, zip(*chunk)):
+                builder.append(values)
+            count += len(chunk)
+            del chunk
+        if progress is not None:
+            progress(count, count)
+    finally:
+        workbook.close()
+    return SurveyData({name: builder.finish() for name, builder in zip(names, builders)}, count, sheet)
+
+def file_hash(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+class ImportCache:
+    """
+    Imported sheets saved as numpy files, keyed by the source file's content hash and the sheet name.
+
+    Each entry is a directory holding meta.json and one .npy file per array. Loading memory-maps the arrays,
+    so reopening a large sheet reads only the pages that are used. Entries are written to a temporary
+    directory and renamed into place, so a crash never leaves a partial entry.
+
+    The cache holds at most max_bytes: every store deletes the least recently used entries (by directory
+    mtime, which load refreshes) until it fits again, so daily re-imports of a growing export do not fill
+    the disk. Entries of the file being stored are never deleted.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIRECTORY, max_bytes=DEFAULT_CACHE_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def key(self, path, sheet, digest=None):
+        sheet_digest = hashlib.sha256(sheet.encode('utf-8')).hexdigest()[:16]
+        return f"v{CACHE_FORMAT_VERSION}_{digest or file_hash(path)}_{sheet_digest}"
+
+    def _entry(self, key):
+        return os.path.join(self.directory, key)
+
+    def load(self, path, sheet, digest=None):
+        """Return the cached SurveyData of a sheet, memory-mapped, or None if it is not cached."""
+        entry = self._entry(self.key(path, sheet, digest))
+        try:
+            with open(os.path.join(entry, 'meta.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        try:
+            # mark the entry as recently used
+            os.utime(entry)
+        except OSError:
+            pass
+
+        def array(name):
+            return np.load(os.path.join(entry, name), mmap_mode='r')
+
+        columns = {}
+        for i, (name, kind) in enumerate(meta['columns']):
+            labels = StringArray(array(f'{i}_labels.npy'), array(f'{i}_offsets.npy')) if kind == 'category' else None
+            columns[name] = SurveyColumn(kind, array(f'{i}.npy'), labels)
+        return SurveyData(columns, meta['rows'], meta['sheet'])
+
+    def store(self, path, sheet, data, digest=None):
+        """Save data as the cached import of sheet in path, then prune the cache to max_bytes."""
+        digest = digest or file_hash(path)
+        entry = self._entry(self.key(path, sheet, digest))
+        os.makedirs(self.directory, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=self.directory)
+        try:
+            for i, column in enumerate(data.columns.values()):
+                np.save(os.path.join(staging, f'{i}.npy'), column.values)
+                if column.labels is not None:
+                    np.save(os.path.join(staging, f'{i}_labels.npy'), column.labels.data)
+                    np.save(os.path.join(staging, f'{i}_offsets.npy'), column.labels.offsets)
+            meta = {'sheet': data.sheet, 'rows': data.rows, 'columns': [(name, column.kind) for name, column in data.columns.items()]}
+            with open(os.path.join(staging, 'meta.json'), 'w', encoding='utf-8') as f:
+                json.dump(meta, f)
+            try:
+                os.replace(staging, entry)
+            except OSError:
+                # another import stored the same entry first
+                shutil.rmtree(staging, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        self.prune(keep=digest)
+
+    def prune(self, keep=None):
+        """
+        Delete the least recently used entries until the cache holds at most max_bytes.
+
+        Parameters
+        ----------
+        keep : str or None, optional
+            The content hash of a file whose entries are never deleted.
+
+        Returns
+        -------
+        int
+            The number of entries deleted.
+        """
+        kept_prefix = None if keep is None else f"v{CACHE_FORMAT_VERSION}_{keep}_"
+        entries = []
+        try:
+            for item in os.scandir(self.directory):
+                # staging directories from tempfile.mkdtemp do not start with 'v'
+                if not (item.name.startswith('v') and item.is_dir()):
+                    continue
+                try:
+                    size = sum(f.stat().st_size for f in os.scandir(item.path) if f.is_file())
+                    entries.append((item.stat().st_mtime, size, item.name))
+                except FileNotFoundError:
+                    # deleted by a concurrent prune
+                    continue
+        except FileNotFoundError:
+            return 0
+
+        total = sum(size for _, size, _ in entries)
+        deleted = 0
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if kept_prefix is not None and name.startswith(kept_prefix):
+                continue
+            shutil.rmtree(self._entry(name), ignore_errors=True)
+            total -= size
+            deleted += 1
+        return deleted
+
+    def clear(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+def import_sheet(path, sheet, cache=None, progress=None):
+    """
+    Import one sheet, from the cache when the same file contents were imported before.
+
+    Parameters
+    ----------
+    path : str
+        The .xlsx file.
+    sheet : str
+        The sheet name.
+    cache : ImportCache or None, optional
+        Where imports are cached; None always reads the workbook.
+    progress : callable or None, optional
+        Called as progress(rows_read, total_rows) while the workbook is read.
+
+    Returns
+    -------
+    SurveyData
+        The typed sheet, memory-mapped from the cache.
+    """
+    if cache is None:
+        return read_sheet(path, sheet, progress=progress)
+    digest = file_hash(path)
+    data = cache.load(path, sheet, digest)
+    if data is None:
+        cache.store(path, sheet, read_sheet(path, sheet, progress=progress), digest)
+        data = cache.load(path, sheet, digest)
+    return data
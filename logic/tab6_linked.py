@@ -0,0 +1,191 @@
+# logic/tab6_linked.py
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+import os
+import numpy as np
+import pandas as pd
+from logic.tab6_import import file_hash, list_sheets, read_sheet
+
+INDEX_COLUMN = '_index'
+PARENT_INDEX_COLUMN = '_parent_index'
+PARENT_TABLE_COLUMN = '_parent_table_name'
+# below this file size, starting worker processes costs more than reading the sheets one by one
+PARALLEL_MIN_BYTES = 2 * 1024 * 1024
+
+def _keys(column, as_text=False):
+    if column.kind == 'number' and not as_text:
+        return column.values
+    return np.array([text or None for text in column.text(slice(None))], dtype=object)
+
+class LinkedSurvey:
+    """
+    The sheets of one survey export, with every repeat sheet linked to its parent rows.
+
+    Kobo exports the main (household) records in one sheet and each repeat group (household roster, deaths,
+    MUAC children) in its own sheet, where _parent_index refers to the _index of the parent row. Linking
+    builds one hash index per parent sheet and looks up all the child keys in a single pass, so each join
+    is O(n); afterwards any repeat row finds its parent or household row by array indexing.
+
+    Parameters:
+        tables (dict): sheet name -> logic.tab6_import.SurveyData, in workbook order
+
+    Attributes:
+        tables (dict): sheet name -> SurveyData
+        main (str): The sheet of the main records: the first with an _index but no _parent_index column
+        linked (bool): Whether there is such a sheet; otherwise the first sheet is the main one and no sheet is
+            linked, so the sheets can still be viewed
+        parents (dict): repeat sheet -> parent sheet, from _parent_table_name when it names a sheet; the
+            named sheet must be the main sheet or itself a repeat
+        parent_rows (dict): repeat sheet -> int64 array of the parent row of each row, -1 if it has none
+    """
+
+    def __init__(self, tables):
+        if not tables:
+            raise ValueError("The survey has no sheets.")
+        self.tables = tables
+        mains = [sheet for sheet, data in tables.items() if INDEX_COLUMN in data.columns and PARENT_INDEX_COLUMN not in data.columns]
+        self.linked = bool(mains)
+        self.main = mains[0] if mains else next(iter(tables))
+        self.parents = {}
+        self.parent_rows = {}
+        if not self.linked:
+            return
+
+        for sheet, data in tables.items():
+            if PARENT_INDEX_COLUMN not in data.columns:
+                continue
+            parent = self.main
+            if PARENT_TABLE_COLUMN in data.columns:
+                names = [name for name in data.columns[PARENT_TABLE_COLUMN].text(slice(0, 1)) if name]
+                if names and names[0] in tables and names[0] != sheet and INDEX_COLUMN in tables[names[0]].columns:
+                    # only the main sheet or another repeat leads on to a household
+                    if names[0] != self.main and PARENT_INDEX_COLUMN not in tables[names[0]].columns:
+                        raise ValueError(f"Sheet {sheet!r} names {names[0]!r} as its parent, which is neither "
+                                         f"{self.main!r} nor a repeat sheet.")
+                    parent = names[0]
+            self.parents[sheet] = parent
+
+        indexes = {}
+        for sheet, parent in self.parents.items():
+            parent_keys = tables[parent].columns[INDEX_COLUMN]
+            child_keys = tables[sheet].columns[PARENT_INDEX_COLUMN]
+            as_text = parent_keys.kind != child_keys.kind
+            if (parent, as_text) not in indexes:
+                index = pd.Index(_keys(parent_keys, as_text))
+                if not index.is_unique:
+                    raise ValueError(f"Sheet {parent!r} has duplicate {INDEX_COLUMN} values.")
+                indexes[parent, as_text] = index
+            self.parent_rows[sheet] = indexes[parent, as_text].get_indexer(_keys(child_keys, as_text)).astype(np.int64)
+
+    def __len__(self):
+        return len(self.tables[self.main])
+
+    @property
+    def repeats(self):
+        return list(self.parents)
+
+    def table(self, sheet):
+        if sheet not in self.tables:
+            raise ValueError(f"Sheet {sheet!r} not found. Sheets are: {', '.join(self.tables)}.")
+        return self.tables[sheet]
+
+    def household_rows(self, sheet):
+        """Return the main-sheet row of each row of sheet (-1 if unlinked), following nested repeats."""
+        if sheet == self.main:
+            return np.arange(len(self), dtype=np.int64)
+        if sheet not in self.parents:
+            raise ValueError(f"Sheet {sheet!r} is not linked to {self.main!r}.")
+        rows = self.parent_rows[sheet]
+        seen = {sheet}
+        while self.parents[sheet] != self.main:
+            sheet = self.parents[sheet]
+            if sheet in seen:
+                raise ValueError(f"Sheets {', '.join(sorted(seen))} are their own parents.")
+            seen.add(sheet)
+            rows = np.where(rows >= 0, self.parent_rows[sheet][np.maximum(rows, 0)], -1)
+        return rows
+
+    def child_counts(self, sheet):
+        """Return, for each row of sheet's parent sheet, how many rows of sheet belong to it."""
+        rows = self.parent_rows[sheet]
+        return np.bincount(rows[rows >= 0], minlength=len(self.tables[self.parents[sheet]]))
+
+    def orphans(self, sheet):
+        """The number of rows of sheet whose _parent_index matches no parent row."""
+        return int((self.parent_rows[sheet] < 0).sum())
+
+    def join(self, sheet, column):
+        """Return a main-sheet column aligned to the rows of sheet (blank where a row is unlinked)."""
+        return self.tables[self.main].column(column).take(self.household_rows(sheet))
+
+def _cache_sheet(path, sheet, cache, digest):
+    if cache.load(path, sheet, digest) is None:
+        cache.store(path, sheet, read_sheet(path, sheet), digest)
+
+def import_workbook(path, cache=None, workers=None, progress=None):
+    """
+    Import every sheet of a survey export in parallel and link the repeat sheets to their parents.
+
+    Each sheet is read by its own worker process. With a cache, workers store their sheets in it and the
+    results are memory-mapped back from it, so no data is copied between processes.
+
+    Parameters
+    ----------
+    path : str
+        The .xlsx file.
+    cache : logic.tab6_import.ImportCache or None, optional
+        Where imports are cached; sheets already cached are not read again.
+    workers : int or None, optional
+        The number of processes (default: one per sheet, up to the CPU count, for files over 2 MiB).
+    progress : callable or None, optional
+        Called as progress(sheets_done, sheets) after every sheet.
+
+    Returns
+    -------
+    LinkedSurvey
+        The linked sheets.
+    """
+    sheets = list_sheets(path)
+    digest = file_hash(path) if cache is not None else None
+    if cache is not None:
+        pending = [sheet for sheet in sheets if cache.load(path, sheet, digest) is None]
+    else:
+        pending = list(sheets)
+    if workers is None:
+        workers = (os.cpu_count() or 1) if os.path.getsize(path) > PARALLEL_MIN_BYTES else 1
+    workers = min(workers, max(len(pending), 1))
+
+    tables = {}
+    done = len(sheets) - len(pending)
+    if workers == 1:
+        for sheet in pending:
+            if cache is not None:
+                _cache_sheet(path, sheet, cache, digest)
+            else:
+                tables[sheet] = read_sheet(path, sheet)
+            done += 1
+            if progress is not None:
+                progress(done, len(sheets))
+    else:
+        with ProcessPoolExecutor(workers, mp_context=get_context('spawn')) as executor:
+            if cache is not None:
+                futures = {executor.submit(_cache_sheet, path, sheet, cache, digest): sheet for sheet in pending}
+            else:
+                futures = {executor.submit(read_sheet, path, sheet): sheet for sheet in pending}
+            try:
+                for future in as_completed(futures):
+                    data = future.result()
+                    if data is not None:
+                        tables[futures[future]] = data
+                    done += 1
+                    if progress is not None:
+                        progress(done, len(sheets))
+            except BaseException:
+                # e.g. cancellation raised from progress: drop sheets that have not started
+                for future in futures:
+                    future.cancel()
+                raise
+    if cache is not None:
+        tables = {sheet: cache.load(path, sheet, digest) for sheet in sheets}
+    return LinkedSurvey({sheet: tables[sheet] for sheet in sheets})
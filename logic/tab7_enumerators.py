@@ -0,0 +1,238 @@
+# logic/tab7_enumerators.py
+
+import weakref
+import numpy as np
+import pandas as pd
+from logic.tab7_quality import QUALITY_SECTORS, SheetColumns, find_repeat_sheet
+
+# the main-sheet columns quality flags can be broken down by
+GROUP_COLUMNS = ('enum_id', 'team_id')
+# the indicator whose spread is compared between enumerators, per sector: (level, column)
+KEY_INDICATORS = {
+    'general': (None, 'hh_size'),
+    'fsl': (None, 'fcs'),
+    'wash': (None, 'water_lpd'),
+    'shelter': (None, 'shelter_rooms'),
+    'health': (None, 'u5_fever'),
+    'nutrition': ('muac_children', 'child_age_months'),
+    'muac': ('muac_children', 'child_muac'),
+    'mortality': (None, 'num_deaths'),
+}
+# measurements whose last digit should be uniform: age heaping and MUAC rounding
+DIGIT_PREFERENCE = {
+    'general': ('roster', 'member_age_years'),
+    'muac': ('muac_children', 'child_muac'),
+}
+# survey -> {sheet: SheetColumns}, so redrawing the summaries does not decode the measurements again
+_SHEET_COLUMNS = weakref.WeakKeyDictionary()
+
+class GroupIndex:
+    """
+    Households encoded by enumerator or team.
+
+    Parameters:
+        survey (logic.tab6_linked.LinkedSurvey): The imported survey
+        column (str): The main-sheet column identifying the group, e.g. 'enum_id'
+
+    Attributes:
+        column (str): The grouping column
+        labels (list of str): The distinct IDs, in sorted order
+        codes (numpy.ndarray): The position in labels of each household's ID, -1 where it is blank
+    """
+
+    def __init__(self, survey, column):
+        values = SheetColumns(survey, survey.main).column(column)
+        if values is None:
+            raise ValueError(f"Column {column!r} not found in sheet {survey.main!r}.")
+        self.survey = survey
+        self.column = column
+        self._rows = {}
+        self._order = {}
+        self.codes = np.full(len(values.values), -1, dtype=np.int64)
+        rows = np.flatnonzero(~values.missing())
+        # hashing encodes in one pass and only the distinct IDs are sorted
+        codes, distinct = pd.factorize(np.asarray(values.values)[rows], sort=True)
+        self.codes[rows] = codes
+        first = np.empty(len(distinct), dtype=np.int64)
+        first[codes[::-1]] = rows[::-1]
+        self.labels = values.text(first)
+
+    def __len__(self):
+        return len(self.labels)
+
+    def rows(self, sheet):
+        """The group code of each row of sheet, through its household."""
+        if sheet not in self._rows:
+            households = self.survey.household_rows(sheet)
+            self._rows[sheet] = np.where(households >= 0, self.codes[np.maximum(households, 0)], -1)
+        return self._rows[sheet]
+
+    def reduce(self, sheet, matrix):
+        """
+        Sum the rows of matrix (one row per row of sheet) within each group.
+
+        The rows are sorted by group once per sheet and reused for every matrix of that sheet.
+        Returns an int64 array of shape (groups, columns).
+        """
+        if sheet not in self._order:
+            self._order[sheet] = _group_order(self.rows(sheet), len(self))
+        return _reduce(self._order[sheet], matrix, len(self))
+
+def _group_order(codes, groups):
+    # unlinked rows (-1) sort first and are left out
+    order = np.argsort(codes, kind='stable')[np.count_nonzero(codes < 0):]
+    counts = np.bincount(codes[order], minlength=groups)
+    return order, (np.cumsum(counts) - counts)[counts > 0], counts > 0
+
+def _reduce(group_order, matrix, groups):
+    order, starts, present = group_order
+    sums = np.zeros((groups, matrix.shape[1]), dtype=np.int64)
+    if len(starts):
+        # take() copies whole rows, much faster than fancy indexing for narrow matrices
+        sums[present] = np.add.reduceat(np.take(matrix, order, axis=0), starts, axis=0, dtype=np.int64)
+    return sums
+
+def group_sums(codes, matrix, groups):
+    """
+    Sum the rows of matrix within each group with one bincount per column.
+
+    Unlike GroupIndex.reduce this needs no sort, so it suits a few rows or a few columns.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray
+        The group of each row of matrix, -1 for rows to leave out.
+    matrix : numpy.ndarray
+        A boolean or integer matrix with one row per code.
+    groups : int
+        The number of groups.
+
+    Returns
+    -------
+    numpy.ndarray
+        int64 sums of shape (groups, columns).
+    """
+    keep = codes >= 0
+    codes, matrix = codes[keep], matrix[keep]
+    sums = np.zeros((groups, matrix.shape[1]), dtype=np.int64)
+    for j in range(matrix.shape[1]):
+        sums[:, j] = np.bincount(codes, weights=matrix[:, j], minlength=groups)
+    return sums
+
+def _grouped_median(codes, values, groups):
+    keep = (codes >= 0) & np.isfinite(values)
+    codes, values = codes[keep], values[keep]
+    order = np.lexsort((values, codes))
+    codes, values = codes[order], values[order]
+    counts = np.bincount(codes, minlength=groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    median = np.full(groups, np.nan)
+    has = counts > 0
+    low = starts[has] + (counts[has] - 1) // 2
+    high = starts[has] + counts[has] // 2
+    median[has] = (values[low] + values[high]) / 2
+    return median
+
+def _grouped_sd(codes, values, groups):
+    keep = (codes >= 0) & np.isfinite(values)
+    codes, values = codes[keep], values[keep]
+    n = np.bincount(codes, minlength=groups).astype(np.float64)
+    total = np.bincount(codes, values, minlength=groups)
+    squares = np.bincount(codes, values * values, minlength=groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variance = (squares - total * total / n) / (n - 1)
+    return np.where(n > 1, np.sqrt(np.maximum(variance, 0)), np.nan)
+
+def digit_preference_scores(codes, values, groups):
+    """
+    Return the SMART digit preference score of each group's measurements (0 means no preference).
+
+    The score is 100 * sqrt(chi2 / (n * 9)) for the last digits of a group's n measurements, computed for
+    all groups with one bincount over (group, digit) pairs.
+    """
+    keep = (codes >= 0) & np.isfinite(values)
+    digits = np.round(values[keep]).astype(np.int64) % 10
+    observed = np.bincount(codes[keep] * 10 + digits, minlength=groups * 10).reshape(groups, 10).astype(np.float64)
+    n = observed.sum(axis=1)
+    expected = n[:, None] / 10
+    with np.errstate(divide='ignore', invalid='ignore'):
+        chi2 = ((observed - expected) ** 2 / expected).sum(axis=1)
+        return np.where(n > 0, 100 * np.sqrt(chi2 / (n * 9)), np.nan)
+
+def _measurement(survey, level, column):
+    sheet = survey.main if level is None else find_repeat_sheet(survey, level)
+    if sheet is None:
+        return None, None
+    contexts = _SHEET_COLUMNS.setdefault(survey, {})
+    if sheet not in contexts:
+        contexts[sheet] = SheetColumns(survey, sheet)
+    context = contexts[sheet]
+    return sheet, (context.numbers(column) if context.has(column) else None)
+
+def group_summaries(result, survey, groups, sectors=QUALITY_SECTORS, counts=None):
+    """
+    Summarize the quality checks of each sector by enumerator or team.
+
+    The flag and applicability matrices of each sheet are summed by group once, for all checks together;
+    medians, standard deviations and digit preference are grouped reductions over the encoded IDs as well,
+    so the cost does not grow with the number of enumerators.
+
+    Parameters
+    ----------
+    result : logic.tab7_quality.QualityResult
+        The evaluated checks.
+    survey : logic.tab6_linked.LinkedSurvey
+        The survey the checks were run on.
+    groups : GroupIndex
+        The enumerator or team of each household.
+    sectors : iterable of str, optional
+        Members of QUALITY_SECTORS (default: all).
+    counts : tuple or None, optional
+        The (flagged, checked) matrices of shape (groups, checks) when already summed, e.g. merged by
+        logic.tab7_incremental.QualityCache; by default they are summed from result.
+
+    Returns
+    -------
+    dict
+        sector -> pandas.DataFrame with one row per group: its ID, interviews, median interview minutes
+        (general sector), the share of checked records flagged overall and by check, the SD of the sector's
+        key indicator and a digit preference score where one applies.
+    """
+    for sector in sectors:
+        if sector not in QUALITY_SECTORS:
+            raise ValueError(f"Invalid sector provided. Must be one of {', '.join(QUALITY_SECTORS)}.")
+    count = len(groups)
+    if counts is not None:
+        flagged, checked = counts
+    else:
+        flagged = np.zeros((count, len(result.checks)), dtype=np.int64)
+        checked = np.zeros((count, len(result.checks)), dtype=np.int64)
+        for sheet, (positions, flags, applies) in result.sheets.items():
+            flagged[:, positions] = groups.reduce(sheet, flags)
+            checked[:, positions] = groups.reduce(sheet, applies)
+
+    interviews = np.bincount(groups.codes[groups.codes >= 0], minlength=count)
+    summaries = {}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rates = np.round(np.where(checked > 0, 100 * flagged / checked, np.nan), 1)
+        for sector in sectors:
+            positions = [i for i, check in enumerate(result.checks) if check.sector == sector]
+            frame = {groups.column: groups.labels, 'Interviews': interviews}
+            if sector == 'general':
+                _, minutes = _measurement(survey, None, 'interview_minutes')
+                if minutes is not None:
+                    frame['Median Interview (min)'] = np.round(_grouped_median(groups.codes, minutes, count), 1)
+            total = checked[:, positions].sum(axis=1)
+            frame['% Flagged'] = np.round(np.where(total > 0, 100 * flagged[:, positions].sum(axis=1) / total, np.nan), 1)
+            for i in positions:
+                frame[f'% {result.checks[i].label}'] = rates[:, i]
+            level, column = KEY_INDICATORS[sector]
+            sheet, values = _measurement(survey, level, column)
+            if values is not None:
+                frame[f'SD {column}'] = np.round(_grouped_sd(groups.rows(sheet), values, count), 2)
+            if sector in DIGIT_PREFERENCE:
+                sheet, values = _measurement(survey, *DIGIT_PREFERENCE[sector])
+                if values is not None:
+                    frame[f'Digit Preference {DIGIT_PREFERENCE[sector][1]}'] = np.round(digit_preference_scores(groups.rows(sheet), values, count), 1)
+            summaries[sector] = pd.DataFrame(frame)
+    return summaries
@@ -0,0 +1,315 @@
+# logic/tab7_incremental.py
+#
+# Data quality re-evaluation for daily uploads. Every evening's export repeats all earlier submissions,
+# so QualityCache only evaluates the households that are new or whose records changed since the previous
+# export, and merges their flags into the cached flags and counts.
+
+import threading
+import numpy as np
+import pandas as pd
+from logic.tab6_import import StringArray, SurveyColumn, SurveyData
+from logic.tab6_linked import INDEX_COLUMN, PARENT_INDEX_COLUMN, LinkedSurvey
+from logic.tab7_enumerators import GROUP_COLUMNS, GroupIndex, group_sums
+from logic.tab7_quality import CHECKS, QualityResult, SheetColumns, run_checks
+
+UUID_COLUMN = '_uuid'
+# row numbers of the export, which shift when an earlier submission is deleted: not part of a record's content
+POSITION_COLUMNS = (INDEX_COLUMN, PARENT_INDEX_COLUMN)
+
+class QualityUpdate:
+    """
+    The outcome of QualityCache.update.
+
+    Attributes:
+        result (QualityResult): Flags and counts for the whole survey
+        groups (dict): group column -> (GroupIndex, flagged, checked), where flagged and checked count the
+            records of each group per check, as taken by logic.tab7_enumerators.group_summaries
+        evaluated (int): The households whose records were evaluated
+        removed (int): The households of the previous survey that are gone or whose records changed
+        full (bool): Whether every household was evaluated
+    """
+
+    def __init__(self, result, groups, evaluated, removed, full):
+        self.result = result
+        self.groups = groups
+        self.evaluated = evaluated
+        self.removed = removed
+        self.full = full
+
+class _State:
+    # What QualityCache keeps of the previous survey: no survey data, only keys, row links and results.
+
+    def __init__(self, schema, uuids, hashes, result, households, groups):
+        self.schema = schema
+        self.uuids = uuids
+        # a hash of each household's main row and repeat rows
+        self.hashes = hashes
+        self.result = result
+        self.households = households
+        # group column -> (labels, group code of each household, flagged, checked)
+        self.groups = groups
+        self.wide = {check.key for check in result.checks if check.compares_records()}
+        # checks whose applicability (not only their flag) depends on the other records
+        self.wide_applies = {check.key for check in result.checks if check.compares_records(('applies',))}
+
+def _uuids(survey):
+    # a hash of each household's uuid, 0 where it is blank
+    column = SheetColumns(survey, survey.main).column(UUID_COLUMN)
+    if column is None:
+        return None
+    if column.kind != 'category':
+        column = SurveyColumn('category', np.arange(len(column)), StringArray.from_strings(column.text(slice(None))))
+        column.values[column.missing() | (column.values < 0)] = -1
+    return pd.Index(np.append(column.labels.hashes(), np.uint64(0))[np.asarray(column.values, dtype=np.intp)])
+
+def _mix(values):
+    # the splitmix64 finalizer: spreads every input bit over the whole hash
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+def _row_hashes(data):
+    # a uint64 hash of the content of each row of a sheet, computed column by column
+    hashes = np.zeros(len(data), dtype=np.uint64)
+    for position, (name, column) in enumerate(data.columns.items()):
+        if name in POSITION_COLUMNS:
+            continue
+        if column.kind == 'category':
+            values = np.append(column.labels.hashes(), np.uint64(0))[np.asarray(column.values, dtype=np.intp)]
+        elif column.kind == 'number':
+            # one bit pattern for -0.0 and 0.0, and for every NaN
+            numbers = np.asarray(column.values, dtype=np.float64) + 0.0
+            values = np.where(np.isnan(numbers), np.nan, numbers).view(np.uint64)
+        else:
+            values = np.asarray(column.values).view(np.uint64)
+        hashes = _mix(hashes + values + np.uint64(position + 1))
+    return hashes
+
+def _household_hashes(survey, households):
+    # combines each household's main row with its repeat rows, in sheet order, so that an edit, an added or
+    # deleted record or reordered records all change it
+    hashes = _row_hashes(survey.tables[survey.main])
+    for salt, sheet in enumerate(survey.repeats, start=1):
+        rows = households[sheet]
+        linked = np.flatnonzero(rows >= 0)
+        order = linked[np.argsort(rows[linked], kind='stable')]
+        owners = rows[order]
+        ordinals = np.arange(len(owners)) - np.searchsorted(owners, owners)
+        records = _mix(_row_hashes(survey.tables[sheet])[order] + _mix(ordinals.astype(np.uint64) + np.uint64(salt)))
+        sums = np.zeros(len(hashes), dtype=np.uint64)
+        np.add.at(sums, owners, records)
+        hashes = _mix(hashes + sums + np.uint64(salt))
+    return hashes
+
+def _match(old, new):
+    # the row of old holding each uuid of new; -1 where it is not there, blank or not unique
+    usable = ~old.duplicated(keep=False) & (old != 0)
+    matched = old[usable].get_indexer(new)
+    matched = np.append(np.flatnonzero(usable), -1)[matched]
+    matched[new.duplicated(keep=False) | (new == 0)] = -1
+    return matched
+
+def _subset(survey, rows):
+    tables = {}
+    for sheet, data in survey.tables.items():
+        selected = rows.get(sheet, np.zeros(0, dtype=np.int64))
+        tables[sheet] = SurveyData({name: column.take(selected) for name, column in data.columns.items()}, len(selected), sheet)
+    return LinkedSurvey(tables)
+
+def _copy_rows(target, target_rows, source, source_rows):
+    count = len(target_rows)
+    if not count or not source.shape[1]:
+        return
+    if target_rows[-1] == count - 1 and source_rows[-1] == count - 1:
+        # both are 0..count-1 (rows are increasing): the usual case of submissions appended to the export
+        target[:count] = source[:count]
+        return
+    # moves each row as one opaque item: far faster than 2-D fancy indexing of narrow boolean matrices
+    row = np.dtype((np.void, source.shape[1] * source.itemsize))
+    target.view(row).ravel()[target_rows] = np.ascontiguousarray(source).view(row).ravel()[source_rows]
+
+def _household_codes(codes, households):
+    # the group code of each row's household, -1 for unlinked rows
+    return np.where(households >= 0, codes[np.maximum(households, 0)], -1)
+
+def _sparse_group_sums(codes, matrix, groups):
+    # group_sums of a mostly False boolean matrix, by its True cells
+    rows, columns = np.nonzero(matrix)
+    codes = codes[rows]
+    keep = codes >= 0
+    width = matrix.shape[1]
+    return np.bincount(codes[keep] * width + columns[keep], minlength=groups * width).reshape(groups, width)
+
+def _align(new_rows, new_households, old_rows, old_households):
+    # pair the kept rows of a sheet in the old and new export; exports keep the order of earlier rows, so
+    # they usually pair up as they are, otherwise they are paired by household in sheet order
+    if np.array_equal(new_households[new_rows], old_households[old_rows]):
+        return new_rows, old_rows
+    new_rows = new_rows[np.argsort(new_households[new_rows], kind='stable')]
+    old_rows = old_rows[np.argsort(old_households[old_rows], kind='stable')]
+    return new_rows, old_rows
+
+class QualityCache:
+    """
+    Data quality results kept between imports of a growing survey export.
+
+    update() matches the households of a new import to the previous one by _uuid and a hash of their main
+    and repeat records, so a submission edited in place under the same _uuid counts as changed. Households
+    found unchanged keep their cached flags, including the records of their repeat groups; only the other
+    households are evaluated, on a survey made of just their records. The per-check and per-group counts
+    are then updated by subtracting what the removed households contributed and adding what the new ones
+    do. Checks comparing records with each other (outliers, duplicates) cannot be updated that way and are
+    re-run on the whole survey, as is everything when the columns change or there is no _uuid column.
+
+    Parameters:
+        checks (sequence of QualityCheck): The checks to run (default: CHECKS)
+        group_columns (sequence of str): The main-sheet columns flags are counted by (default: GROUP_COLUMNS)
+    """
+
+    def __init__(self, checks=CHECKS, group_columns=GROUP_COLUMNS):
+        self.checks = tuple(checks)
+        self.group_columns = tuple(group_columns)
+        self._state = None
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._state = None
+
+    def update(self, survey):
+        """
+        Evaluate the checks for a new import of the survey, reusing the results of the previous one.
+
+        Parameters
+        ----------
+        survey : logic.tab6_linked.LinkedSurvey
+            The imported survey, usually the previous export plus the latest submissions.
+
+        Returns
+        -------
+        QualityUpdate
+            The results for the whole survey and how many households were evaluated.
+        """
+        with self._lock:
+            schema = {sheet: tuple(data.columns) for sheet, data in survey.tables.items()}
+            uuids = _uuids(survey)
+            state = self._state
+            update = None
+            if state is not None and uuids is not None and state.uuids is not None and schema == state.schema:
+                update = self._merge(state, survey, uuids)
+            if update is None:
+                update = self._evaluate_all(survey, schema, uuids)
+            return update
+
+    def _households(self, survey):
+        return {sheet: survey.household_rows(sheet) for sheet in [survey.main, *survey.repeats]}
+
+    def _evaluate_all(self, survey, schema, uuids):
+        result = run_checks(survey, self.checks)
+        groups, cached = {}, {}
+        for column in self.group_columns:
+            try:
+                index = GroupIndex(survey, column)
+            except ValueError:
+                continue
+            flagged = np.zeros((len(index), len(result.checks)), dtype=np.int64)
+            checked = np.zeros((len(index), len(result.checks)), dtype=np.int64)
+            for sheet, (positions, flags, applies) in result.sheets.items():
+                flagged[:, positions] = index.reduce(sheet, flags)
+                checked[:, positions] = index.reduce(sheet, applies)
+            groups[column] = (index, flagged, checked)
+            cached[column] = (index.labels, index.codes, flagged, checked)
+        households = self._households(survey)
+        hashes = None if uuids is None else _household_hashes(survey, households)
+        self._state = _State(schema, uuids, hashes, result, households, cached)
+        return QualityUpdate(result, groups, len(survey), 0, True)
+
+    def _merge(self, state, survey, uuids):
+        households = self._households(survey)
+        hashes = _household_hashes(survey, households)
+        matched = _match(state.uuids, uuids)
+        # a household is kept only if its records are unchanged, repeat records included
+        matched[(matched >= 0) & (hashes != state.hashes[np.maximum(matched, 0)])] = -1
+        kept = np.flatnonzero(matched >= 0)
+        new_kept = np.zeros(len(uuids), dtype=bool)
+        new_kept[kept] = True
+        old_kept = np.zeros(len(state.uuids), dtype=bool)
+        old_kept[matched[kept]] = True
+        old_to_new = np.full(len(state.uuids) + 1, -1, dtype=np.int64)
+        old_to_new[matched[kept]] = kept
+
+        # rows of each sheet: evaluated, removed, and kept (new and old rows in matching order)
+        evaluated, removed, reused = {}, {}, {}
+        for sheet, rows in households.items():
+            old_rows = state.households[sheet]
+            keep = new_kept[np.maximum(rows, 0)] & (rows >= 0)
+            keep_old = old_kept[np.maximum(old_rows, 0)] & (old_rows >= 0)
+            evaluated[sheet] = np.flatnonzero(~keep)
+            removed[sheet] = np.flatnonzero(~keep_old)
+            reused[sheet] = _align(np.flatnonzero(keep), rows, np.flatnonzero(keep_old), old_to_new[old_rows])
+
+        checks = state.result.checks
+        local = run_checks(_subset(survey, evaluated), [check for check in checks if check.key not in state.wide])
+        wide = run_checks(survey, [check for check in checks if check.key in state.wide])
+        if len(local.checks) + len(wide.checks) != len(checks):
+            # a check could not be evaluated on the new records alone
+            return None
+
+        sheets = {}
+        flagged_total, checked_total = state.result.flagged.copy(), state.result.checked.copy()
+        for sheet, (positions, old_flags, old_applies) in state.result.sheets.items():
+            column_of = {checks[i].key: j for j, i in enumerate(positions)}
+            rows = evaluated[sheet]
+            new_rows, old_rows = reused[sheet]
+            flags = np.zeros((len(survey.tables[sheet]), len(positions)), dtype=bool)
+            applies = np.zeros_like(flags)
+            _copy_rows(flags, new_rows, old_flags, old_rows)
+            _copy_rows(applies, new_rows, old_applies, old_rows)
+            if sheet in local.sheets:
+                part_positions, part_flags, part_applies = local.sheets[sheet]
+                cells = np.ix_(rows, [column_of[local.checks[i].key] for i in part_positions])
+                flags[cells], applies[cells] = part_flags, part_applies
+            wide_columns = []
+            if sheet in wide.sheets:
+                part_positions, part_flags, part_applies = wide.sheets[sheet]
+                wide_columns = [column_of[wide.checks[i].key] for i in part_positions]
+                flags[:, wide_columns], applies[:, wide_columns] = part_flags, part_applies
+            sheets[sheet] = (positions, flags, applies)
+            flagged_total[positions] += np.count_nonzero(flags[rows], axis=0) - np.count_nonzero(old_flags[removed[sheet]], axis=0)
+            checked_total[positions] += np.count_nonzero(applies[rows], axis=0) - np.count_nonzero(old_applies[removed[sheet]], axis=0)
+            if wide_columns:
+                flagged_total[positions[wide_columns]] = np.count_nonzero(part_flags, axis=0)
+                checked_total[positions[wide_columns]] = np.count_nonzero(part_applies, axis=0)
+        result = QualityResult(checks, state.result.skipped, sheets, totals=(flagged_total, checked_total))
+
+        groups, cached = {}, {}
+        for column, (labels, old_codes, old_flagged, old_checked) in state.groups.items():
+            index = GroupIndex(survey, column)
+            remap = np.append(pd.Index(index.labels).get_indexer(labels), -1)
+            present = remap[:-1] >= 0
+            flagged = np.zeros((len(index), len(checks)), dtype=np.int64)
+            checked = np.zeros((len(index), len(checks)), dtype=np.int64)
+            flagged[remap[:-1][present]] = old_flagged[present]
+            checked[remap[:-1][present]] = old_checked[present]
+            old_codes = remap[old_codes]
+            for sheet, (positions, flags, applies) in sheets.items():
+                rows, gone = evaluated[sheet], removed[sheet]
+                codes = _household_codes(index.codes, households[sheet][rows])
+                gone_codes = _household_codes(old_codes, state.households[sheet][gone])
+                old_flags, old_applies = state.result.sheets[sheet][1:]
+                flagged[:, positions] += group_sums(codes, flags[rows], len(index)) - group_sums(gone_codes, old_flags[gone], len(index))
+                checked[:, positions] += group_sums(codes, applies[rows], len(index)) - group_sums(gone_codes, old_applies[gone], len(index))
+                # flags comparing records are counted again for every row; they are few, so only those are visited
+                wide_columns = [j for j, i in enumerate(positions) if checks[i].key in state.wide]
+                if wide_columns:
+                    flagged[:, positions[wide_columns]] = _sparse_group_sums(index.rows(sheet), flags[:, wide_columns], len(index))
+                wide_columns = [j for j, i in enumerate(positions) if checks[i].key in state.wide_applies]
+                if wide_columns:
+                    checked[:, positions[wide_columns]] = group_sums(index.rows(sheet), applies[:, wide_columns], len(index))
+            groups[column] = (index, flagged, checked)
+            cached[column] = (index.labels, index.codes, flagged, checked)
+
+        self._state = _State(state.schema, uuids, hashes, result, households, cached)
+        return QualityUpdate(result, groups, len(evaluated[survey.main]), len(removed[survey.main]), False)
@@ -0,0 +1,499 @@
+# logic/tab7_quality.py
+#
+# Data quality checks for an imported IPHRA household survey (logic.tab6_linked.LinkedSurvey).
+# Every check is declared once in CHECKS as a small expression over survey columns; run_checks
+# evaluates them all with NumPy, reading each column once per sheet, and counts the flags of every
+# check with one reduction per sheet.
+
+import numpy as np
+import pandas as pd
+from logic import tab4_hh_questions
+
+QUALITY_SECTORS = ('general', 'fsl', 'wash', 'shelter', 'health', 'nutrition', 'muac', 'mortality')
+SUMMARY_COLUMNS = ('Check', 'Records Checked', 'Flagged', '% Flagged')
+# records are only checked after consent, except by checks declared with consented_only=False
+CONSENT_CONDITION = ('eq', 'consent', 'yes')
+START_COLUMN = 'start'
+END_COLUMN = 'end'
+
+def _repeat_questions():
+    # repeat group name -> names of the questions inside it, from the HH question bank
+    repeats, current = {}, None
+    for definition in tab4_hh_questions.INDICATORS:
+        for row in definition['survey']:
+            if row[0] == 'begin_repeat':
+                current = row[1]
+                repeats[current] = set()
+            elif row[0] == 'end_repeat':
+                current = None
+            elif current is not None:
+                repeats[current].add(row[1])
+    return repeats
+
+REPEAT_QUESTIONS = _repeat_questions()
+
+class QualityCheck:
+    """
+    One data quality check.
+
+    Conditions are nested tuples evaluated column-wise over a whole sheet:
+    ('blank', name), ('answered', name), ('eq', name, value), ('ne', name, value), ('lt', name, value),
+    ('gt', name, value), ('outside', name, low, high), ('zscore', name, limit), ('duplicate', name, ...),
+    ('and', condition, ...), ('or', condition, ...) and ('not', condition). A value written as '${name}'
+    refers to another column. Besides survey columns, names can be one of the DERIVED_COLUMNS.
+
+    Attributes:
+        key (str): Unique identifier
+        sector (str): One of QUALITY_SECTORS
+        label (str): Description shown in the summary table
+        flag (tuple): The condition that marks a record as flagged
+        applies (tuple or None): The condition selecting the records checked (default: all)
+        level (str or None): The repeat group whose records are checked; None checks household records
+        consented_only (bool): Only check records of households that consented
+    """
+
+    def __init__(self, key, sector, label, flag, applies=None, level=None, consented_only=True):
+        if sector not in QUALITY_SECTORS:
+            raise ValueError(f"Invalid sector provided. Must be one of {', '.join(QUALITY_SECTORS)}.")
+        self.key = key
+        self.sector = sector
+        self.label = label
+        self.flag = flag
+        self.applies = applies
+        self.level = level
+        self.consented_only = consented_only
+
+    def columns(self):
+        """The names of every column the check reads."""
+        names = []
+
+        def collect(condition):
+            operator, *arguments = condition
+            if operator in ('and', 'or', 'not'):
+                for argument in arguments:
+                    collect(argument)
+                return
+            names.append(arguments[0])
+            if operator == 'duplicate':
+                names.extend(arguments[1:])
+            for value in arguments[1:]:
+                if _reference(value):
+                    names.append(_reference(value))
+
+        for condition in (self.flag, self.applies):
+            if condition is not None:
+                collect(condition)
+        return list(dict.fromkeys(names))
+
+    def compares_records(self, conditions=('flag', 'applies')):
+        """Whether the named conditions of a record depend on the other records (zscore or duplicate)."""
+
+        def compares(condition):
+            operator, *arguments = condition
+            if operator in ('and', 'or', 'not'):
+                return any(compares(argument) for argument in arguments)
+            return operator in ('zscore', 'duplicate')
+
+        return any(compares(getattr(self, name)) for name in conditions if getattr(self, name) is not None)
+
+def _reference(value):
+    if isinstance(value, str) and value.startswith('${') and value.endswith('}'):
+        return value[2:-1]
+    return None
+
+def _outside(name, low, high):
+    return ('outside', name, low, high)
+
+FCS_DAYS = ('fcs_cereals', 'fcs_pulses', 'fcs_vegetables', 'fcs_fruit', 'fcs_meat', 'fcs_dairy', 'fcs_sugar', 'fcs_oil')
+RCSI_DAYS = ('rcsi_less_preferred', 'rcsi_borrow', 'rcsi_portion', 'rcsi_adults', 'rcsi_meals')
+U5_MORBIDITY = ('u5_diarrhoea', 'u5_fever', 'u5_cough')
+
+CHECKS = (
+    # general
+    QualityCheck('consent_missing', 'general', "Consent not recorded", ('blank', 'consent'), consented_only=False),
+    QualityCheck('duplicate_household', 'general', "Duplicate cluster and household number",
+                 ('duplicate', 'cluster_id', 'hh_id'), consented_only=False),
+    QualityCheck('interview_short', 'general', "Interview shorter than 15 minutes", ('lt', 'interview_minutes', 15)),
+    QualityCheck('interview_long', 'general', "Interview longer than 3 hours", ('gt', 'interview_minutes', 180)),
+    QualityCheck('interview_negative', 'general', "Interview ends before it starts", ('lt', 'interview_minutes', 0)),
+    QualityCheck('hh_size_missing', 'general', "Household size missing", ('blank', 'hh_size')),
+    QualityCheck('hh_size_range', 'general', "Household size outside 1-40", _outside('hh_size', 1, 40)),
+    QualityCheck('hh_size_outlier', 'general', "Household size more than 3 SD from the mean", ('zscore', 'hh_size', 3)),
+    QualityCheck('roster_mismatch', 'general', "Roster members differ from household size",
+                 ('ne', 'roster_members', '${hh_size}'), applies=('answered', 'hh_size')),
+    QualityCheck('member_age_range', 'general', "Member age outside 0-110 years", _outside('member_age_years', 0, 110), level='roster'),
+    QualityCheck('member_months_skip', 'general', "Age in months given for a member aged 5 or more",
+                 ('answered', 'member_age_months'), applies=('gt', 'member_age_years', 4), level='roster'),
+    QualityCheck('member_sex_missing', 'general', "Member sex missing", ('blank', 'member_sex'), level='roster'),
+    # food security
+    QualityCheck('fcs_missing', 'fsl', "Food consumption days missing", ('or', *(('blank', name) for name in FCS_DAYS))),
+    QualityCheck('fcs_days_range', 'fsl', "Food consumption days outside 0-7", ('or', *(_outside(name, 0, 7) for name in FCS_DAYS))),
+    QualityCheck('fcs_outlier', 'fsl', "FCS more than 3 SD from the mean", ('zscore', 'fcs', 3)),
+    QualityCheck('fcs_no_staples', 'fsl', "Cereals eaten on fewer than 3 days with an acceptable FCS",
+                 ('and', ('lt', 'fcs_cereals', 3), ('gt', 'fcs', 35))),
+    QualityCheck('rcsi_days_range', 'fsl', "rCSI days outside 0-7", ('or', *(_outside(name, 0, 7) for name in RCSI_DAYS))),
+    QualityCheck('rcsi_outlier', 'fsl', "rCSI more than 3 SD from the mean", ('zscore', 'rcsi', 3)),
+    QualityCheck('fcs_poor_no_coping', 'fsl', "Poor FCS (21 or less) without any food coping (rCSI 0)",
+                 ('and', ('lt', 'fcs', 21.5), ('eq', 'rcsi', 0))),
+    QualityCheck('hhs_skip', 'fsl', "Hunger frequency given without the hunger experience",
+                 ('or', ('and', ('answered', 'hhs_no_food_freq'), ('not', ('eq', 'hhs_no_food', 'yes'))),
+                        ('and', ('answered', 'hhs_sleep_hungry_freq'), ('not', ('eq', 'hhs_sleep_hungry', 'yes'))),
+                        ('and', ('answered', 'hhs_whole_day_freq'), ('not', ('eq', 'hhs_whole_day', 'yes'))))),
+    QualityCheck('hhs_frequency_missing', 'fsl', "Hunger experienced but frequency missing",
+                 ('or', ('and', ('eq', 'hhs_no_food', 'yes'), ('blank', 'hhs_no_food_freq')),
+                        ('and', ('eq', 'hhs_sleep_hungry', 'yes'), ('blank', 'hhs_sleep_hungry_freq')),
+                        ('and', ('eq', 'hhs_whole_day', 'yes'), ('blank', 'hhs_whole_day_freq')))),
+    # WASH
+    QualityCheck('water_source_missing', 'wash', "Drinking water source missing", ('blank', 'water_source')),
+    QualityCheck('water_other_missing', 'wash', "Other water source not specified",
+                 ('blank', 'water_source_other'), applies=('eq', 'water_source', 'other')),
+    QualityCheck('water_time_range', 'wash', "Water collection time outside 0-600 minutes", _outside('water_time', 0, 600)),
+    QualityCheck('water_lpd_high', 'wash', "More than 100 litres per person per day", ('gt', 'water_lpd', 100)),
+    QualityCheck('water_lpd_outlier', 'wash', "Litres per person more than 3 SD from the mean", ('zscore', 'water_lpd', 3)),
+    QualityCheck('latrine_shared_skip', 'wash', "Latrine sharing answered for open defecation",
+                 ('answered', 'latrine_shared'), applies=('eq', 'latrine_type', 'open')),
+    QualityCheck('latrine_shared_range', 'wash', "Shared latrine used by fewer than 2 households",
+                 ('lt', 'latrine_shared_hh', 2), applies=('eq', 'latrine_shared', 'yes')),
+    # shelter
+    QualityCheck('shelter_type_missing', 'shelter', "Shelter type missing", ('blank', 'shelter_type')),
+    QualityCheck('shelter_damage_skip', 'shelter', "Shelter condition answered without a shelter",
+                 ('answered', 'shelter_damage'), applies=('eq', 'shelter_type', 'none')),
+    QualityCheck('shelter_rooms_range', 'shelter', "Sleeping rooms outside 0-20", _outside('shelter_rooms', 0, 20)),
+    QualityCheck('shelter_rooms_crowded', 'shelter', "More than 10 people per sleeping room",
+                 ('gt', 'people_per_room', 10)),
+    QualityCheck('nfi_missing', 'shelter', "Household items missing", ('blank', 'nfi_owned')),
+    # health
+    QualityCheck('health_ill_missing', 'health', "Illness in the past 2 weeks missing", ('blank', 'health_ill')),
+    QualityCheck('health_care_missing', 'health', "Illness reported but care seeking missing",
+                 ('blank', 'health_sought_care'), applies=('eq', 'health_ill', 'yes')),
+    QualityCheck('health_care_skip', 'health', "Care location given although no care was sought",
+                 ('answered', 'health_care_location'), applies=('not', ('eq', 'health_sought_care', 'yes'))),
+    QualityCheck('u5_morbidity_range', 'health', "More sick children than children under 5",
+                 ('or', *(('gt', name, '${num_under5}') for name in U5_MORBIDITY))),
+    QualityCheck('measles_age_range', 'health', "Measles child age outside 0-59 months", _outside('measles_age_months', 0, 59), level='measles'),
+    QualityCheck('measles_skip', 'health', "Measles vaccination answered for a child under 9 months",
+                 ('answered', 'measles_vaccinated'), applies=('lt', 'measles_age_months', 9), level='measles'),
+    # nutrition
+    QualityCheck('child_age_range', 'nutrition', "Child age outside 6-59 months", _outside('child_age_months', 6, 59), level='muac_children'),
+    QualityCheck('child_age_missing', 'nutrition', "Child age missing", ('blank', 'child_age_months'), level='muac_children'),
+    QualityCheck('child_sex_missing', 'nutrition', "Child sex missing", ('blank', 'child_sex'), level='muac_children'),
+    QualityCheck('child_oedema', 'nutrition', "Bilateral oedema reported (verify)", ('eq', 'child_oedema', 'yes'), level='muac_children'),
+    QualityCheck('children_mismatch', 'nutrition', "MUAC records differ from children 6-59 months in the roster",
+                 ('ne', 'muac_records', '${num_children_6_59}'), applies=('answered', 'num_children_6_59')),
+    # MUAC
+    QualityCheck('muac_missing', 'muac', "MUAC missing", ('blank', 'child_muac'), level='muac_children'),
+    QualityCheck('muac_range', 'muac', "MUAC outside 75-250 mm", _outside('child_muac', 75, 250), level='muac_children'),
+    QualityCheck('muac_outlier', 'muac', "MUAC more than 3 SD from the mean (SMART flag)", ('zscore', 'child_muac', 3), level='muac_children'),
+    QualityCheck('muac_sam', 'muac', "MUAC below 115 mm (verify)", ('lt', 'child_muac', 115), level='muac_children'),
+    # mortality
+    QualityCheck('deaths_mismatch', 'mortality', "Death records differ from the number of deaths",
+                 ('ne', 'death_records', '${num_deaths}'), applies=('answered', 'num_deaths')),
+    QualityCheck('deaths_high', 'mortality', "More than 3 deaths in one household", ('gt', 'num_deaths', 3)),
+    QualityCheck('births_high', 'mortality', "More than 2 births in one household", ('gt', 'num_births', 2)),
+    QualityCheck('joined_outlier', 'mortality', "People joined more than 3 SD from the mean", ('zscore', 'num_joined', 3)),
+    QualityCheck('left_outlier', 'mortality', "People left more than 3 SD from the mean", ('zscore', 'num_left', 3)),
+    QualityCheck('death_age_range', 'mortality', "Age at death outside 0-110 years", _outside('death_age_years', 0, 110), level='deaths'),
+    QualityCheck('death_cause_missing', 'mortality', "Cause of death missing", ('blank', 'death_cause'), level='deaths'),
+)
+
+def find_repeat_sheet(survey, level):
+    """
+    Return the sheet of survey holding a repeat group of the HH tool, or None.
+
+    A sheet named after the repeat group is used if there is one; otherwise the repeat sheet sharing the
+    most question names with the group.
+    """
+    if level in survey.parents:
+        return level
+    questions = REPEAT_QUESTIONS.get(level, set())
+    best, overlap = None, 0
+    for sheet in survey.repeats:
+        names = {name.rsplit('/', 1)[-1] for name in survey.tables[sheet].columns}
+        if len(names & questions) > overlap:
+            best, overlap = sheet, len(names & questions)
+    return best
+
+def _interview_minutes(context):
+    start, end = context.datetimes(START_COLUMN), context.datetimes(END_COLUMN)
+    if start is None or end is None:
+        return None
+    minutes = (end - start).astype('timedelta64[s]').astype(np.float64) / 60
+    minutes[np.isnat(start) | np.isnat(end)] = np.nan
+    return minutes
+
+def _people_per_room(context):
+    size, rooms = context.numbers('hh_size'), context.numbers('shelter_rooms')
+    if size is None or rooms is None:
+        return None
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(rooms > 0, size / rooms, np.nan)
+
+def _record_count(level):
+    def count(context):
+        sheet = find_repeat_sheet(context.survey, level)
+        if sheet is None or context.sheet != context.survey.parents.get(sheet):
+            return None
+        return context.survey.child_counts(sheet).astype(np.float64)
+    return count
+
+# computed columns that checks can use like survey columns
+DERIVED_COLUMNS = {
+    'interview_minutes': _interview_minutes,
+    'people_per_room': _people_per_room,
+    'roster_members': _record_count('roster'),
+    'death_records': _record_count('deaths'),
+    'muac_records': _record_count('muac_children'),
+}
+
+class SheetColumns:
+    """
+    The columns of one sheet, decoded on demand and each at most once.
+
+    This is the shared column decoder of the data quality modules: the checks, the enumerator summaries and
+    the incremental cache all read survey columns through it. Columns are found by their name without Kobo
+    group prefixes, and main-sheet (household) columns asked for on a repeat sheet are joined to its rows.
+
+    Parameters:
+        survey (logic.tab6_linked.LinkedSurvey): The imported survey
+        sheet (str): The sheet to read
+    """
+
+    def __init__(self, survey, sheet):
+        self.survey = survey
+        self.sheet = sheet
+        self.rows = len(survey.tables[sheet])
+        self._names = self._short_names(sheet)
+        self._main_names = self._short_names(survey.main) if sheet != survey.main else None
+        self._cache = {}
+
+    def _short_names(self, sheet):
+        # Kobo prefixes names with their groups ("grp_fcs/fcs_cereals")
+        names = {}
+        for name in self.survey.tables[sheet].columns:
+            names.setdefault(name.rsplit('/', 1)[-1], name)
+        return names
+
+    def has(self, name):
+        return self.column(name) is not None or (name in DERIVED_COLUMNS and self.numbers(name) is not None)
+
+    def column(self, name):
+        key = ('column', name)
+        if key not in self._cache:
+            column = None
+            if name in self._names:
+                column = self.survey.tables[self.sheet].columns[self._names[name]]
+            elif self._main_names is not None and name in self._main_names:
+                column = self.survey.join(self.sheet, self._main_names[name])
+            self._cache[key] = column
+        return self._cache[key]
+
+    def numbers(self, name):
+        key = ('numbers', name)
+        if key not in self._cache:
+            if name in DERIVED_COLUMNS and self.column(name) is None:
+                values = DERIVED_COLUMNS[name](self)
+            else:
+                column = self.column(name)
+                if column is None or column.kind == 'datetime':
+                    values = None
+                elif column.kind == 'number':
+                    values = np.asarray(column.values)
+                else:
+                    # convert each distinct label once, then index by code
+                    labels = pd.to_numeric(pd.Series(column.labels.tolist() + [''], dtype=object), errors='coerce')
+                    values = labels.to_numpy(dtype=np.float64)[np.asarray(column.values, dtype=np.intp)]
+            self._cache[key] = values
+        return self._cache[key]
+
+    def datetimes(self, name):
+        key = ('datetimes', name)
+        if key not in self._cache:
+            column = self.column(name)
+            if column is None or column.kind == 'number':
+                values = None
+            elif column.kind == 'datetime':
+                values = np.asarray(column.values)
+            else:
+                parsed = pd.to_datetime(pd.Series(column.labels.tolist() + [''], dtype=object), errors='coerce', utc=True, format='ISO8601')
+                values = parsed.dt.tz_localize(None).to_numpy(dtype='datetime64[s]')[np.asarray(column.values, dtype=np.intp)]
+            self._cache[key] = values
+        return self._cache[key]
+
+    def keys(self, name):
+        """The column as comparable values: numbers, datetimes, or category codes with blanks as NaN."""
+        column = self.column(name)
+        if column is None or column.kind != 'category':
+            return self.numbers(name) if column is None or column.kind == 'number' else self.datetimes(name)
+        return np.where(column.missing(), np.nan, column.values)
+
+    def blank(self, name):
+        column = self.column(name)
+        if column is None:
+            return np.isnan(self.numbers(name))
+        return column.missing()
+
+    def equals(self, name, value):
+        ref = _reference(value)
+        if ref is not None:
+            return self.numbers(name) == self.numbers(ref)
+        column = self.column(name)
+        if column is None or column.kind == 'number' or not isinstance(value, str):
+            return self.numbers(name) == float(value)
+        key = ('codes', name)
+        if key not in self._cache:
+            self._cache[key] = {label: code for code, label in enumerate(column.labels.tolist())}
+        code = self._cache[key].get(value)
+        return np.zeros(self.rows, dtype=bool) if code is None else np.asarray(column.values) == code
+
+    def value(self, value):
+        ref = _reference(value)
+        return self.numbers(ref) if ref is not None else value
+
+def _evaluate(condition, context, applies):
+    operator, *arguments = condition
+    if operator == 'and':
+        result = np.ones(context.rows, dtype=bool)
+        for argument in arguments:
+            result &= _evaluate(argument, context, applies)
+        return result
+    if operator == 'or':
+        result = np.zeros(context.rows, dtype=bool)
+        for argument in arguments:
+            result |= _evaluate(argument, context, applies)
+        return result
+    if operator == 'not':
+        return ~_evaluate(arguments[0], context, applies)
+    name = arguments[0]
+    if operator == 'blank':
+        return context.blank(name)
+    if operator == 'answered':
+        return ~context.blank(name)
+    if operator == 'eq':
+        return context.equals(name, arguments[1])
+    if operator == 'ne':
+        # blank answers are not "different"
+        return ~context.equals(name, arguments[1]) & ~context.blank(name)
+    if operator == 'duplicate':
+        frame = pd.DataFrame({n: context.keys(n) for n in arguments})
+        return frame.duplicated(keep=False).to_numpy() & frame.notna().all(axis=1).to_numpy()
+    values = context.numbers(name)
+    with np.errstate(invalid='ignore'):
+        if operator == 'lt':
+            return values < context.value(arguments[1])
+        if operator == 'gt':
+            return values > context.value(arguments[1])
+        if operator == 'outside':
+            return (values < arguments[1]) | (values > arguments[2])
+        if operator == 'zscore':
+            sample = values[applies & np.isfinite(values)]
+            if len(sample) < 2 or sample.std() == 0:
+                return np.zeros(context.rows, dtype=bool)
+            return np.abs(values - sample.mean()) > arguments[1] * sample.std()
+    raise ValueError(f"Invalid condition operator {operator!r}.")
+
+class QualityResult:
+    """
+    The outcome of run_checks.
+
+    Attributes:
+        checks (list of QualityCheck): The checks that could be evaluated, in CHECKS order
+        skipped (list of QualityCheck): The checks whose columns are not in the survey
+        sheets (dict): sheet -> (check positions, flags, checked), where flags and checked are boolean
+            matrices with one row per record and one column per check of that sheet
+        flagged, checked (numpy.ndarray): The number of records flagged and checked by each check; counted
+            from sheets unless given as totals
+    """
+
+    def __init__(self, checks, skipped, sheets, totals=None):
+        self.checks = checks
+        self.skipped = skipped
+        self.sheets = sheets
+        if totals is not None:
+            self.flagged, self.checked = totals
+            return
+        self.flagged = np.zeros(len(checks), dtype=np.int64)
+        self.checked = np.zeros(len(checks), dtype=np.int64)
+        for positions, flags, checked in sheets.values():
+            # one reduction per sheet counts every check at once
+            self.flagged[positions] = flags.sum(axis=0)
+            self.checked[positions] = checked.sum(axis=0)
+
+    def summary(self, sector):
+        """
+        Return the summary table of one sector.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per check with SUMMARY_COLUMNS.
+        """
+        if sector not in QUALITY_SECTORS:
+            raise ValueError(f"Invalid sector provided. Must be one of {', '.join(QUALITY_SECTORS)}.")
+        positions = [i for i, check in enumerate(self.checks) if check.sector == sector]
+        flagged, checked = self.flagged[positions], self.checked[positions]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            percent = np.where(checked > 0, 100 * flagged / checked, np.nan)
+        return pd.DataFrame({
+            'Check': [self.checks[i].label for i in positions],
+            'Records Checked': checked,
+            'Flagged': flagged,
+            '% Flagged': np.round(percent, 1),
+        }, columns=list(SUMMARY_COLUMNS))
+
+    def flagged_rows(self, key):
+        """Return the sheet and the flagged row positions of one check."""
+        for sheet, (positions, flags, _) in self.sheets.items():
+            for j, i in enumerate(positions):
+                if self.checks[i].key == key:
+                    return sheet, np.flatnonzero(flags[:, j])
+        raise ValueError(f"Check {key!r} was not evaluated.")
+
+def run_checks(survey, checks=CHECKS):
+    """
+    Evaluate data quality checks over a linked survey.
+
+    Checks are grouped by the sheet they read. Within a sheet every column is decoded once and shared by
+    all checks, each check is a handful of vectorized comparisons, and the flags of all checks are counted
+    together. Checks reading columns that the survey does not have (indicators left out of the tool) are
+    skipped.
+
+    Parameters
+    ----------
+    survey : logic.tab6_linked.LinkedSurvey
+        The imported survey.
+    checks : sequence of QualityCheck, optional
+        The checks to run (default: CHECKS).
+
+    Returns
+    -------
+    QualityResult
+        Flags per record and counts per check.
+    """
+    contexts = {}
+    evaluated, skipped = [], []
+    per_sheet = {}
+    for check in checks:
+        sheet = survey.main if check.level is None else find_repeat_sheet(survey, check.level)
+        if sheet is None:
+            skipped.append(check)
+            continue
+        if sheet not in contexts:
+            contexts[sheet] = SheetColumns(survey, sheet)
+        context = contexts[sheet]
+        if not all(context.has(name) for name in check.columns()):
+            skipped.append(check)
+            continue
+        applies = np.ones(context.rows, dtype=bool)
+        if check.consented_only and context.has(CONSENT_CONDITION[1]):
+            applies &= _evaluate(CONSENT_CONDITION, context, applies)
+        if check.applies is not None:
+            applies &= _evaluate(check.applies, context, applies)
+        flags = _evaluate(check.flag, context, applies) & applies
+        per_sheet.setdefault(sheet, []).append((len(evaluated), flags, applies))
+        evaluated.append(check)
+
+    sheets = {sheet: (np.array([i for i, _, _ in items], dtype=np.intp),
+                      np.column_stack([flags for _, flags, _ in items]),
+                      np.column_stack([applies for _, _, applies in items]))
+              for sheet, items in per_sheet.items()}
+    return QualityResult(evaluated, skipped, sheets)
@@ -1,7 +1,50 @@
-
 # logic/validators.py
+#
+# Pure validation helpers. Nothing in this module may import PyQt6 so that the
+# compute layer (logic.*) stays importable in batch jobs, workers and tests.
+# Dialog-based reporting lives in ui/qt_validators.py.
+
+from dataclasses import dataclass
+import numpy as np
 
-from PyQt6.QtWidgets import QMessageBox
+@dataclass(frozen=True)
+class ValidationError:
+    """
+    A structured description of one invalid input.
+
+    Attributes:
+        name (str): The name of the input or column
+        message (str): A human readable explanation
+        value (any): The offending value
+        row (int or None): The row position for column validation, None for single values
+    """
+    name: str
+    message: str
+    value: object = None
+    row: int = None
+
+    def __str__(self):
+        if self.row is None:
+            return f"Invalid value for {self.name}: {self.message}"
+        return f"Invalid value for {self.name} in row {self.row}: {self.message}"
+
+@dataclass(frozen=True)
+class ColumnRule:
+    """
+    The constraints a column of inputs must satisfy.
+
+    Attributes:
+        expected_type (type): float or int
+        min_value (float or None): The lower bound
+        max_value (float or None): The upper bound
+        exclusive_min (bool): Whether min_value itself is invalid
+        exclusive_max (bool): Whether max_value itself is invalid
+    """
+    expected_type: type = float
+    min_value: float = None
+    max_value: float = None
+    exclusive_min: bool = False
+    exclusive_max: bool = False
 
 def validate_type(value, expected_type):
     """
@@ -32,29 +75,92 @@ def validate_type(value, expected_type):
     except (ValueError, TypeError) as e:
         return False, f"Expected {expected_type.__name__}, but got invalid value: {value!r}"
 
-def validate_float(text, name, min_value=None, max_value=None, parent=None):
+def check_number(text, name, expected_type=float, min_value=None, max_value=None):
+    """
+    Converts a single input to a number and checks its bounds without any user interface side effects.
+
+    Parameters:
+        text (any): The input to check (usually a string from a widget)
+        name (str): The input name used in the error message
+        expected_type (type): float or int
+        min_value, max_value (float or None): Inclusive bounds
+
+    Returns:
+        (converted_value or None, ValidationError or None)
+    """
     try:
-        value = float(text)
-        if min_value is not None and value < min_value:
-            raise ValueError(f"{name} must be at least {min_value}.")
-        if max_value is not None and value > max_value:
-            raise ValueError(f"{name} must be at most {max_value}.")
-        return value
-    except ValueError as e:
-        show_error(f"Invalid value for {name}: {e}", parent)
-        return None
-    
-def validate_int(text, name, min_value=None, max_value=None, parent=None):
+        value = expected_type(text)
+    except (ValueError, TypeError):
+        return None, ValidationError(name, f"Expected {expected_type.__name__}, but got {text!r}.", text)
+    if min_value is not None and value < min_value:
+        return None, ValidationError(name, f"{name} must be at least {min_value}.", value)
+    if max_value is not None and value > max_value:
+        return None, ValidationError(name, f"{name} must be at most {max_value}.", value)
+    return value, None
+
+def _to_float_array(values):
+    """Convert a column to float64, turning unconvertible entries into NaN."""
     try:
-        value = int(text)
-        if min_value is not None and value < min_value:
-            raise ValueError(f"{name} must be at least {min_value}.")
-        if max_value is not None and value > max_value:
-            raise ValueError(f"{name} must be at most {max_value}.")
-        return value
-    except ValueError as e:
-        show_error(f"Invalid value for {name}: {e}", parent)
-        return None
-    
-def show_error(message, parent=None):
-    QMessageBox.warning(parent, "Input Error", message)
\ No newline at end of file
+        return np.asarray(values, dtype=np.float64)
+    except (ValueError, TypeError):
+        def convert(v):
+            try:
+                return float(v)
+            except (ValueError, TypeError):
+                return np.nan
+        return np.fromiter((convert(v) for v in values), dtype=np.float64)
+
+def validate_column(values, name, rule):
+    """
+    Checks a whole column of inputs against a rule in one vectorized pass.
+
+    Parameters:
+        values (array-like): The column to check (NumPy array, pandas Series, list)
+        name (str): The column name used in error messages
+        rule (ColumnRule): The constraints to check
+
+    Returns:
+        (numpy.ndarray of float64, list of ValidationError)
+    """
+    array = _to_float_array(values)
+    checks = [(np.isnan(array), f"Expected {rule.expected_type.__name__}.")]
+    if rule.expected_type == int:
+        checks.append((np.isfinite(array) & (array != np.floor(array)), "Expected a whole number."))
+    if rule.min_value is not None:
+        if rule.exclusive_min:
+            checks.append((array <= rule.min_value, f"{name} must be greater than {rule.min_value}."))
+        else:
+            checks.append((array < rule.min_value, f"{name} must be at least {rule.min_value}."))
+    if rule.max_value is not None:
+        if rule.exclusive_max:
+            checks.append((array >= rule.max_value, f"{name} must be less than {rule.max_value}."))
+        else:
+            checks.append((array > rule.max_value, f"{name} must be at most {rule.max_value}."))
+
+    raw = np.asarray(values, dtype=object)
+    errors = []
+    reported = np.zeros(array.shape, dtype=bool)
+    for failed, message in checks:
+        # report only the first failing check per row
+        failed = failed & ~reported
+        reported |= failed
+        errors.extend(ValidationError(name, message, raw[row], int(row)) for row in np.flatnonzero(failed))
+    errors.sort(key=lambda error: error.row)
+    return array, errors
+
+def validate_columns(table, rules):
+    """
+    Checks several columns of a table at once.
+
+    Parameters:
+        table (pandas.DataFrame or dict of array-like): The inputs, one column per name
+        rules (dict): Maps column names to ColumnRule; columns missing from the table are skipped
+
+    Returns:
+        list of ValidationError, ordered by column then row
+    """
+    errors = []
+    for name, rule in rules.items():
+        if name in table:
+            errors.extend(validate_column(table[name], name, rule)[1])
+    return errors
@@ -1,93 +1,571 @@
+import math
 import sys
+import numpy as np
 
 # import functions
-from PyQt6.QtWidgets import QApplication, QMainWindow, QMessageBox, QLabel, QLineEdit
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication, QFileDialog, QInputDialog, QMainWindow, QMessageBox
 
 # import generated ui class
 from ui.iphra_app_ui import Ui_MainWindow
 
 # import logic and validation functions
-from logic.tab2_samplesize import calculate_sample_size
-from logic.validators import validate_type, validate_int, validate_float
+from logic.dependencies import DependencyGraph
+from logic.presets import TEMPLATES, resolve_template
+from logic.tab2_cache import (
+    calculate_sample_size_cached,
+    calculate_sample_size_ind_to_hh_cached,
+    calculate_sample_size_mortality_rate_cached,
+)
+from logic.tab2_planning import plan_fieldwork, workday_minutes
+from logic.tab3_frame import load_sampling_frame
+from logic.tab3_replicates import simulate_replicate_draws
+from logic.tab3_sampling import draw_sample, sampling_results_table
+from logic.tab4_xlsform import HH_QUESTION_BANK
+from logic.tab5_ki_questions import TOOLS
+from logic.tab5_ki_tools import KI_TOOL_BANKS, KI_TOOL_LISTS, compile_tool, export_tool, export_tools
+from logic.tab6_import import ImportCache
+from logic.tab6_linked import import_workbook
+from logic.tab7_enumerators import GROUP_COLUMNS, GroupIndex, group_summaries
+from logic.tab7_incremental import QualityCache
+from logic.tab7_quality import QUALITY_SECTORS
+from logic.validators import check_number
+from ui.indicator_picker import IndicatorPicker
+from ui.live import DEBOUNCE_MSECS, LiveRecalculator
+from ui.models import DataFrameModel, SamplingFrameModel, SurveyDataModel
+from ui.qt_validators import validate_int, validate_float, show_error
+from ui.planning_dialog import FieldworkOptimizerDialog
+from ui.precision_dialog import PrecisionSimulationDialog
+from ui.preview_dialog import FormPreviewDialog
+from ui.sweep_dialog import SampleSizeSweepDialog
+from ui.tasks import TaskRunner
 
 class MainApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
+        self.tasks = TaskRunner(self)
 
     # Connect the button clicked signal to your handler function
         self.ui.ss_hh_calculate.clicked.connect(self.sample_size_handle_calculate)
+        self.ui.ss_ind_calculate.clicked.connect(self.sample_size_handle_calculate_ind)
+        self.ui.ss_mortality_calculate.clicked.connect(self.sample_size_handle_calculate_mortality)
+        self.ui.ss_hh_sweep.clicked.connect(self.sample_size_handle_sweep)
+        self.ui.ss_hh_simulate.clicked.connect(self.sample_size_handle_simulate)
+        self.ui.ss_planning_calculate.clicked.connect(self.planning_handle_calculate)
+        self.ui.ss_planning_optimize.clicked.connect(self.planning_handle_optimize)
+        # a cluster size chosen in the optimizer holds until the staffing is edited by hand
+        for edit in (self.ui.ss_planning_teams_input, self.ui.ss_mortality_enum_input, self.ui.ss_mortality_psu_input):
+            edit.textEdited.connect(lambda _: setattr(self, 'planning_cluster_size', None))
+        self.ui.sampling_load_sframe.clicked.connect(self.sampling_handle_load_frame)
+        self.ui.sampling_draw_sample.clicked.connect(self.sampling_handle_draw_sample)
+        self.ui.sampling_simulate_draws.clicked.connect(self.sampling_handle_simulate)
+        self.ui.sampling_export_sampling_results.clicked.connect(self.sampling_handle_export)
+
+        # the PSU filter is applied once typing pauses, not on every keystroke
+        self.sampling_filter_timer = QTimer(self)
+        self.sampling_filter_timer.setSingleShot(True)
+        self.sampling_filter_timer.setInterval(DEBOUNCE_MSECS)
+        self.sampling_filter_timer.timeout.connect(self.sampling_handle_filter)
+        self.ui.sampling_filter_input.textChanged.connect(lambda _: self.sampling_filter_timer.start())
+        self.ui.tool_design_add_indicator.clicked.connect(self.tool_design_handle_add)
+        self.ui.tool_design_remove_indicator.clicked.connect(self.tool_design_handle_remove)
+        self.ui.tool_design_export_xlsform.clicked.connect(self.tool_design_handle_export)
+        for tool in KI_TOOL_BANKS:
+            getattr(self.ui, f'ki_tool_{tool}_create_xlsform').clicked.connect(lambda _, tool=tool: self.ki_tool_handle_export(tool))
+        self.ki_tool_pickers = {}
+        for tool in KI_TOOL_LISTS:
+            picker = IndicatorPicker(getattr(self.ui, f'ki_tool_{tool}_indicator_list_full'),
+                                     getattr(self.ui, f'ki_tool_{tool}_indicator_list_ordered'), KI_TOOL_BANKS[tool],
+                                     getattr(self.ui, f'ki_tool_{tool}_indicator_search'))
+            getattr(self.ui, f'ki_tool_{tool}_add_indicator').clicked.connect(lambda _, picker=picker: picker.add())
+            getattr(self.ui, f'ki_tool_{tool}_remove_indicator').clicked.connect(lambda _, picker=picker: picker.remove())
+            self.ki_tool_pickers[tool] = picker
+        self.ui.ki_tool_create_all_xlsforms.clicked.connect(self.ki_tool_handle_export_all)
+        for template, action in zip(TEMPLATES, (self.ui.actionShort_IPHRA, self.ui.actionRecommended_IPHRA, self.ui.actionFull_IPHRA)):
+            action.triggered.connect(lambda _, template=template: self.tool_design_handle_template(template))
+        self.ui.actionPreview_HH_Tool.triggered.connect(self.tool_design_handle_preview)
+        for tool, action in (('communityki', self.ui.actionPreview_Community_KI_Tool), ('healthki', self.ui.actionPreview_Health_Service_KI_Tool),
+                             ('healthobs', self.ui.actionPreview_Health_Facility_Observation_Tool),
+                             ('fslki', self.ui.actionPreview_FSL_Provider_KI_Tool)):
+            action.triggered.connect(lambda _, tool=tool: self.ki_tool_handle_preview(tool))
+        self.ui.data_import_file_select.clicked.connect(self.data_import_handle_select_file)
+        self.ui.data_import_sheet_select_input.activated.connect(self.data_import_handle_select_sheet)
+        self.ui.quality_group_by_input.currentIndexChanged.connect(lambda _: self.quality_show_groups())
+
+        self.sample_size_live = self.sample_size_setup_live()
+        self.ui.ss_live_update.toggled.connect(self.sample_size_handle_live_toggled)
+
+        self.planning_cluster_size = None
+        self.sampling_frame = None
+        self.sampling_model = None
+        self.sampling_result = None
+        self.tool_design_picker = IndicatorPicker(self.ui.tool_design_indicator_list_full, self.ui.tool_design_indicator_list_ordered,
+                                                  HH_QUESTION_BANK, self.ui.tool_design_indicator_search)
+        self.data_import_cache = ImportCache()
+        self.data_import_survey = None
+        self.data_import_model = None
+        self.quality_cache = QualityCache()
+        self.quality_result = None
+        self.quality_groups = {}
+
+    def sample_size_setup_live(self):
+        # which calculator reads which input; the design radio buttons and total population feed all three
+        common = ['ss_total_pop_input', 'ss_srs_select', 'ss_systematic_select', 'ss_clustersampling']
+        nodes = {
+            'household': (common + ['ss_hh_prev_input', 'ss_hh_precision_input', 'ss_hh_deff_input', 'ss_hh_nonresponse_input'],
+                          self.sample_size_handle_calculate, [self.ui.ss_hh_result_value]),
+            'individual': (common + ['ss_ind_prev_input', 'ss_ind_precision_input', 'ss_ind_deff_input', 'ss_ind_nonresponse_input',
+                                     'ss_ind_hhsize_input', 'ss_ind_proppop_input'],
+                           self.sample_size_handle_calculate_ind, [self.ui.ss_ind_result_value, self.ui.ss_ind_hh_result_value]),
+            'mortality': (common + ['ss_mortality_rate_input', 'ss_mortality_precision_input', 'ss_mortality_deff_input',
+                                    'ss_mortality_days_input', 'ss_mortality_hhsize_input', 'ss_mortality_nonresponse_input'],
+                          self.sample_size_handle_calculate_mortality,
+                          [self.ui.ss_mortality_ind_value, self.ui.ss_mortality_persontime_value, self.ui.ss_mortality_hh_value]),
+            'planning': (['ss_planning_start_input', 'ss_planning_end_input', 'ss_planning_nonwork_input', 'ss_planning_interview_input',
+                          'ss_planning_travel_input', 'ss_planning_hh_input', 'ss_planning_teams_input', 'ss_mortality_enum_input',
+                          'ss_mortality_psu_input'],
+                         self.planning_handle_calculate, [self.ui.ss_planning_num_psu_value, self.ui.ss_planning_num_days_value]),
+        }
+        graph = DependencyGraph()
+        live = LiveRecalculator(graph, parent=self)
+        for node, (inputs, handler, outputs) in nodes.items():
+            graph.add(node, inputs)
+            live.set_handler(node, handler, outputs)
+        for name in {name for inputs, _, _ in nodes.values() for name in inputs}:
+            live.watch(name, getattr(self.ui, name))
+        live.enabled = self.ui.ss_live_update.isChecked()
+        return live
+
+    def sample_size_handle_live_toggled(self, checked):
+        self.sample_size_live.enabled = checked
+
+    def sample_size_design(self):
+        if self.ui.ss_clustersampling.isChecked() :
+            return 'clustered'
+        elif self.ui.ss_systematic_select.isChecked() :
+            return 'stratified'
+        return 'simple_random'
+
+    def sample_size_read_common(self):
+        population_size = validate_int(self.ui.ss_total_pop_input.text(), "Total Population", min_value=30, parent=self)
+        if population_size is None:
+            return None
+        return self.sample_size_design(), population_size
 
     def sample_size_handle_calculate(self):
-        try :
-            # Read inputs as strings
-            margin_of_error = self.ui.ss_hh_precision_input.text()
-            proportion = self.ui.ss_hh_prev_input.text()
-            design_effect = self.ui.ss_hh_deff_input.text()
-            non_response = self.ui.ss_hh_nonresponse_input.text()
-            population_size = self.ui.ss_total_pop_input.text()
-            if self.ui.ss_srs_select.isChecked() :
-                sample_design = 'simple_random'
-            elif self.ui.ss_systematic_select.isChecked() :
-                sample_design = 'stratified'
-            elif self.ui.ss_clustersampling.isChecked() :
-                sample_design = 'clustered'
-
-            # Validate input types
-            is_valid_sample_design, result_sample_design = validate_type(sample_design, str)
-            if not is_valid_sample_design : 
-                raise TypeError("Invalid input for argument sample_design provided. {result_sample_design}")
-            is_valid_population_size, result_population_size = validate_type(population_size, int)
-            if not validate_type(is_valid_population_size, int) == False :
-                raise TypeError("Invalid input for argument population_size provided. {result_population_size}")
-            is_valid_proportion, result_proportion = validate_type(proportion, float)
-            if not is_valid_proportion :
-                raise TypeError("Invalid input for argument proportion provided. {result_proportion}")
-            is_valid_margin_of_error, result_margin_of_error = validate_type(margin_of_error, float)
-            if not is_valid_margin_of_error :
-                raise TypeError("Invalid input for argument margin_of_error provided. {result_margin_of_error}")
-            is_valid_non_response, result_non_response = validate_type(non_response, float)
-            if not is_valid_non_response :
-                raise TypeError("Invalid input for argument non_response provided. {result_non_response}")
-            is_valid_design_effect, result_design_effect = validate_type(design_effect, int)
-            if not is_valid_design_effect :
-                raise TypeError("Invalid input for argument design_effect provided. {result_design_effect}")
-            
-            # Validate input values
-            if sample_design not in ['simple_random', 'stratified', 'cluster']:
-                raise ValueError("Invalid sample design type provided. Must be 'simple_random', 'stratified', or 'clustered'.")
-            
-            if not (0 < proportion < 1):
-                raise ValueError("Proportion must be between 0 and 1.")
-            if margin_of_error <= 0:
-                raise ValueError("Margin of error must be greater than 0.")
-            if not (0 < margin_of_error < 1):
-                raise ValueError("Margin of error must be between 0 and 1.")
-            if population_size <= 0:
-                raise ValueError("Population size must be greater than 0.")
-            if non_response <= 0:
-                raise ValueError("Non-response rate must be greater than 0.")
-            if design_effect < 1:
-                raise ValueError("Design effect must be at least 1 or higher.")
-            if population_size < 30:
-                raise ValueError("Population size must be at least 30 for sample size calculation.")
-    
-            # Call calculation function for sample size
-            result = calculate_sample_size(
-                sample_design=sample_design,
-                population_size=result_population_size,
-                proportion=result_proportion,
-                margin_of_error=result_margin_of_error,
-                non_response=result_non_response,
-                design_effect=result_design_effect
-            )
-
-            # Display result
-            self.ui.ss_hh_result_value.setText(str(result))
-
-        except ValueError:
-            QMessageBox.warning(self, "Input Error", "Please enter valid numeric inputs.")
+        common = self.sample_size_read_common()
+        if common is None:
+            return
+        sample_design, population_size = common
+
+        # Read and validate inputs; percentages are converted to proportions
+        proportion = validate_float(self.ui.ss_hh_prev_input.text(), "Estimated Prevalence (%)", 0, 100, parent=self)
+        margin_of_error = validate_float(self.ui.ss_hh_precision_input.text(), "Desired Precision (+/-)", 0.01, 100, parent=self)
+        design_effect = validate_float(self.ui.ss_hh_deff_input.text(), "Design Effect", 1, parent=self)
+        non_response = validate_float(self.ui.ss_hh_nonresponse_input.text(), "Non-Response Rate (%)", 0, 99, parent=self)
+        if None in (proportion, margin_of_error, design_effect, non_response):
+            return
+
+        # Calculate in the background and display the result when it arrives
+        self.ui.ss_hh_result_value.setText("...")
+        self.tasks.submit(
+            calculate_sample_size_cached,
+            sample_design, population_size, proportion / 100, margin_of_error / 100, non_response / 100, design_effect,
+            key='ss_hh',
+            on_result=lambda result: self.ui.ss_hh_result_value.setText(str(result)),
+            on_error=self.task_handle_error,
+        )
+
+    def sample_size_handle_calculate_ind(self):
+        common = self.sample_size_read_common()
+        if common is None:
+            return
+        sample_design, population_size = common
+
+        proportion = validate_float(self.ui.ss_ind_prev_input.text(), "Estimated Prevalence (%)", 0, 100, parent=self)
+        margin_of_error = validate_float(self.ui.ss_ind_precision_input.text(), "Desired Precision (+/-)", 0.01, 100, parent=self)
+        design_effect = validate_float(self.ui.ss_ind_deff_input.text(), "Design Effect", 1, parent=self)
+        non_response = validate_float(self.ui.ss_ind_nonresponse_input.text(), "Non-Response Rate (%)", 0, 99, parent=self)
+        household_size = validate_float(self.ui.ss_ind_hhsize_input.text(), "Mean Household Size", 0.1, parent=self)
+        prop_subpopulation = validate_float(self.ui.ss_ind_proppop_input.text(), "Percent sub-group in population (%)", 0.01, 100, parent=self)
+        if None in (proportion, margin_of_error, design_effect, non_response, household_size, prop_subpopulation):
+            return
+
+        parameters = (sample_design, population_size, proportion / 100, margin_of_error / 100, non_response / 100)
+        self.ui.ss_ind_result_value.setText("...")
+        self.ui.ss_ind_hh_result_value.setText("...")
+        self.tasks.submit(
+            lambda: (calculate_sample_size_cached(*parameters, design_effect),
+                     calculate_sample_size_ind_to_hh_cached(*parameters, household_size, prop_subpopulation / 100, design_effect)),
+            key='ss_ind',
+            on_result=self.sample_size_show_ind,
+            on_error=self.task_handle_error,
+        )
+
+    def sample_size_show_ind(self, result):
+        individuals, households = result
+        self.ui.ss_ind_result_value.setText(str(individuals))
+        self.ui.ss_ind_hh_result_value.setText(str(households))
+
+    def sample_size_handle_calculate_mortality(self):
+        common = self.sample_size_read_common()
+        if common is None:
+            return
+        sample_design, population_size = common
+
+        mortality_rate = validate_float(self.ui.ss_mortality_rate_input.text(), "Estimated Mortality Rate", 0, 10000, parent=self)
+        margin_of_error = validate_float(self.ui.ss_mortality_precision_input.text(), "Desired Precision (+/-)", 0.001, parent=self)
+        design_effect = validate_float(self.ui.ss_mortality_deff_input.text(), "Design Effect", 1, parent=self)
+        recall_period = validate_int(self.ui.ss_mortality_days_input.text(), "Days Recall Period", 1, parent=self)
+        household_size = validate_float(self.ui.ss_mortality_hhsize_input.text(), "Average Household Size", 0.1, parent=self)
+        non_response = validate_float(self.ui.ss_mortality_nonresponse_input.text(), "Non-Response Rate (%)", 0, 99, parent=self)
+        if None in (mortality_rate, margin_of_error, design_effect, recall_period, household_size, non_response):
+            return
+
+        for label in (self.ui.ss_mortality_ind_value, self.ui.ss_mortality_persontime_value, self.ui.ss_mortality_hh_value):
+            label.setText("...")
+        self.tasks.submit(
+            calculate_sample_size_mortality_rate_cached,
+            sample_design, population_size, mortality_rate, margin_of_error, recall_period, non_response / 100, household_size, design_effect,
+            key='ss_mortality',
+            on_result=lambda households: self.sample_size_show_mortality(households, household_size, recall_period),
+            on_error=self.task_handle_error,
+        )
+
+    def sample_size_show_mortality(self, households, household_size, recall_period):
+        individuals = math.ceil(households * household_size)
+        self.ui.ss_mortality_hh_value.setText(str(households))
+        self.ui.ss_mortality_ind_value.setText(str(individuals))
+        self.ui.ss_mortality_persontime_value.setText(f"{individuals * recall_period} person-days")
+
+    def task_handle_error(self, error):
+        show_error(f"Calculation failed: {error}", self)
+
+    def sample_size_handle_sweep(self):
+        common = self.sample_size_read_common()
+        if common is None:
+            return
+        sample_design, population_size = common
+        non_response = validate_float(self.ui.ss_hh_nonresponse_input.text() or "0", "Non-Response Rate (%)", 0, 99, parent=self)
+        if non_response is None:
+            return
+        dialog = SampleSizeSweepDialog(self.tasks, sample_design, population_size, non_response / 100, self)
+        dialog.exec()
+        dialog.deleteLater()
+
+    def sample_size_handle_simulate(self):
+        # prefill from the household calculator where its inputs are valid
+        defaults = {}
+        for name, edit in (('proportion', self.ui.ss_hh_prev_input), ('margin_of_error', self.ui.ss_hh_precision_input),
+                           ('design_effect', self.ui.ss_hh_deff_input)):
+            value, error = check_number(edit.text(), name, min_value=0)
+            if error is None:
+                defaults[name] = value
+        dialog = PrecisionSimulationDialog(self.tasks, parent=self, **defaults)
+        dialog.exec()
+        dialog.deleteLater()
+
+    def planning_read_workday(self):
+        start, end = self.ui.ss_planning_start_input.time(), self.ui.ss_planning_end_input.time()
+        nonwork_hours = validate_float(self.ui.ss_planning_nonwork_input.text() or "0", "# non-work hours per day", 0, 24, parent=self)
+        interview_minutes = validate_float(self.ui.ss_planning_interview_input.text(), "Avg. Interview Time + Walking to Next HH", 1, parent=self)
+        travel_minutes = validate_float(self.ui.ss_planning_travel_input.text() or "0", "Average Travel Time to Site", 0, parent=self)
+        households = validate_int(self.ui.ss_planning_hh_input.text(), "Households Needed", 1, parent=self)
+        if None in (nonwork_hours, interview_minutes, travel_minutes, households):
+            return None
+        try:
+            available_minutes = workday_minutes(start.hour() * 60 + start.minute(), end.hour() * 60 + end.minute(), nonwork_hours)
+        except ValueError as e:
+            show_error(str(e), self)
+            return None
+        return households, available_minutes, interview_minutes, travel_minutes
+
+    def planning_handle_calculate(self):
+        workday = self.planning_read_workday()
+        if workday is None:
+            return
+        households, available_minutes, interview_minutes, travel_minutes = workday
+        teams = validate_int(self.ui.ss_planning_teams_input.text(), "# of teams", 1, parent=self)
+        enumerators = validate_int(self.ui.ss_mortality_enum_input.text(), "# of enumerators / team", 1, parent=self)
+        psus_per_day = validate_int(self.ui.ss_mortality_psu_input.text(), "# of PSUs / Team / Day", 1, parent=self)
+        if None in (teams, enumerators, psus_per_day):
+            return
+
+        plan = plan_fieldwork(households, teams, enumerators, psus_per_day, available_minutes, interview_minutes, travel_minutes,
+                              self.planning_cluster_size)
+        if np.isnan(plan.num_days):
+            show_error("The working day is too short to complete any household after travelling to each PSU.", self)
+            return
+        self.ui.ss_planning_num_psu_value.setText(f"{int(plan.num_psus)} ({int(plan.cluster_size)} households each)")
+        self.ui.ss_planning_num_days_value.setText(str(int(plan.num_days)))
+
+    def planning_handle_optimize(self):
+        workday = self.planning_read_workday()
+        if workday is None:
+            return
+        dialog = FieldworkOptimizerDialog(*workday, parent=self)
+        accepted = dialog.exec()
+        dialog.deleteLater()
+        if accepted and dialog.selected_plan is not None:
+            teams, enumerators, psus_per_day, self.planning_cluster_size = dialog.selected_plan
+            self.ui.ss_planning_teams_input.setText(str(teams))
+            self.ui.ss_mortality_enum_input.setText(str(enumerators))
+            self.ui.ss_mortality_psu_input.setText(str(psus_per_day))
+            self.planning_handle_calculate()
+
+    def sampling_method(self):
+        if self.ui.sampling_clustersampling_select.isChecked() :
+            return 'pps'
+        elif self.ui.sampling_systematic_select.isChecked() :
+            return 'systematic'
+        return 'simple_random'
+
+    def sampling_handle_load_frame(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Load Sampling Frame", "", "CSV files (*.csv)")
+        if not path:
+            return
+        self.ui.statusbar.showMessage(f"Loading {path}...")
+        self.tasks.submit(load_sampling_frame, path, key='sampling_frame', with_progress=True,
+                          on_progress=self.sampling_show_load_progress,
+                          on_result=self.sampling_show_frame, on_error=self.task_handle_error)
+
+    def sampling_show_load_progress(self, done, total):
+        self.ui.statusbar.showMessage(f"Loading sampling frame... {100 * done // max(total, 1)}%")
+
+    def sampling_show_frame(self, frame):
+        self.sampling_frame = frame
+        self.sampling_result = None
+        self.sampling_model = SamplingFrameModel(frame, self.ui.sampling_table)
+        self.sampling_model.set_filter(self.ui.sampling_filter_input.text())
+        self.ui.sampling_table.setModel(self.sampling_model)
+        message = f"Loaded {len(frame):,} PSUs ({frame.schema.name_column} / {frame.schema.size_column})"
+        if frame.invalid_rows:
+            message += f", {frame.invalid_rows:,} rows without a valid population size"
+        self.ui.statusbar.showMessage(message)
+
+    def sampling_handle_filter(self):
+        if self.sampling_model is not None:
+            self.sampling_model.set_filter(self.ui.sampling_filter_input.text())
+
+    def sampling_handle_draw_sample(self):
+        if self.sampling_frame is None:
+            show_error("Please load a sampling frame first.", self)
+            return
+        frame = self.sampling_frame
+        n = validate_int(self.ui.sampling_num_psu_input.text(), "Number of Clusters/Primary Sampling Units", 1, len(frame), parent=self)
+        if n is None:
+            return
+        # record the seed so the draw can be reproduced
+        seed = int(np.random.SeedSequence().entropy % 2**32)
+        self.tasks.submit(draw_sample, self.sampling_method(), frame.populations, n, seed, key='sampling_draw',
+                          on_result=lambda result: self.sampling_show_sample(result, seed), on_error=self.task_handle_error)
+
+    def sampling_show_sample(self, result, seed):
+        selected, probabilities = result
+        self.sampling_result = (selected, probabilities, seed)
+        self.sampling_model.set_selected(selected)
+        self.ui.statusbar.showMessage(f"Selected {len(selected):,} PSUs (seed {seed})")
+
+    def sampling_handle_simulate(self):
+        if self.sampling_frame is None:
+            show_error("Please load a sampling frame first.", self)
+            return
+        frame = self.sampling_frame
+        n = validate_int(self.ui.sampling_num_psu_input.text(), "Number of Clusters/Primary Sampling Units", 1, len(frame), parent=self)
+        if n is None:
+            return
+        replicates, ok = QInputDialog.getInt(self, "Simulate Replicate Draws", "Number of replicate samples:", 1000, 10, 1_000_000)
+        if not ok:
+            return
+        method = self.sampling_method()
+        seed = int(np.random.SeedSequence().entropy % 2**32)
+        self.tasks.submit(simulate_replicate_draws, method, frame.populations, n, replicates, seed,
+                          key='sampling_simulate', with_progress=True,
+                          on_progress=lambda done, total: self.ui.statusbar.showMessage(f"Simulating draws... {done:,} of {total:,}"),
+                          on_result=lambda summary: self.sampling_show_simulation(summary, seed),
+                          on_error=self.task_handle_error)
+
+    def sampling_show_simulation(self, summary, seed):
+        self.ui.statusbar.showMessage(f"Simulated {summary.replicates:,} draws (seed {seed})")
+        message = (f"Replicate draws: {summary.replicates:,} (seed {seed})\n"
+                   f"Largest gap between empirical and design inclusion probability: {summary.max_probability_error:.4f}\n"
+                   f"Design weights: mean {summary.weight_mean:,.1f}, SD {summary.weight_sd:,.1f}, "
+                   f"range {summary.weight_min:,.1f} to {summary.weight_max:,.1f}\n"
+                   f"Estimated total population: mean {summary.total_mean:,.0f}, SD {summary.total_sd:,.0f}")
+        box = QMessageBox(QMessageBox.Icon.Information, "Replicate Draw Summary", message,
+                          QMessageBox.StandardButton.Save | QMessageBox.StandardButton.Close, self)
+        if box.exec() == QMessageBox.StandardButton.Save:
+            path, _ = QFileDialog.getSaveFileName(self, "Export Inclusion Probabilities", "inclusion_probabilities.csv", "CSV files (*.csv)")
+            if path:
+                summary.table(self.sampling_frame).to_csv(path, index=False)
+
+    def sampling_handle_export(self):
+        if self.sampling_result is None:
+            show_error("Please draw a sample first.", self)
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Sampling Results", "sampling_results.csv", "CSV files (*.csv)")
+        if not path:
+            return
+        selected, probabilities, seed = self.sampling_result
+        results = sampling_results_table(self.sampling_frame, selected, probabilities)
+        results['seed'] = seed
+        results.to_csv(path, index=False)
+
+    def tool_design_handle_add(self):
+        self.tool_design_picker.add()
+
+    def tool_design_handle_remove(self):
+        self.tool_design_picker.remove()
+
+    def tool_design_handle_export(self):
+        keys = self.tool_design_picker.selected_keys()
+        if not keys:
+            show_error("Please add at least one indicator to the tool.", self)
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Create XLSForm", "iphra_hh_tool.xlsx", "Excel files (*.xlsx)")
+        if not path:
+            return
+        self.ui.statusbar.showMessage(f"Writing {path}...")
+        self.tasks.submit(lambda: HH_QUESTION_BANK.compile_form(keys).write(path, "IPHRA Household Survey", "iphra_hh"),
+                          key='tool_design_export',
+                          on_result=lambda _: self.ui.statusbar.showMessage(f"XLSForm saved to {path}"),
+                          on_error=self.task_handle_error)
+
+    def tool_design_handle_preview(self):
+        keys = self.tool_design_picker.selected_keys()
+        if not keys:
+            show_error("Please add at least one indicator to the tool.", self)
+            return
+        dialog = FormPreviewDialog(HH_QUESTION_BANK.compile_form(keys), "IPHRA Household Survey", self)
+        dialog.exec()
+        dialog.deleteLater()
+
+    def tool_design_handle_template(self, template):
+        # fills the HH and KI tool builders with a preset, replacing their selections
+        selections = resolve_template(template)
+        self.tool_design_picker.set_keys(selections['hh'])
+        for tool, picker in self.ki_tool_pickers.items():
+            picker.set_keys(selections[tool])
+        self.ui.statusbar.showMessage(f"{template.capitalize()} IPHRA template applied to all tools")
+
+    def ki_tool_selection(self, tool):
+        # observation tools without an indicator list are always exported in full
+        return self.ki_tool_pickers[tool].selected_keys() if tool in self.ki_tool_pickers else None
+
+    def ki_tool_handle_export(self, tool):
+        keys = self.ki_tool_selection(tool)
+        if keys is not None and not keys:
+            show_error("Please add at least one indicator to the tool.", self)
+            return
+        form_id = TOOLS[tool]['form_id']
+        path, _ = QFileDialog.getSaveFileName(self, "Create XLSForm", f"{form_id}.xlsx", "Excel files (*.xlsx)")
+        if not path:
+            return
+        self.tasks.submit(export_tool, tool, path, keys, key=f'ki_tool_{tool}_export',
+                          on_result=lambda path: self.ui.statusbar.showMessage(f"XLSForm saved to {path}"),
+                          on_error=self.task_handle_error)
+
+    def ki_tool_handle_preview(self, tool):
+        keys = self.ki_tool_selection(tool)
+        if keys is not None and not keys:
+            show_error("Please add at least one indicator to the tool.", self)
+            return
+        dialog = FormPreviewDialog(compile_tool(tool, keys), TOOLS[tool]['title'], self)
+        dialog.exec()
+        dialog.deleteLater()
+
+    def ki_tool_handle_export_all(self):
+        directory = QFileDialog.getExistingDirectory(self, "Create All XLSForms")
+        if not directory:
+            return
+        # builders with an empty selection are skipped
+        selections = {tool: self.ki_tool_selection(tool) for tool in KI_TOOL_BANKS}
+        selections = {tool: keys for tool, keys in selections.items() if keys is None or keys}
+        self.tasks.submit(export_tools, selections, directory, key='ki_tool_export_all', with_progress=True,
+                          on_progress=lambda done, total: self.ui.statusbar.showMessage(f"Writing XLSForms... {done} of {total}"),
+                          on_result=lambda paths: self.ui.statusbar.showMessage(f"{len(paths)} XLSForms saved to {directory}"),
+                          on_error=self.task_handle_error)
+
+    def data_import_handle_select_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import IPHRA HH Survey Excel File", "", "Excel files (*.xlsx *.xlsm)")
+        if not path:
+            return
+        self.ui.statusbar.showMessage(f"Importing {path}...")
+        self.tasks.submit(import_workbook, path, self.data_import_cache, key='data_import', with_progress=True,
+                          on_progress=lambda done, total: self.ui.statusbar.showMessage(f"Importing sheets... {done} of {total}"),
+                          on_result=self.data_import_show_survey, on_error=self.task_handle_error)
+
+    def data_import_show_survey(self, survey):
+        self.data_import_survey = survey
+        combo = self.ui.data_import_sheet_select_input
+        combo.clear()
+        combo.addItem("Select excel sheet...")
+        combo.addItems(list(survey.tables))
+        combo.setCurrentText(survey.main)
+        self.data_import_show_sheet(survey.main)
+        message = f"Imported {len(survey):,} records from {survey.main}"
+        for sheet in survey.repeats:
+            message += f"; {sheet}: {len(survey.table(sheet)):,} rows"
+            if survey.orphans(sheet):
+                message += f" ({survey.orphans(sheet):,} without a parent record)"
+        if not survey.linked:
+            message += "; sheets not linked (no sheet has an _index column without a _parent_index column)"
+        self.ui.statusbar.showMessage(message)
+        self.quality_handle_run()
+
+    def data_import_handle_select_sheet(self, index):
+        # item 0 is the placeholder
+        if index > 0 and self.data_import_survey is not None:
+            self.data_import_show_sheet(self.ui.data_import_sheet_select_input.itemText(index))
+
+    def data_import_show_sheet(self, sheet):
+        self.data_import_model = SurveyDataModel(self.data_import_survey.table(sheet), parent=self.ui.data_import_viewer)
+        self.ui.data_import_viewer.setModel(self.data_import_model)
+
+    def quality_handle_run(self):
+        if self.data_import_survey is None:
+            return
+        # the cache re-evaluates only the submissions that are new since the previous import
+        self.tasks.submit(self.quality_cache.update, self.data_import_survey, key='quality', on_result=self.quality_show_results,
+                          on_error=self.task_handle_error)
+
+    def quality_show_results(self, update):
+        result = self.quality_result = update.result
+        self.quality_groups = update.groups
+        if not update.full:
+            self.ui.statusbar.showMessage(f"Data quality: evaluated {update.evaluated:,} new or changed submissions, "
+                                          f"{update.removed:,} removed")
+        for sector in QUALITY_SECTORS:
+            table = getattr(self.ui, f'quality_{sector}_summary_table')
+            table.setModel(DataFrameModel(result.summary(sector), table))
+            table.resizeColumnToContents(0)
+        self.quality_show_groups()
+
+    def quality_show_groups(self):
+        if self.quality_result is None:
+            return
+        column = GROUP_COLUMNS[self.ui.quality_group_by_input.currentIndex()]
+        if column in self.quality_groups:
+            groups, flagged, checked = self.quality_groups[column]
+            summaries = group_summaries(self.quality_result, groups.survey, groups, counts=(flagged, checked))
+        else:
+            try:
+                groups = GroupIndex(self.data_import_survey, column)
+            except ValueError as error:
+                self.ui.statusbar.showMessage(str(error))
+                summaries = {}
+            else:
+                summaries = group_summaries(self.quality_result, self.data_import_survey, groups)
+        for sector in QUALITY_SECTORS:
+            table = getattr(self.ui, f'quality_{sector}_summary_table_enum')
+            table.setModel(DataFrameModel(summaries[sector], table) if sector in summaries else None)
+
+    def closeEvent(self, event):
+        self.tasks.cancel_all()
+        self.tasks.wait()
+        super().closeEvent(event)
 
 def main():
     app = QApplication(sys.argv)
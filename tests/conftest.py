@@ -0,0 +1,10 @@
+import numpy as np
+from logic.tab6_import import StringArray, SurveyColumn
+
+def number(values):
+    return SurveyColumn('number', np.asarray(values, dtype=np.float64))
+
+def category(values, labels):
+    # codes as narrow as read_sheet stores them
+    codes = np.asarray(values).astype(np.min_scalar_type(-max(len(labels), 1)))
+    return SurveyColumn('category', codes, StringArray.from_strings(labels))
@@ -0,0 +1,41 @@
+import pytest
+import numpy as np
+from logic.tab2_allocation import allocate_stratified_sample, allocate_strata
+from logic.tab2_samplesize import calculate_sample_size
+
+def test_allocate_stratified_sample_single_stratum_matches_calculate_sample_size():
+    n0 = (1.96**2 * 0.5 * (1-0.5)) / (0.05**2)
+    result = allocate_stratified_sample([20000], [0.5], n0, "proportional", 1.5, 0.1)
+    expected = calculate_sample_size("stratified", 20000, 0.5, 0.05, 0.1, 1.5)
+    assert result.tolist() == [expected]
+
+def test_allocate_stratified_sample_equal_allocation():
+    result = allocate_stratified_sample([1e9, 1e9, 1e9, 1e9], [0.1, 0.2, 0.3, 0.4], 400, "equal")
+    assert result.tolist() == [100, 100, 100, 100]
+
+def test_allocate_stratified_sample_proportional_allocation():
+    result = allocate_stratified_sample([1e9, 3e9], [0.5, 0.5], 400, "proportional")
+    assert result.tolist() == [100, 300]
+
+def test_allocate_stratified_sample_neyman_favours_variable_strata():
+    result = allocate_stratified_sample([1e9, 1e9], [0.5, 0.05], 1000, "neyman")
+    assert result[0] > result[1]
+
+def test_allocate_stratified_sample_capped_at_population():
+    result = allocate_stratified_sample([10, 100000], [0.5, 0.5], 5000, "equal", 2, 0.2)
+    assert result[0] == 10
+
+def test_allocate_stratified_sample_invalid_method():
+    with pytest.raises(ValueError):
+        allocate_stratified_sample([1000], [0.5], 100, "bogus")
+
+def test_allocate_strata_many_strata():
+    rng = np.random.default_rng(1)
+    strata = {
+        "population_size": rng.integers(500, 50000, 10000),
+        "proportion": rng.uniform(0.05, 0.5, 10000),
+        "design_effect": rng.uniform(1, 2, 10000),
+    }
+    result = allocate_strata(strata, 50000)
+    assert set(result) == {"proportional", "equal", "neyman"}
+    assert all(len(sizes) == 10000 for sizes in result.values())
@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+import pandas as pd
+import pytest
+from logic.tab2_batch import calculate_scenarios, run_scenarios
+from logic.tab2_samplesize import calculate_sample_size, calculate_sample_size_mortality_rate
+
+def test_calculate_scenarios_household():
+    scenarios = pd.DataFrame({
+        "population_size": [1000, 20000],
+        "proportion": [0.5, 0.3],
+        "margin_of_error": [0.05, 0.05],
+        "non_response": [0.1, 0.1],
+    })
+    result = calculate_scenarios(scenarios)
+    assert result["sample_size"].tolist() == [
+        calculate_sample_size("simple_random", 1000, 0.5, 0.05, 0.1),
+        calculate_sample_size("simple_random", 20000, 0.3, 0.05, 0.1),
+    ]
+
+def test_calculate_scenarios_missing_column():
+    with pytest.raises(ValueError):
+        calculate_scenarios(pd.DataFrame({"population_size": [1000]}), "mortality")
+
+def test_run_scenarios_streams_in_chunks(tmp_path):
+    scenarios = pd.DataFrame({
+        "sample_design": ["clustered"] * 5,
+        "population_size": [100000] * 5,
+        "mortality_rate": [0.5, 1.0, 1.5, 2.0, 2.5],
+        "margin_of_error": [0.4] * 5,
+        "recall_period": [90] * 5,
+        "non_response": [0.05] * 5,
+        "household_size": [5.5] * 5,
+        "design_effect": [1.5] * 5,
+    })
+    input_path = tmp_path / "scenarios.csv"
+    output_path = tmp_path / "results.csv"
+    scenarios.to_csv(input_path, index=False)
+
+    rows = run_scenarios(str(input_path), str(output_path), "mortality", chunksize=2)
+
+    result = pd.read_csv(output_path)
+    assert rows == 5
+    assert result["sample_size"].tolist() == [
+        calculate_sample_size_mortality_rate("clustered", 100000, r, 0.4, 90, 0.05, 5.5, 1.5)
+        for r in scenarios["mortality_rate"]
+    ]
+
+def test_cli_does_not_import_qt():
+    code = "import sys, cli; print('PyQt6' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+    assert output.strip() == "False"
+
+def test_calculate_scenarios_rejects_invalid_values():
+    scenarios = pd.DataFrame({
+        "population_size": [1000, 20000],
+        "proportion": [0.5, 1.3],
+        "margin_of_error": [0.05, 0],
+        "non_response": [0.1, 0.1],
+    })
+    with pytest.raises(ValueError, match="2 invalid scenario values"):
+        calculate_scenarios(scenarios)
+
+def test_parquet_without_pyarrow_is_a_value_error(tmp_path, monkeypatch, capsys):
+    import cli
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+    input_path = tmp_path / "scenarios.csv"
+    pd.DataFrame({"population_size": [1000], "proportion": [0.5], "margin_of_error": [0.05],
+                  "non_response": [0.1]}).to_csv(input_path, index=False)
+    with pytest.raises(ValueError, match="pyarrow"):
+        run_scenarios(str(input_path), str(tmp_path / "results.parquet"))
+    with pytest.raises(ValueError, match="pyarrow"):
+        run_scenarios(str(tmp_path / "scenarios.parquet"), str(tmp_path / "results.csv"))
+    assert cli.main([str(input_path), str(tmp_path / "results.parquet")]) == 1
+    assert "pyarrow" in capsys.readouterr().err
@@ -0,0 +1,66 @@
+import numpy as np
+from logic.tab2_cache import SampleSizeCache
+from logic.tab2_samplesize import calculate_sample_size, calculate_sample_size_ind_to_hh
+
+def test_cache_normalizes_keys():
+    cache = SampleSizeCache()
+    first = cache.calculate("household", "clustered", 20000, 0.5, 0.05, 0.1, 1.5)
+    second = cache.calculate("household", " Clustered", "20000", "0.5", np.float64(0.05), 0.1, 1.5)
+    assert first == second == calculate_sample_size("clustered", 20000, 0.5, 0.05, 0.1, 1.5)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+def test_cache_evicts_least_recently_used():
+    cache = SampleSizeCache(maxsize=2)
+    cache.calculate("household", "simple_random", 20000, 0.1, 0.05, 0.1)
+    cache.calculate("household", "simple_random", 20000, 0.2, 0.05, 0.1)
+    cache.calculate("household", "simple_random", 20000, 0.1, 0.05, 0.1)
+    cache.calculate("household", "simple_random", 20000, 0.3, 0.05, 0.1)
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+    cache.calculate("household", "simple_random", 20000, 0.1, 0.05, 0.1)
+    assert cache.stats()["hits"] == 2
+
+def test_cache_batch_matches_scalar_and_reuses_entries():
+    cache = SampleSizeCache()
+    proportions = np.array([0.1, 0.2, 0.1, 0.3, 0.2])
+    result = cache.calculate_batch("individual", "clustered", 20000, proportions, 0.05, 0.1, 5.0, 0.2, 1.5)
+    expected = [calculate_sample_size_ind_to_hh("clustered", 20000, p, 0.05, 0.1, 5.0, 0.2, 1.5) for p in proportions]
+    assert result.tolist() == expected
+    assert cache.stats()["misses"] == 3
+    assert cache.stats()["hits"] == 2
+
+    cache.calculate("individual", "clustered", 20000, 0.3, 0.05, 0.1, 5.0, 0.2, 1.5)
+    assert cache.stats()["hits"] == 3
+
+def test_cache_batch_larger_than_cache_is_computed_without_evicting():
+    cache = SampleSizeCache(maxsize=4)
+    proportions = np.linspace(0.05, 0.5, 50)
+    cache.calculate("household", "simple_random", 20000, 0.6, 0.05, 0.1, 1)
+    result = cache.calculate_batch("household", "simple_random", 20000, proportions, 0.05, 0.1, 1)
+    assert result.tolist() == [calculate_sample_size("simple_random", 20000, p, 0.05, 0.1, 1) for p in proportions]
+    assert len(cache) == 1
+    assert cache.stats()["evictions"] == 0
+    assert (cache.stats()["misses"], cache.stats()["bypassed"]) == (1, 50)
+    cache.calculate("household", "simple_random", 20000, 0.6, 0.05, 0.1, 1)
+    assert cache.stats()["hits"] == 1
+
+def test_cache_batch_caches_distinct_rows_of_a_large_batch():
+    cache = SampleSizeCache(maxsize=8)
+    proportions = np.tile([0.1, 0.2, 0.3], 100)[:, None]
+    margins = np.array([0.05, 0.1])
+    result = cache.calculate_batch("household", "simple_random", 20000, proportions, margins, 0.1, 1)
+    assert result.shape == (300, 2)
+    assert result[:3].tolist() == [[calculate_sample_size("simple_random", 20000, p, m, 0.1, 1) for m in margins]
+                                   for p in (0.1, 0.2, 0.3)]
+    assert len(cache) == 6
+    assert cache.stats()["misses"] == 6
+    assert cache.stats()["hits"] == 594
+    assert cache.stats()["bypassed"] == 0
+
+def test_cache_batch_accepts_an_array_of_designs():
+    cache = SampleSizeCache()
+    designs = np.array(["clustered", "Simple_Random", "clustered"], dtype=object)
+    result = cache.calculate_batch("household", designs, 20000, 0.3, 0.05, 0.1, 1.5)
+    assert result.tolist() == [calculate_sample_size(d.lower(), 20000, 0.3, 0.05, 0.1, 1.5) for d in designs]
@@ -0,0 +1,25 @@
+import pytest
+from logic.dependencies import DependencyGraph
+
+def make_graph():
+    graph = DependencyGraph()
+    graph.add('household', ['population', 'design', 'hh_prevalence'])
+    graph.add('individual', ['population', 'design', 'ind_prevalence'])
+    graph.add('planning', ['household', 'teams'])
+    return graph
+
+def test_affected_only_includes_dependents():
+    graph = make_graph()
+    assert graph.affected(['hh_prevalence']) == ['household', 'planning']
+    assert graph.affected(['ind_prevalence']) == ['individual']
+    assert graph.affected(['teams']) == ['planning']
+    assert graph.affected(['unrelated']) == []
+
+def test_affected_is_in_dependency_order():
+    graph = make_graph()
+    assert graph.affected(['teams', 'population']) == ['household', 'individual', 'planning']
+
+def test_duplicate_node_is_rejected():
+    graph = make_graph()
+    with pytest.raises(ValueError):
+        graph.add('household', ['population'])
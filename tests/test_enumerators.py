@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from logic.tab6_import import SurveyColumn, SurveyData
+from logic import tab7_enumerators
+from logic.tab6_linked import LinkedSurvey
+from logic.tab7_enumerators import GroupIndex, digit_preference_scores, group_summaries
+from logic.tab7_quality import QUALITY_SECTORS, run_checks
+from tests.conftest import category, number
+
+@pytest.fixture
+def survey():
+    start = np.array(['2024-05-01T08:00'] * 5, dtype='datetime64[s]')
+    main = {
+        '_index': number([1, 2, 3, 4, 5]),
+        'start': SurveyColumn('datetime', start),
+        'end': SurveyColumn('datetime', start + np.array([40, 10, 50, 30, 20], dtype='timedelta64[m]')),
+        'consent': category([1, 1, 1, 1, 1], ['no', 'yes']),
+        'team_id': category([0, 0, 1, 1, -1], ['A', 'B']),
+        'enum_id': number([12, 3, 3, 12, np.nan]),
+        'hh_size': number([2, 1, 45, 4, 3]),
+    }
+    roster = {
+        '_index': number([1, 2, 3, 4, 5, 6]),
+        '_parent_index': number([1, 1, 2, 3, 4, 9]),
+        'member_age_years': number([30, 120, 40, 25, 20, 50]),
+    }
+    return LinkedSurvey({'main': SurveyData(main, 5, 'main'), 'roster': SurveyData(roster, 6, 'roster')})
+
+def test_group_index_encodes_numbers_and_categories(survey):
+    enumerators = GroupIndex(survey, 'enum_id')
+    assert enumerators.labels == ['3', '12']
+    assert enumerators.codes.tolist() == [1, 0, 0, 1, -1]
+    assert enumerators.rows('roster').tolist() == [1, 1, 0, 0, 1, -1]
+    teams = GroupIndex(survey, 'team_id')
+    assert teams.labels == ['A', 'B']
+    assert teams.codes.tolist() == [0, 0, 1, 1, -1]
+    with pytest.raises(ValueError):
+        GroupIndex(survey, 'supervisor_id')
+
+def test_group_summary_by_enumerator(survey):
+    summary = group_summaries(run_checks(survey), survey, GroupIndex(survey, 'enum_id'))['general'].set_index('enum_id')
+    assert summary['Interviews'].tolist() == [2, 2]
+    assert summary['Median Interview (min)'].tolist() == [30.0, 35.0]
+    assert summary.loc['3', '% Household size outside 1-40'] == 50.0
+    assert summary.loc['12', '% Household size outside 1-40'] == 0.0
+    # enumerator 3 has one roster member over 110 among two
+    assert summary.loc['3', '% Member age outside 0-110 years'] == 0.0
+    assert summary.loc['12', '% Member age outside 0-110 years'] == pytest.approx(100 / 3, abs=0.1)
+    assert summary.loc['12', 'SD hh_size'] == pytest.approx(np.std([2, 4], ddof=1), abs=0.01)
+    assert 'Digit Preference member_age_years' in summary.columns
+    with pytest.raises(ValueError):
+        group_summaries(run_checks(survey), survey, GroupIndex(survey, 'enum_id'), ['protection'])
+
+def test_group_summary_by_team_matches_totals(survey):
+    result = run_checks(survey)
+    summaries = group_summaries(result, survey, GroupIndex(survey, 'team_id'))
+    assert set(summaries) == set(QUALITY_SECTORS)
+    summary = summaries['general']
+    assert summary['team_id'].tolist() == ['A', 'B']
+    assert summary['Interviews'].sum() == 4
+
+def test_group_summaries_decode_measurements_once_per_survey(survey, monkeypatch):
+    result = run_checks(survey)
+    first = group_summaries(result, survey, GroupIndex(survey, 'team_id'))
+    enumerators = GroupIndex(survey, 'enum_id')
+    decoded = []
+    monkeypatch.setattr(tab7_enumerators, 'SheetColumns', lambda *args: decoded.append(args))
+    again = group_summaries(result, survey, enumerators)
+    assert decoded == []
+    assert again['general'].columns.tolist()[1:] == first['general'].columns.tolist()[1:]
+    assert again['general']['SD hh_size'].notna().any()
+
+def test_reduce_skips_unlinked_rows(survey):
+    enumerators = GroupIndex(survey, 'enum_id')
+    matrix = np.ones((6, 2), dtype=bool)
+    assert enumerators.reduce('roster', matrix).tolist() == [[2, 2], [3, 3]]
+    teams = GroupIndex(survey, 'team_id')
+    assert teams.reduce('roster', matrix).tolist() == [[3, 3], [2, 2]]
+
+def test_digit_preference_scores():
+    codes = np.repeat([0, 1], 100)
+    values = np.concatenate([np.arange(100), np.full(100, 120.0)])
+    scores = digit_preference_scores(codes, values, 3)
+    assert scores[0] == 0
+    assert scores[1] == 100
+    assert np.isnan(scores[2])
@@ -0,0 +1,63 @@
+import pytest
+import numpy as np
+from logic.tab3_frame import load_sampling_frame, sniff_frame
+
+def write(tmp_path, text, encoding="utf-8"):
+    path = tmp_path / "frame.csv"
+    path.write_bytes(text.encode(encoding))
+    return str(path)
+
+def test_sniff_frame_detects_delimiter_and_columns(tmp_path):
+    path = write(tmp_path, "code;Village Name;Population\n1;Alpha;120\n2;Beta;340\n")
+    schema = sniff_frame(path)
+    assert schema.delimiter == ";"
+    assert schema.encoding == "utf-8"
+    assert schema.name_column == "Village Name"
+    assert schema.size_column == "Population"
+
+def test_sniff_frame_detects_latin1_and_bom(tmp_path):
+    assert sniff_frame(write(tmp_path, "name,pop\nBéni,10\n", "latin-1")).encoding == "latin-1"
+    assert sniff_frame(write(tmp_path, "﻿name,pop\nBéni,10\n")).encoding == "utf-8-sig"
+
+def test_sniff_frame_unknown_column(tmp_path):
+    with pytest.raises(ValueError):
+        sniff_frame(write(tmp_path, "name,pop\nA,10\n"), size_column="households")
+
+def test_load_sampling_frame_streams_chunks(tmp_path):
+    rows = "\n".join(f"PSU {i},{i * 10}" for i in range(1000))
+    path = write(tmp_path, "psu_name,population\n" + rows + "\n")
+    progress = []
+    frame = load_sampling_frame(path, chunksize=100, progress=lambda done, total: progress.append((done, total)))
+    assert len(frame) == 1000
+    assert frame.populations.dtype == np.int32
+    assert frame.name_codes.dtype == np.int32
+    assert frame.name(999) == "PSU 999"
+    assert frame.populations[999] == 9990
+    assert len(progress) == 10
+    assert progress[-1][0] == progress[-1][1]
+
+def test_load_sampling_frame_counts_invalid_sizes(tmp_path):
+    path = write(tmp_path, "name,pop\nA,10\nB,\nC,abc\nA,-5\n")
+    frame = load_sampling_frame(path)
+    assert frame.populations.tolist() == [10, 0, 0, 0]
+    assert frame.invalid_rows == 3
+    assert frame.names(slice(None)) == ["A", "B", "C", "A"]
+    assert len(frame.name_labels) == 3
+
+def test_load_sampling_frame_merges_names_across_chunks(tmp_path):
+    path = write(tmp_path, "name,pop\nB,1\nA,2\nC,3\nB,4\nA,5\n")
+    frame = load_sampling_frame(path, chunksize=2)
+    assert frame.name_labels.tolist() == ["A", "B", "C"]
+    assert frame.names(slice(None)) == ["B", "A", "C", "B", "A"]
+
+def test_load_sampling_frame_packs_unique_names(tmp_path):
+    rows = "\n".join(f"Village {i}{'x' * (i % 50)},{i}" for i in range(2000))
+    frame = load_sampling_frame(write(tmp_path, "name,pop\n" + rows + "\n"), chunksize=300)
+    assert frame.names([0, 1999, 0]) == ["Village 0", "Village 1999" + "x" * 49, "Village 0"]
+    assert frame.name_labels.data.nbytes == sum(len(name) for name in frame.names(slice(None)))
+
+def test_load_sampling_frame_folds_names_for_search(tmp_path):
+    path = write(tmp_path, "name,pop\nBÉNI,1\nAlpha,2\nStraße,3\nBÉNI,4\nZed,5\n")
+    frame = load_sampling_frame(path, chunksize=2)
+    assert frame.name_labels.tolist() == ["Alpha", "BÉNI", "Straße", "Zed"]
+    assert frame.folded_labels.tolist() == ["alpha", "béni", "strasse", "zed"]
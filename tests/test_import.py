@@ -0,0 +1,116 @@
+from datetime import datetime
+import numpy as np
+import pytest
+from openpyxl import Workbook
+from logic.tab6_import import ImportCache, StringArray, import_sheet, list_sheets, read_sheet
+
+ROWS = [
+    ('start', 'enumerator', 'hh_size', 'q', 'q', None, 'empty'),
+    (datetime(2024, 5, 1, 8, 30), 'ali', 5, 'yes', 1, 'a', None),
+    (None, None, None, None, None, None, None),
+    (datetime(2024, 5, 1, 9, 0), 'ben', 3.5, 'no', 2, None, None),
+    (None, 'ali', None, '', 'other', 'b', None),
+]
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / 'survey.xlsx'
+    book = Workbook()
+    book.active.title = 'main'
+    for row in ROWS:
+        book.active.append(row)
+    book.create_sheet('roster').append(('_index', '_parent_index'))
+    book.save(path)
+    return str(path)
+
+def test_list_sheets(workbook, tmp_path):
+    assert list_sheets(workbook) == ['main', 'roster']
+    (tmp_path / 'notes.txt').write_text('not a workbook')
+    with pytest.raises(ValueError):
+        list_sheets(str(tmp_path / 'notes.txt'))
+
+def test_read_sheet_types_columns(workbook):
+    data = read_sheet(workbook, 'main')
+    assert len(data) == 3
+    assert data.names == ['start', 'enumerator', 'hh_size', 'q', 'q.1', 'column_6', 'empty']
+    assert data.column('start').kind == 'datetime'
+    assert data.column('start').text(slice(None)) == ['2024-05-01 08:30:00', '2024-05-01 09:00:00', '']
+    assert data.column('hh_size').kind == 'number'
+    assert data.column('hh_size').text(slice(None)) == ['5', '3.5', '']
+    enumerator = data.column('enumerator')
+    assert enumerator.kind == 'category' and enumerator.values.dtype == np.int8
+    assert enumerator.labels.tolist() == ['ali', 'ben'] and enumerator.values.tolist() == [0, 1, 0]
+    assert data.column('q').missing().tolist() == [False, False, True]
+    assert data.column('q.1').text(slice(None)) == ['1', '2', 'other']
+
+def test_mixed_chunks_become_categories(workbook):
+    # one row per chunk, so 'q.1' is numeric in the first two chunks and text in the last
+    data = read_sheet(workbook, 'main', chunk_cells=1)
+    column = data.column('q.1')
+    assert column.kind == 'category'
+    assert column.labels.tolist() == ['1', '2', 'other']
+    assert column.text([2, 0]) == ['other', '1']
+    assert data.column('empty').missing().all()
+
+def test_read_sheet_reports_progress(workbook):
+    calls = []
+    read_sheet(workbook, 'main', chunk_cells=7, progress=lambda done, total: calls.append((done, total)))
+    assert calls[-1] == (3, 3)
+
+def test_unknown_sheet(workbook):
+    with pytest.raises(ValueError):
+        read_sheet(workbook, 'deaths')
+
+def test_string_array_round_trip():
+    strings = StringArray.from_strings(['', 'é', 'long answer'])
+    assert strings.tolist() == ['', 'é', 'long answer'] and strings.nbytes == strings.data.nbytes + 32
+
+def test_string_array_unique_sorts_on_packed_bytes():
+    strings = ['district 10', 'b', '', 'district 1', 'é', 'b', 'district 10 north', 'a\0', 'a']
+    chunks = StringArray.concatenate([StringArray.from_strings(strings[:4]), StringArray.from_strings(strings[4:])])
+    labels, inverse = chunks.unique()
+    assert labels.tolist() == sorted(set(strings))
+    assert [labels.tolist()[i] for i in inverse] == strings
+    assert labels.take([2, 0]).tolist() == [labels.tolist()[2], '']
+
+def test_string_array_contains_stays_within_strings():
+    strings = StringArray.from_strings(['ab', '', 'cab', 'béni'])
+    assert strings.contains('ab').tolist() == [True, False, True, False]
+    assert strings.contains('bc').tolist() == [False, False, False, False]
+    assert strings.contains('én').tolist() == [False, False, False, True]
+    assert strings.contains('').all()
+
+def test_import_cache_memory_maps_second_import(workbook, tmp_path):
+    cache = ImportCache(str(tmp_path / 'cache'))
+    first = import_sheet(workbook, 'main', cache)
+    assert cache.load(workbook, 'roster') is None
+    second = import_sheet(workbook, 'main', cache)
+    assert isinstance(second.column('hh_size').values, np.memmap)
+    for name in first.names:
+        assert first.column(name).kind == second.column(name).kind
+        assert first.column(name).text(slice(None)) == second.column(name).text(slice(None))
+    assert len(import_sheet(workbook, 'roster', cache)) == 0
+
+def test_import_cache_prunes_least_recently_used_files(tmp_path):
+    paths = []
+    for day in range(3):
+        path = tmp_path / f'export_{day}.xlsx'
+        book = Workbook()
+        book.active.title = 'main'
+        for row in ROWS:
+            book.active.append(row)
+        book.active.append((None, f'day {day}'))
+        book.save(path)
+        paths.append(str(path))
+
+    cache = ImportCache(str(tmp_path / 'cache'))
+    import_sheet(paths[0], 'main', cache)
+    entry_bytes = sum(f.stat().st_size for f in (tmp_path / 'cache').rglob('*') if f.is_file())
+    cache.max_bytes = entry_bytes * 3 // 2
+    import_sheet(paths[1], 'main', cache)
+    assert cache.load(paths[0], 'main') is None
+    assert cache.load(paths[1], 'main') is not None
+    cache.max_bytes = 0
+    import_sheet(paths[2], 'main', cache)
+    assert cache.load(paths[1], 'main') is None
+    assert cache.load(paths[2], 'main') is not None
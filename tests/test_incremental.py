@@ -0,0 +1,160 @@
+import numpy as np
+from logic.tab6_import import SurveyColumn, SurveyData
+from logic.tab6_linked import LinkedSurvey
+from logic.tab7_enumerators import GroupIndex
+from logic.tab7_incremental import QualityCache
+from logic.tab7_quality import CHECKS, run_checks
+from tests.conftest import category, number
+
+def households(seed, count):
+    """Random households with their roster members, identified by uuids unique to the seed."""
+    rng = np.random.default_rng(seed)
+    start = np.datetime64('2024-05-01T08:00') + rng.integers(0, 86400, count).astype('timedelta64[s]')
+    size = rng.integers(1, 6, count)
+    main = {
+        '_uuid': np.array([f'{seed}-{i}' for i in range(count)], dtype=object),
+        'start': start,
+        'end': start + rng.integers(5, 60, count).astype('timedelta64[m]'),
+        'consent': rng.choice(['yes', 'yes', 'no'], count),
+        'team_id': rng.integers(1, 4, count),
+        'enum_id': rng.integers(1, 9, count),
+        'cluster_id': rng.integers(1, 5, count),
+        'hh_id': rng.integers(1, 40, count),
+        'hh_size': np.where(rng.random(count) < 0.1, size + 1, size),
+        'fcs': rng.normal(45, 15, count),
+    }
+    roster = {
+        'household': np.repeat(np.arange(count), size),
+        'member_age_years': rng.integers(0, 115, size.sum()),
+        'member_sex': rng.choice(['female', 'male', ''], size.sum()),
+    }
+    return main, roster
+
+def build(parts):
+    """A linked survey of the households of parts, each (main, roster) as returned by households()."""
+    main = {name: np.concatenate([part[0][name] for part in parts]) for name in parts[0][0]}
+    offsets = np.cumsum([0] + [len(part[0]['_uuid']) for part in parts])
+    roster = {name: np.concatenate([part[1][name] for part in parts]) for name in parts[0][1]}
+    roster['household'] = np.concatenate([part[1]['household'] + offset for part, offset in zip(parts, offsets)])
+    rows, members = len(main['_uuid']), len(roster['household'])
+
+    def text(values):
+        labels = sorted(set(values) - {''})
+        codes = {label: code for code, label in enumerate(labels)}
+        return category([codes.get(value, -1) for value in values], labels)
+
+    tables = {
+        'main': SurveyData({
+            '_index': number(np.arange(1, rows + 1)),
+            '_uuid': text(main['_uuid'].tolist()),
+            'start': SurveyColumn('datetime', main['start'].astype('datetime64[s]')),
+            'end': SurveyColumn('datetime', main['end'].astype('datetime64[s]')),
+            'consent': text(main['consent'].tolist()),
+            **{name: number(main[name]) for name in ('team_id', 'enum_id', 'cluster_id', 'hh_id', 'hh_size', 'fcs')},
+        }, rows, 'main'),
+        'roster': SurveyData({
+            '_index': number(np.arange(1, members + 1)),
+            '_parent_index': number(roster['household'] + 1),
+            'member_age_years': number(roster['member_age_years']),
+            'member_sex': text(roster['member_sex'].tolist()),
+        }, members, 'roster'),
+    }
+    return LinkedSurvey(tables)
+
+def assert_matches_full_run(update, survey):
+    expected = run_checks(survey)
+    assert [check.key for check in update.result.checks] == [check.key for check in expected.checks]
+    assert update.result.flagged.tolist() == expected.flagged.tolist()
+    assert update.result.checked.tolist() == expected.checked.tolist()
+    for sheet, (positions, flags, applies) in expected.sheets.items():
+        assert np.array_equal(update.result.sheets[sheet][1], flags)
+        assert np.array_equal(update.result.sheets[sheet][2], applies)
+    for column, (groups, flagged, checked) in update.groups.items():
+        fresh = GroupIndex(survey, column)
+        assert groups.labels == fresh.labels
+        for sheet, (positions, flags, applies) in expected.sheets.items():
+            assert np.array_equal(flagged[:, positions], fresh.reduce(sheet, flags))
+            assert np.array_equal(checked[:, positions], fresh.reduce(sheet, applies))
+
+def test_first_update_evaluates_everything():
+    survey = build([households(1, 50)])
+    update = QualityCache().update(survey)
+    assert update.full and update.evaluated == 50
+    assert set(update.groups) == {'enum_id', 'team_id'}
+    assert_matches_full_run(update, survey)
+
+def test_daily_uploads_evaluate_only_new_households():
+    cache = QualityCache()
+    day1, day2, day3 = households(1, 60), households(2, 25), households(3, 10)
+    cache.update(build([day1]))
+    survey = build([day1, day2])
+    update = cache.update(survey)
+    assert not update.full
+    assert (update.evaluated, update.removed) == (25, 0)
+    assert_matches_full_run(update, survey)
+
+    # one submission comes back under a new uuid; another one was deleted
+    edited = {name: values.copy() for name, values in day1[0].items()}
+    edited['_uuid'][3] = 'edited-3'
+    edited['hh_size'][3] = 90
+    kept = np.arange(60) != 7
+    edited = {name: values[kept] for name, values in edited.items()}
+    members = day1[1]['household'] != 7
+    roster = {name: values[members] for name, values in day1[1].items()}
+    roster['household'] = roster['household'] - (roster['household'] > 7)
+    survey = build([(edited, roster), day2, day3])
+    update = cache.update(survey)
+    assert (update.evaluated, update.removed) == (11, 2)
+    assert_matches_full_run(update, survey)
+
+def test_edits_under_the_same_uuid_reevaluate_their_household():
+    cache = QualityCache()
+    main, roster = households(1, 50)
+    cache.update(build([(main, roster)]))
+    edited = {name: values.copy() for name, values in main.items()}
+    row = int(np.flatnonzero(edited['consent'] == 'yes')[0])
+    edited['hh_size'][row] = 90
+    edited['end'][row] = edited['start'][row]
+    survey = build([(edited, roster)])
+    update = cache.update(survey)
+    assert (update.evaluated, update.removed) == (1, 1)
+    assert_matches_full_run(update, survey)
+
+    ages = roster['member_age_years'].copy()
+    ages[0] = 114 if ages[0] != 114 else 3
+    survey = build([(edited, dict(roster, member_age_years=ages))])
+    update = cache.update(survey)
+    assert update.evaluated == 1
+    assert_matches_full_run(update, survey)
+
+def test_new_repeat_records_reevaluate_their_household():
+    cache = QualityCache()
+    main, roster = households(1, 20)
+    cache.update(build([(main, roster)]))
+    grown = {name: np.append(values, values[:1]) for name, values in roster.items()}
+    survey = build([(main, grown)])
+    update = cache.update(survey)
+    assert update.evaluated == 1
+    assert_matches_full_run(update, survey)
+
+def test_changed_columns_or_missing_uuids_evaluate_everything():
+    cache = QualityCache()
+    day1, day2 = households(1, 30), households(2, 5)
+    cache.update(build([day1]))
+    survey = build([day1, day2])
+    del survey.tables['main'].columns['fcs']
+    update = cache.update(survey)
+    assert update.full
+    assert_matches_full_run(update, survey)
+
+    del survey.tables['main'].columns['_uuid']
+    assert cache.update(survey).full
+    assert cache.update(survey).full
+
+def test_clear():
+    cache = QualityCache(checks=[check for check in CHECKS if check.sector == 'general'])
+    survey = build([households(1, 10)])
+    cache.update(survey)
+    assert not cache.update(survey).full
+    cache.clear()
+    assert cache.update(survey).full
@@ -0,0 +1,29 @@
+import pytest
+from openpyxl import load_workbook
+from logic.tab4_xlsform import FRAGMENT_CACHE
+from logic.tab5_ki_tools import KI_TOOL_BANKS, compile_tool, export_tools
+
+@pytest.mark.parametrize('tool', list(KI_TOOL_BANKS))
+def test_every_tool_compiles(tool):
+    form = compile_tool(tool)
+    assert form.keys == KI_TOOL_BANKS[tool].resolve(KI_TOOL_BANKS[tool].keys)
+    assert form.survey[0][1] == 'grp_metadata'
+
+def test_selection_only_compiles_new_fragments():
+    compile_tool('fslki', ['market_functionality'])
+    before = FRAGMENT_CACHE.stats()
+    form = compile_tool('fslki', ['market_functionality', 'staple_prices'])
+    after = FRAGMENT_CACHE.stats()
+    assert form.keys == ['metadata', 'market_functionality', 'staple_availability', 'staple_prices']
+    assert after['size'] - before['size'] <= 2
+    assert after['hits'] - before['hits'] >= 2
+
+def test_export_tools_writes_one_file_per_tool(tmp_path):
+    paths = export_tools({'healthki': ['stockouts'], 'latrineobs': None, 'waterpointobs': None}, tmp_path, workers=3, version='1')
+    assert list(paths) == ['healthki', 'latrineobs', 'waterpointobs']
+    settings = list(load_workbook(paths['healthki'], read_only=True)['settings'].values)
+    assert settings[1] == ('IPHRA Health Service Provider Key Informant Interview', 'iphra_health_ki', '1')
+
+def test_export_tools_rejects_unknown_tool(tmp_path):
+    with pytest.raises(ValueError):
+        export_tools({'hh': None}, tmp_path)
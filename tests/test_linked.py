@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from openpyxl import Workbook
+from logic.tab6_import import ImportCache, SurveyColumn, SurveyData
+from logic.tab6_linked import LinkedSurvey, import_workbook
+
+def table(sheet, **columns):
+    rows = len(next(iter(columns.values())))
+    return SurveyData({name: SurveyColumn('number', np.array(values, dtype=np.float64)) for name, values in columns.items()}, rows, sheet)
+
+@pytest.fixture
+def survey():
+    return LinkedSurvey({
+        'main': table('main', _index=[1, 2, 3], hh_size=[4, 2, 6]),
+        'roster': table('roster', _index=[1, 2, 3, 4], _parent_index=[3, 1, 3, 9], age=[30, 5, 1, 40]),
+    })
+
+def test_repeat_rows_are_linked_to_parents(survey):
+    assert survey.main == 'main' and survey.repeats == ['roster']
+    assert survey.parent_rows['roster'].tolist() == [2, 0, 2, -1]
+    assert survey.child_counts('roster').tolist() == [1, 0, 2]
+    assert survey.orphans('roster') == 1
+
+def test_join_aligns_household_columns_to_repeat_rows(survey):
+    assert survey.join('roster', 'hh_size').text(slice(None)) == ['6', '4', '6', '']
+
+def test_nested_repeats_follow_the_chain():
+    from logic.tab6_import import StringArray
+    children = table('children', _parent_index=[2, 1], muac=[120, 130])
+    children.columns['_parent_table_name'] = SurveyColumn('category', np.array([0, 0], dtype=np.int8), StringArray.from_strings(['roster']))
+    survey = LinkedSurvey({
+        'main': table('main', _index=[10, 20]),
+        'roster': table('roster', _index=[1, 2], _parent_index=[20, 10]),
+        'children': children,
+    })
+    assert survey.parents == {'roster': 'main', 'children': 'roster'}
+    assert survey.household_rows('children').tolist() == [0, 1]
+
+def test_parent_must_be_the_main_sheet_or_a_repeat():
+    from logic.tab6_import import StringArray
+    rep = table('rep', _parent_index=[1], age=[30])
+    rep.columns['_parent_table_name'] = SurveyColumn('category', np.array([0], dtype=np.int8), StringArray.from_strings(['other']))
+    with pytest.raises(ValueError, match="neither 'main' nor a repeat"):
+        LinkedSurvey({'main': table('main', _index=[1]), 'other': table('other', _index=[1]), 'rep': rep})
+
+def test_duplicate_parent_keys_are_rejected():
+    with pytest.raises(ValueError):
+        LinkedSurvey({'main': table('main', _index=[1, 1]), 'roster': table('roster', _parent_index=[1])})
+
+def test_survey_without_a_main_sheet_is_unlinked():
+    survey = LinkedSurvey({'people': table('people', name=[1, 2]), 'roster': table('roster', _parent_index=[1])})
+    assert not survey.linked
+    assert survey.main == 'people' and survey.repeats == []
+    assert len(survey) == 2 and len(survey.table('roster')) == 1
+    with pytest.raises(ValueError):
+        LinkedSurvey({})
+
+@pytest.fixture
+def export(tmp_path):
+    path = tmp_path / 'export.xlsx'
+    book = Workbook()
+    book.active.title = 'iphra_hh'
+    for row in (('_index', 'consent'), (1, 'yes'), (2, 'no')):
+        book.active.append(row)
+    roster = book.create_sheet('hh_roster')
+    for row in (('age', '_index', '_parent_table_name', '_parent_index'), (34, 1, 'iphra_hh', 1), (3, 2, 'iphra_hh', 1), (60, 3, 'iphra_hh', 2)):
+        roster.append(row)
+    book.save(path)
+    return str(path)
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_import_workbook_links_sheets(export, tmp_path, workers):
+    progress = []
+    survey = import_workbook(export, ImportCache(str(tmp_path / 'cache')), workers=workers,
+                             progress=lambda done, total: progress.append((done, total)))
+    assert list(survey.tables) == ['iphra_hh', 'hh_roster']
+    assert survey.child_counts('hh_roster').tolist() == [2, 1]
+    assert survey.join('hh_roster', 'consent').text(slice(None)) == ['yes', 'yes', 'no']
+    assert progress[-1] == (2, 2)
+
+def test_import_workbook_without_cache(export):
+    survey = import_workbook(export, workers=1)
+    assert len(survey) == 2 and survey.orphans('hh_roster') == 0
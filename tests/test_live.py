@@ -0,0 +1,53 @@
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+from logic.dependencies import DependencyGraph
+from ui.live import INVALID_TEXT, LiveRecalculator
+from ui.qt_validators import show_error
+
+@pytest.fixture(scope="module")
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+class Label:
+    text = "old"
+
+    def setText(self, text):
+        self.text = text
+
+@pytest.fixture
+def live(app):
+    graph = DependencyGraph()
+    graph.add('household', ['population', 'hh_prevalence'])
+    graph.add('mortality', ['population', 'mortality_rate'])
+    live = LiveRecalculator(graph, delay=10)
+    live.calls = []
+    live.label = Label()
+    live.set_handler('household', lambda: live.calls.append('household'), [live.label])
+    live.set_handler('mortality', lambda: (live.calls.append('mortality'), show_error("Invalid rate")), [live.label])
+    return live
+
+def test_edits_are_debounced_into_one_recalculation(live):
+    for _ in range(5):
+        live.input_changed('hh_prevalence')
+    QtCore.QTimer.singleShot(100, QtCore.QCoreApplication.quit)
+    QtCore.QCoreApplication.exec()
+    assert live.calls == ['household']
+    assert live.label.text == "old"
+
+def test_only_affected_outputs_are_recalculated(live):
+    live.input_changed('population')
+    assert live.recalculate() == ['household', 'mortality']
+    live.input_changed('hh_prevalence')
+    assert live.recalculate() == ['household']
+    assert live.recalculate() == []
+
+def test_invalid_input_clears_outputs_without_message_box(live):
+    live.input_changed('mortality_rate')
+    live.recalculate()
+    assert live.label.text == INVALID_TEXT
+
+def test_disabled_ignores_edits(live):
+    live.enabled = False
+    live.input_changed('population')
+    assert live.recalculate() == []
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+from logic.strings import StringArray
+from logic.tab3_frame import SamplingFrame
+from ui.models import SamplingFrameModel
+
+@pytest.fixture(scope="module")
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+@pytest.fixture
+def model(app):
+    labels = StringArray.from_strings(["Alpha", "Beta", "Gamma"])
+    frame = SamplingFrame(np.array([2, 0, 1, 0], dtype=np.int32), labels, np.array([30, 10, 40, 20], dtype=np.int32))
+    return SamplingFrameModel(frame)
+
+def column(model, c):
+    return [model.data(model.index(r, c)) for r in range(model.rowCount())]
+
+def test_sampling_frame_model_shows_frame(model):
+    assert model.rowCount() == 4
+    assert column(model, 0) == ["Gamma", "Alpha", "Beta", "Alpha"]
+    assert column(model, 1) == ["30", "10", "40", "20"]
+
+def test_sampling_frame_model_sorts_on_arrays(model):
+    model.sort(1, QtCore.Qt.SortOrder.DescendingOrder)
+    assert column(model, 1) == ["40", "30", "20", "10"]
+    model.sort(0)
+    assert column(model, 0) == ["Alpha", "Alpha", "Beta", "Gamma"]
+
+def test_sampling_frame_model_filters_on_arrays(model):
+    model.set_filter("ALP")
+    assert column(model, 1) == ["10", "20"]
+    model.set_filter("")
+    assert model.rowCount() == 4
+
+def test_sampling_frame_model_filter_folds_accented_names(app):
+    labels = StringArray.from_strings(["BÉNI", "Goma"])
+    model = SamplingFrameModel(SamplingFrame(np.array([0, 1], dtype=np.int32), labels, np.array([5, 6], dtype=np.int32)))
+    model.set_filter("béni")
+    assert column(model, 0) == ["BÉNI"]
+
+def test_sampling_frame_model_marks_selected(model):
+    model.set_selected(np.array([2]))
+    assert column(model, 2) == ["", "", "Yes", ""]
+
+def test_indicator_filter_proxy_follows_index(app):
+    from logic.tab4_search import IndicatorIndex
+    from logic.tab4_xlsform import HH_QUESTION_BANK
+    from ui.models import IndicatorFilterProxy, IndicatorListModel
+    source = IndicatorListModel(HH_QUESTION_BANK)
+    proxy = IndicatorFilterProxy(IndicatorIndex(HH_QUESTION_BANK))
+    proxy.setSourceModel(source)
+    assert proxy.rowCount() == len(HH_QUESTION_BANK)
+    proxy.set_query("wat")
+    keys = [proxy.data(proxy.index(r, 0), QtCore.Qt.ItemDataRole.UserRole) for r in range(proxy.rowCount())]
+    assert keys == ["water_source", "water_quantity"]
+    proxy.set_query("")
+    assert proxy.rowCount() == len(HH_QUESTION_BANK)
+
+def test_form_preview_model_fetches_rows_lazily(app):
+    from logic.tab4_preview import build_preview
+    from logic.tab4_xlsform import HH_QUESTION_BANK
+    from ui.models import FormPreviewModel
+    model = FormPreviewModel(build_preview(HH_QUESTION_BANK.compile_form(HH_QUESTION_BANK.keys)), fetch_batch=10)
+    assert model.rowCount() == 0 and model.canFetchMore(QtCore.QModelIndex())
+    model.fetchMore(QtCore.QModelIndex())
+    assert model.rowCount() == 10
+    group = model.index(1, 0)
+    assert model.data(group) == "Household Roster (Demographics)"
+    assert model.hasChildren(group) and model.rowCount(group) == 0
+    model.fetchMore(group)
+    child = model.index(0, 0, group)
+    assert model.parent(child) == group and model.parent(group) == QtCore.QModelIndex()
+
+def test_survey_data_model_formats_cells_in_cached_blocks(app):
+    from logic.tab6_import import StringArray, SurveyColumn, SurveyData
+    from ui.models import SurveyDataModel
+    data = SurveyData({'hh_size': SurveyColumn('number', np.array([3.0, np.nan, 5.5, 2.0])),
+                       'consent': SurveyColumn('category', np.array([1, 0, -1, 1], dtype=np.int8), StringArray.from_strings(['no', 'yes']))},
+                      4, 'main')
+    model = SurveyDataModel(data, block_rows=2, max_blocks=2)
+    assert (model.rowCount(), model.columnCount()) == (4, 2)
+    assert model.headerData(1, QtCore.Qt.Orientation.Horizontal) == 'consent'
+    assert [model.data(model.index(r, 0)) for r in range(4)] == ['3', '', '5.5', '2']
+    assert model.cached_blocks() == 2
+    assert [model.data(model.index(r, 1)) for r in range(4)] == ['yes', 'no', '', 'yes']
+    assert model.cached_blocks() == 2
@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+from logic.tab2_planning import optimize_fieldwork, plan_fieldwork, workday_minutes
+
+def test_workday_minutes():
+    assert workday_minutes(8 * 60, 17 * 60, 1.5) == 450
+    with pytest.raises(ValueError):
+        workday_minutes(17 * 60, 8 * 60, 0)
+    with pytest.raises(ValueError):
+        workday_minutes(8 * 60, 9 * 60, 2)
+
+def test_plan_fieldwork():
+    # 390 minutes - 60 travel leaves 13 interviews of 25 minutes for each of 3 enumerators
+    plan = plan_fieldwork(600, 4, 3, 1, 390, 25, 60)
+    assert plan.cluster_size == 39
+    assert plan.num_psus == 16
+    assert plan.num_days == 4
+    # a smaller cluster size needs more PSUs; a larger one than the day allows is capped
+    plan = plan_fieldwork(600, 4, 3, 1, 390, 25, 60, cluster_size=20)
+    assert (plan.cluster_size, plan.num_psus, plan.num_days) == (20, 30, 8)
+    assert plan_fieldwork(600, 4, 3, 1, 390, 25, 60, cluster_size=50).cluster_size == 39
+
+def test_plan_fieldwork_broadcasts_and_flags_infeasible_plans():
+    plan = plan_fieldwork(600, np.array([1, 2, 4]), 3, np.array([[1], [10]]), 390, 25, 60)
+    assert plan.num_days.shape == (2, 3)
+    assert np.array_equal(plan.num_days[0], [16, 8, 4])
+    assert np.isnan(plan.num_days[1]).all()
+
+def test_optimize_fieldwork_matches_plan_fieldwork():
+    plans = optimize_fieldwork(600, 390, 25, 60, max_teams=8, max_enumerators=5, cluster_sizes=range(10, 31))
+    assert np.all(np.diff(plans.num_days) >= 0)
+    # every plan, applied with its cluster size, is scheduled as the optimizer ranked it
+    check = plan_fieldwork(600, plans.teams, plans.enumerators, plans.psus_per_day, 390, 25, 60, plans.cluster_size)
+    assert np.array_equal(check.cluster_size, plans.cluster_size)
+    assert np.array_equal(check.num_psus, plans.num_psus)
+    assert np.array_equal(check.num_days, plans.num_days)
+    assert np.all(plans.num_psus * plans.cluster_size >= 600)
+
+def test_optimize_fieldwork_by_cost_and_day_limit():
+    plans = optimize_fieldwork(600, 390, 25, 60, 8, 5, range(10, 31), objective='cost', max_days=5)
+    costs = plans.cost()
+    assert np.all(np.diff(costs) >= 0)
+    assert plans.num_days.max() <= 5
+    with pytest.raises(ValueError):
+        optimize_fieldwork(600, 390, 25, 60, 8, 5, range(10, 31), objective='speed')
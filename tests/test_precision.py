@@ -0,0 +1,33 @@
+import pytest
+import numpy as np
+from logic.tab2_precision import icc_from_design_effect, simulate_precision
+
+def test_icc_from_design_effect():
+    assert icc_from_design_effect(2, 21) == pytest.approx(0.05)
+    assert icc_from_design_effect(1, 20) == 0
+    assert icc_from_design_effect(2, 1) == 0
+
+def test_simulation_recovers_design_effect_and_coverage():
+    summary = simulate_precision(0.3, 0.05, icc_from_design_effect(2, 20), 30, 20, replicates=10000, seed=1)
+    assert summary.replicates == 10000
+    assert summary.design_effect == pytest.approx(2, abs=0.15)
+    assert summary.coverage == pytest.approx(0.95, abs=0.02)
+    assert np.mean(summary.estimates) == pytest.approx(0.3, abs=0.005)
+
+def test_simulation_is_reproducible():
+    first = simulate_precision(0.2, 0.05, 0.05, 25, 10, replicates=3000, seed=3, batch_size=1000)
+    second = simulate_precision(0.2, 0.05, 0.05, 25, 10, replicates=3000, seed=3, batch_size=1000)
+    assert np.array_equal(first.half_widths, second.half_widths)
+
+def test_larger_design_meets_target_more_often():
+    small = simulate_precision(0.5, 0.05, 0.02, 20, 10, replicates=2000, seed=4)
+    large = simulate_precision(0.5, 0.05, 0.02, 60, 20, replicates=2000, seed=4)
+    assert large.share_meeting_target > small.share_meeting_target
+
+def test_simulation_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        simulate_precision(0, 0.05, 0.1, 30, 20)
+    with pytest.raises(ValueError):
+        simulate_precision(0.3, 0.05, 1, 30, 20)
+    with pytest.raises(ValueError):
+        simulate_precision(0.3, 0.05, 0.1, 1, 20)
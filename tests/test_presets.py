@@ -0,0 +1,25 @@
+import pytest
+from logic.presets import TEMPLATES, TOOL_BANKS, resolve_template
+
+@pytest.mark.parametrize('template', TEMPLATES)
+def test_templates_are_closed_under_requirements(template):
+    for tool, keys in resolve_template(template).items():
+        bank = TOOL_BANKS[tool]
+        assert keys[0] == 'metadata'
+        assert all(set(bank.closure(key)) <= set(keys) for key in keys)
+
+def test_templates_are_nested():
+    short, recommended, full = (resolve_template(template) for template in TEMPLATES)
+    for tool, bank in TOOL_BANKS.items():
+        assert set(short[tool]) <= set(recommended[tool]) <= set(full[tool])
+        assert full[tool] == tuple(bank.order)
+
+def test_short_template_adds_required_indicators():
+    assert resolve_template('short')['fslki'] == ('metadata', 'market_functionality', 'staple_availability', 'staple_prices')
+
+def test_resolved_templates_are_cached():
+    assert resolve_template('recommended') is resolve_template('recommended')
+
+def test_unknown_template():
+    with pytest.raises(ValueError):
+        resolve_template('medium')
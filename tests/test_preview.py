@@ -0,0 +1,31 @@
+import pytest
+from logic.tab4_preview import build_preview
+from logic.tab4_xlsform import HH_QUESTION_BANK, CompiledForm, _survey_row
+from logic.tab5_ki_tools import KI_TOOL_BANKS, compile_tool
+
+def test_preview_nests_groups_and_repeats():
+    root = build_preview(HH_QUESTION_BANK.compile_form(['hh_roster']))
+    assert [node.name for node in root.children] == ['grp_metadata', 'grp_hh_roster']
+    roster = root.children[1]
+    repeat = next(node for node in roster.children if node.kind == 'repeat')
+    assert repeat.parent is roster and repeat.details == 'Repeats: ${hh_size}'
+    assert all(node.parent is repeat for node in repeat.children)
+    assert [node.row for node in roster.children] == list(range(len(roster)))
+
+def test_preview_lists_choices_and_calculations():
+    form = HH_QUESTION_BANK.compile_form(['fcs'])
+    root = build_preview(form)
+    questions = {node.name: node for group in root.children for node in group.children}
+    assert questions['consent'].details.startswith('Choices: Yes, No')
+    assert questions['fcs'].details.startswith('= ${fcs_cereals} * 2')
+    assert questions['fcs'].label == 'fcs'
+
+@pytest.mark.parametrize('tool', list(KI_TOOL_BANKS))
+def test_every_tool_previews(tool):
+    assert len(build_preview(compile_tool(tool))) == len(KI_TOOL_BANKS[tool])
+
+def test_unbalanced_groups_are_rejected():
+    with pytest.raises(ValueError):
+        build_preview(CompiledForm([], [_survey_row(('begin_group', 'g', 'G'))], []))
+    with pytest.raises(ValueError):
+        build_preview(CompiledForm([], [_survey_row(('begin_group', 'g', 'G')), _survey_row(('end_repeat', '', ''))], []))
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from logic.tab6_import import StringArray, SurveyColumn, SurveyData
+from logic.tab6_linked import LinkedSurvey
+from logic.tab7_quality import CHECKS, QUALITY_SECTORS, SUMMARY_COLUMNS, QualityCheck, run_checks
+from tests.conftest import category, number
+
+@pytest.fixture
+def survey():
+    start = np.array(['2024-05-01T08:00', '2024-05-01T09:00', '2024-05-01T10:00', '2024-05-01T11:00'], dtype='datetime64[s]')
+    main = {
+        '_index': number([1, 2, 3, 4]),
+        'start': SurveyColumn('datetime', start),
+        'end': SurveyColumn('datetime', start + np.array([40, 10, 50, 30], dtype='timedelta64[m]')),
+        'consent': category([1, 1, 1, 0], ['no', 'yes']),
+        'cluster_id': number([1, 1, 2, 2]),
+        'hh_id': number([1, 1, 1, 2]),
+        'grp_roster/hh_size': number([2, 3, 45, np.nan]),
+        'hhs_no_food': category([1, 0, -1, -1], ['no', 'yes']),
+        'hhs_no_food_freq': category([0, 0, 0, -1], ['often']),
+        **{name: category([-1] * 4, []) for name in ('hhs_sleep_hungry', 'hhs_sleep_hungry_freq', 'hhs_whole_day', 'hhs_whole_day_freq')},
+    }
+    roster = {
+        '_index': number([1, 2, 3, 4, 5]),
+        '_parent_index': number([1, 1, 2, 2, 4]),
+        'member_age_years': number([30, 120, 4, 40, 20]),
+        'member_sex': category([0, 1, -1, 0, 0], ['female', 'male']),
+    }
+    return LinkedSurvey({'main': SurveyData(main, 4, 'main'), 'roster': SurveyData(roster, 5, 'roster')})
+
+def flagged(result, key):
+    return result.flagged_rows(key)[1].tolist()
+
+def test_checks_are_declared_once_per_key():
+    keys = [check.key for check in CHECKS]
+    assert len(keys) == len(set(keys))
+    assert {check.sector for check in CHECKS} == set(QUALITY_SECTORS)
+
+def test_household_checks(survey):
+    result = run_checks(survey)
+    assert flagged(result, 'duplicate_household') == [0, 1]
+    assert flagged(result, 'interview_short') == [1]
+    assert flagged(result, 'hh_size_range') == [2]
+    # the household without consent is not checked
+    assert flagged(result, 'hh_size_missing') == []
+    assert flagged(result, 'roster_mismatch') == [1, 2]
+    assert flagged(result, 'hhs_skip') == [1, 2]
+
+def test_repeat_checks_use_household_consent(survey):
+    result = run_checks(survey)
+    assert result.flagged_rows('member_age_range')[0] == 'roster'
+    assert flagged(result, 'member_age_range') == [1]
+    assert flagged(result, 'member_sex_missing') == [2]
+    summary = result.summary('general').set_index('Check')
+    assert summary.loc["Member sex missing", 'Records Checked'] == 4
+
+def test_missing_columns_skip_checks(survey):
+    result = run_checks(survey)
+    skipped = {check.key for check in result.skipped}
+    assert 'muac_range' in skipped and 'fcs_outlier' in skipped
+    assert result.summary('muac').empty
+
+def test_summary_counts_and_percentages(survey):
+    summary = run_checks(survey).summary('general')
+    assert tuple(summary.columns) == SUMMARY_COLUMNS
+    row = summary.set_index('Check').loc["Interview shorter than 15 minutes"]
+    assert (row['Records Checked'], row['Flagged'], row['% Flagged']) == (3, 1, 33.3)
+
+def test_zscore_and_text_datetimes():
+    times = StringArray.from_strings(['2024-05-01T08:00:00.000+03:00', '2024-05-01T08:20:00.000+03:00'])
+    values = [10.0] * 20 + [100.0]
+    survey = LinkedSurvey({'main': SurveyData({
+        '_index': number(range(21)),
+        'start': SurveyColumn('category', np.zeros(21, dtype=np.int8), times),
+        'end': SurveyColumn('category', np.ones(21, dtype=np.int8), times),
+        'hh_size': number(values),
+    }, 21, 'main')})
+    checks = (QualityCheck('outlier', 'general', "Outlier", ('zscore', 'hh_size', 3)),
+              QualityCheck('minutes', 'general', "Twenty minutes", ('eq', 'interview_minutes', 20)))
+    result = run_checks(survey, checks)
+    assert flagged(result, 'outlier') == [20]
+    assert len(flagged(result, 'minutes')) == 21
+
+def test_invalid_sector():
+    with pytest.raises(ValueError):
+        QualityCheck('x', 'education', "X", ('blank', 'x'))
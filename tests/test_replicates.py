@@ -0,0 +1,38 @@
+import pytest
+import numpy as np
+from logic.tab3_replicates import draw_replicates, simulate_replicate_draws
+from logic.tab3_sampling import pps_inclusion_probabilities
+
+SIZES = np.array([10, 20, 30, 40, 100, 5, 5, 300])
+
+def test_draw_replicates_shape_and_certainty():
+    selected = draw_replicates('pps', SIZES.astype(float), 3, 50, np.random.default_rng(0))
+    assert selected.shape == (50, 3)
+    assert np.all(selected[:, 0] == 7)
+
+def test_simulated_probabilities_match_design():
+    summary = simulate_replicate_draws('pps', SIZES, 3, 20000, seed=1)
+    assert summary.inclusion_counts.sum() == 20000 * 3
+    assert summary.inclusion_counts[7] == 20000
+    assert np.allclose(summary.expected_probabilities, pps_inclusion_probabilities(SIZES, 3))
+    assert summary.max_probability_error < 0.02
+    assert summary.total_mean == pytest.approx(SIZES.sum())
+
+@pytest.mark.parametrize('method', ['simple_random', 'systematic'])
+def test_equal_probability_methods(method):
+    summary = simulate_replicate_draws(method, SIZES, 4, 5000, seed=2)
+    assert summary.max_probability_error < 0.05
+    assert summary.weight_min == summary.weight_max == pytest.approx(2)
+
+def test_simulation_is_reproducible_across_workers():
+    sizes = np.random.default_rng(0).integers(50, 5000, 500)
+    serial = simulate_replicate_draws('pps', sizes, 20, 2000, seed=7, workers=1, batch_size=250)
+    parallel = simulate_replicate_draws('pps', sizes, 20, 2000, seed=7, workers=2, batch_size=250)
+    assert np.array_equal(serial.inclusion_counts, parallel.inclusion_counts)
+    assert serial.total_sd == pytest.approx(parallel.total_sd)
+
+def test_simulation_rejects_invalid_input():
+    with pytest.raises(ValueError):
+        simulate_replicate_draws('quota', SIZES, 3, 10)
+    with pytest.raises(ValueError):
+        simulate_replicate_draws('pps', SIZES, 3, 0)
@@ -1,6 +1,14 @@
 import pytest
 import math
-from logic.tab2_samplesize import calculate_sample_size
+import numpy as np
+from logic.tab2_samplesize import (
+    calculate_sample_size,
+    calculate_sample_size_ind_to_hh,
+    calculate_sample_size_mortality_rate,
+    calculate_sample_size_batch,
+    calculate_sample_size_ind_to_hh_batch,
+    calculate_sample_size_mortality_rate_batch,
+)
 
 def test_calculate_sample_size_typical_case():
     result = calculate_sample_size(sample_design="simple_random", population_size=20000, proportion=0.5, margin_of_error=0.05, non_response=0.1, design_effect=1)
@@ -24,4 +32,89 @@ def test_caluclate_sample_size_clustered_case():
     result = calculate_sample_size(sample_design="clustered", population_size=20000, proportion=0.5, margin_of_error=0.05, non_response=0.1, design_effect=1.5)
     n0 = (1.96**2 * 0.5 * (1-0.5)) / (0.05**2)
     expected = math.ceil(((n0 / (1 + (n0 - 1) / 20000)) / (1 - 0.1))*1.5)
-    assert abs(result - expected) < 0.01  # tolerance for float comparison
\ No newline at end of file
+    assert abs(result - expected) < 0.01  # tolerance for float comparison
+
+def test_calculate_sample_size_batch_matches_scalar():
+    populations = np.array([500, 1000, 20000, 150000])
+    proportions = np.array([0.05, 0.2, 0.5, 0.35])
+    margins = np.array([0.02, 0.05, 0.05, 0.1])
+    non_response = np.array([0.0, 0.05, 0.1, 0.2])
+    deffs = np.array([1, 1.5, 2, 2.5])
+    result = calculate_sample_size_batch("clustered", populations, proportions, margins, non_response, deffs)
+    expected = [calculate_sample_size("clustered", *args) for args in zip(populations, proportions, margins, non_response, deffs)]
+    assert result.tolist() == expected
+
+def test_calculate_sample_size_batch_broadcasts_scalars():
+    proportions = np.linspace(0.05, 0.5, 10)
+    result = calculate_sample_size_batch("simple_random", 20000, proportions, 0.05, 0.1)
+    assert result.shape == (10,)
+    assert result[-1] == calculate_sample_size("simple_random", 20000, 0.5, 0.05, 0.1)
+
+def test_calculate_sample_size_batch_invalid_design():
+    with pytest.raises(ValueError):
+        calculate_sample_size_batch(["simple_random", "bogus"], 20000, 0.5, 0.05, 0.1)
+
+def test_calculate_sample_size_ind_to_hh_batch_matches_scalar():
+    populations = np.array([1000, 20000, 150000])
+    proportions = np.array([0.1, 0.3, 0.5])
+    household_sizes = np.array([4.5, 5.0, 6.2])
+    prop_subpopulation = np.array([0.15, 0.2, 0.5])
+    result = calculate_sample_size_ind_to_hh_batch("clustered", populations, proportions, 0.05, 0.1, household_sizes, prop_subpopulation, 1.5)
+    expected = [calculate_sample_size_ind_to_hh("clustered", N, p, 0.05, 0.1, hh, sub, 1.5) for N, p, hh, sub in zip(populations, proportions, household_sizes, prop_subpopulation)]
+    assert result.tolist() == expected
+
+def test_calculate_sample_size_mortality_rate_batch_matches_scalar():
+    mortality_rates = np.array([0.5, 1.0, 2.0])
+    precisions = np.array([0.3, 0.4, 0.5])
+    recall_periods = np.array([60, 90, 120])
+    result = calculate_sample_size_mortality_rate_batch("clustered", 100000, mortality_rates, precisions, recall_periods, 0.05, 5.5, 1.5)
+    expected = [calculate_sample_size_mortality_rate("clustered", 100000, r, d, t, 0.05, 5.5, 1.5) for r, d, t in zip(mortality_rates, precisions, recall_periods)]
+    assert result.tolist() == expected
+
+@pytest.mark.parametrize("margin_of_error, non_response, message", [
+    (0, 0.1, "Margin of error"),
+    (0.05, 1, "Non-response"),
+    (0.05, -0.1, "Non-response"),
+])
+def test_calculate_sample_size_batch_rejects_out_of_range_like_scalar(margin_of_error, non_response, message):
+    with pytest.raises(ValueError, match=message):
+        calculate_sample_size("simple_random", 20000, 0.5, margin_of_error, non_response)
+    with pytest.raises(ValueError, match=message):
+        calculate_sample_size_batch("simple_random", 20000, [0.3, 0.5], margin_of_error, non_response)
+    with pytest.raises(ValueError, match=message):
+        calculate_sample_size_mortality_rate_batch("clustered", 100000, 1.0, margin_of_error * 10, 90, non_response, 5.5)
+
+def test_calculate_sample_size_ind_to_hh_batch_rejects_zero_population():
+    with pytest.raises(ValueError, match="Population size"):
+        calculate_sample_size_ind_to_hh_batch("clustered", [20000, 0], 0.3, 0.05, 0.1, 5.0, 0.2)
+
+@pytest.mark.parametrize("household_size, prop_subpopulation, message", [
+    (0, 0.2, "Household size must be greater than 0"),
+    (5.0, 0, "subpopulation must be greater than 0"),
+    (np.nan, 0.2, "Household size must be a finite number"),
+    (5.0, np.inf, "subpopulation must be a finite number"),
+])
+def test_calculate_sample_size_ind_to_hh_rejects_invalid_households(household_size, prop_subpopulation, message):
+    with pytest.raises(ValueError, match=message):
+        calculate_sample_size_ind_to_hh("clustered", 20000, 0.3, 0.05, 0.1, household_size, prop_subpopulation)
+    with pytest.raises(ValueError, match=message):
+        calculate_sample_size_ind_to_hh_batch("clustered", 20000, [0.3, 0.5], 0.05, 0.1, household_size, prop_subpopulation)
+
+@pytest.mark.parametrize("arguments, message", [
+    ((100000, 1.0, 0.4, 90, 0.05, 0), "Household size must be greater than 0"),
+    ((100000, 1.0, 0.4, 0, 0.05, 5.5), "Recall period must be greater than 0"),
+    ((100000, np.nan, 0.4, 90, 0.05, 5.5), "Mortality rate must be a finite number"),
+    ((np.inf, 1.0, 0.4, 90, 0.05, 5.5), "Population size must be a finite number"),
+    ((100000, 1.0, 0.4, 90, np.nan, 5.5), "Non-response must be a finite number"),
+])
+def test_calculate_sample_size_mortality_rate_rejects_invalid_parameters(arguments, message):
+    with pytest.raises(ValueError, match=message):
+        calculate_sample_size_mortality_rate("clustered", *arguments)
+    with pytest.raises(ValueError, match=message):
+        calculate_sample_size_mortality_rate_batch("clustered", *arguments)
+
+def test_calculate_sample_size_batch_rejects_nan_in_any_row():
+    with pytest.raises(ValueError, match="Proportion must be a finite number"):
+        calculate_sample_size_batch("simple_random", 20000, [0.3, np.nan], 0.05, 0.1)
+    with pytest.raises(ValueError, match="Design effect must be a finite number"):
+        calculate_sample_size("clustered", 20000, 0.3, 0.05, 0.1, float("nan"))
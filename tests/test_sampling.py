@@ -0,0 +1,51 @@
+import pytest
+import numpy as np
+from logic.tab3_sampling import draw_sample, pps_inclusion_probabilities, pps_systematic_sample, srs_sample, systematic_sample
+
+def test_pps_systematic_sample_is_reproducible():
+    sizes = np.random.default_rng(0).integers(50, 5000, 1000)
+    first, _ = pps_systematic_sample(sizes, 30, seed=42)
+    second, _ = pps_systematic_sample(sizes, 30, seed=42)
+    assert len(first) == 30
+    assert np.array_equal(first, second)
+    assert np.all(np.diff(first) > 0)
+
+def test_pps_systematic_sample_takes_certainty_psus():
+    sizes = np.array([10, 20, 30, 40, 100, 5, 5, 300])
+    selected, certainty = pps_systematic_sample(sizes, 3, seed=1)
+    assert 7 in selected
+    assert certainty[selected.tolist().index(7)]
+    assert certainty.sum() == 1
+
+def test_pps_inclusion_probabilities_sum_to_sample_size():
+    sizes = np.array([10, 20, 30, 40, 100, 5, 5, 300])
+    probabilities = pps_inclusion_probabilities(sizes, 3)
+    assert probabilities.sum() == pytest.approx(3)
+    assert probabilities[7] == 1
+    assert probabilities[0] == pytest.approx(10 / 210 * 2)
+
+def test_pps_systematic_sample_matches_inclusion_probabilities():
+    sizes = np.array([10, 20, 30, 40, 100, 5, 5, 300])
+    counts = np.zeros(len(sizes))
+    for seed in range(4000):
+        selected, _ = pps_systematic_sample(sizes, 3, seed=seed)
+        counts[selected] += 1
+    assert counts / 4000 == pytest.approx(pps_inclusion_probabilities(sizes, 3), abs=0.03)
+
+def test_pps_systematic_sample_skips_empty_psus():
+    sizes = np.array([0, 100, 0, 100, 0])
+    selected, _ = pps_systematic_sample(sizes, 2, seed=3)
+    assert selected.tolist() == [1, 3]
+
+def test_pps_systematic_sample_too_many_psus():
+    with pytest.raises(ValueError):
+        pps_systematic_sample([10, 0, 5], 3)
+
+def test_equal_probability_samples():
+    assert len(np.unique(srs_sample(100, 10, seed=1))) == 10
+    selected = systematic_sample(100, 10, seed=1)
+    assert np.all(np.diff(selected) == 10)
+
+def test_draw_sample_invalid_method():
+    with pytest.raises(ValueError):
+        draw_sample("bogus", [1, 2, 3], 1)
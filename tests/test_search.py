@@ -0,0 +1,36 @@
+import pytest
+from logic.tab4_search import IndicatorIndex, tokenize
+from logic.tab4_xlsform import HH_QUESTION_BANK, QuestionBank
+from logic.tab5_ki_tools import KI_TOOL_BANKS
+
+@pytest.fixture(scope="module")
+def index():
+    return IndicatorIndex(HH_QUESTION_BANK)
+
+def test_tokenize_lowercases_and_splits():
+    assert tokenize("Water Quantity (L/person)") == ["water", "quantity", "l", "person"]
+
+def test_search_matches_every_word_as_prefix(index):
+    assert index.search("wat qua") == ["water_quantity"]
+    assert index.search("WASH") == ["water_source", "water_quantity", "sanitation", "handwashing"]
+
+def test_search_uses_tags(index):
+    assert index.search("malnutrition") == ["muac"]
+    assert index.search("food security") == ["fcs", "rcsi", "hhs", "lcs"]
+
+def test_empty_query_matches_everything_in_bank_order(index):
+    assert index.search("  ") == HH_QUESTION_BANK.keys
+    assert index.match("").all()
+
+def test_unmatched_query_returns_nothing(index):
+    assert index.search("zzz") == []
+    assert index.search("water zzz") == []
+
+def test_search_reads_question_labels():
+    bank = QuestionBank([{'key': 'a', 'label': 'A', 'module': 'x', 'survey': (('text', 'q', 'Village name'),)}], {})
+    assert IndicatorIndex(bank).search("vill") == ["a"]
+
+@pytest.mark.parametrize('tool', list(KI_TOOL_BANKS))
+def test_ki_banks_can_be_indexed(tool):
+    index = IndicatorIndex(KI_TOOL_BANKS[tool])
+    assert len(index) == len(KI_TOOL_BANKS[tool])
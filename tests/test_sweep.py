@@ -0,0 +1,47 @@
+import pytest
+from logic.tab2_sweep import sweep_count, sweep_range, sweep_sample_size
+from logic.tab2_samplesize import calculate_sample_size
+
+def test_sweep_range_is_inclusive():
+    assert sweep_range(0.05, 0.5, 0.05).tolist() == [0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5]
+
+def test_sweep_count_matches_range_without_building_it():
+    assert sweep_count(0.05, 0.5, 0.05) == len(sweep_range(0.05, 0.5, 0.05)) == 10
+    assert sweep_count(0, 1, 1e-12) == 10 ** 12 + 1
+    with pytest.raises(ValueError):
+        sweep_count(0, 1, 0)
+
+def test_sweep_sample_size_matches_scalar():
+    axes = {"proportion": [0.1, 0.3, 0.5], "margin_of_error": [0.03, 0.05], "design_effect": [1, 2]}
+    grid = sweep_sample_size("household", "clustered", axes, population_size=50000, non_response=0.1)
+    assert grid.shape == (3, 2, 2)
+    for i, p in enumerate(axes["proportion"]):
+        for j, e in enumerate(axes["margin_of_error"]):
+            for k, deff in enumerate(axes["design_effect"]):
+                assert grid.sample_sizes[i, j, k] == calculate_sample_size("clustered", 50000, p, e, 0.1, deff)
+
+def test_sweep_cell_access_is_row_major():
+    grid = sweep_sample_size("household", "simple_random", {"proportion": [0.1, 0.2], "margin_of_error": [0.05, 0.1]},
+                             population_size=50000, non_response=0.1)
+    proportions, margins = grid.cell_parameters(1, 3)
+    assert proportions.tolist() == [0.1, 0.2]
+    assert margins.tolist() == [0.1, 0.05]
+    assert grid.cell_sample_sizes(1, 3).tolist() == [grid.sample_sizes[0, 1], grid.sample_sizes[1, 0]]
+
+def test_sweep_sample_size_large_grid():
+    axes = {"proportion": sweep_range(0.05, 0.5, 0.001), "margin_of_error": sweep_range(0.02, 0.1, 0.001), "design_effect": sweep_range(1, 3, 0.1)}
+    grid = sweep_sample_size("household", "clustered", axes, population_size=100000, non_response=0.1)
+    assert grid.size == 451 * 81 * 21
+
+def test_sweep_sample_size_missing_parameter():
+    with pytest.raises(ValueError):
+        sweep_sample_size("household", "clustered", {"proportion": [0.1]}, population_size=50000)
+
+def test_sweep_export_csv(tmp_path):
+    grid = sweep_sample_size("household", "clustered", {"proportion": [0.1, 0.2], "margin_of_error": [0.05]},
+                             population_size=50000, non_response=0.1)
+    path = tmp_path / "grid.csv"
+    grid.export_csv(str(path), block_size=1)
+    lines = path.read_text().splitlines()
+    assert lines[0] == "proportion,margin_of_error,sample_size"
+    assert lines[2] == f"0.2,0.05,{grid.sample_sizes[1, 0]}"
@@ -0,0 +1,49 @@
+import threading
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+from ui.tasks import TaskRunner
+
+@pytest.fixture(scope="module")
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+def run_until_done(app, runner):
+    runner.wait()
+    app.processEvents()
+
+def test_task_runner_delivers_result(app):
+    runner = TaskRunner()
+    results = []
+    runner.submit(lambda a, b: a + b, 2, 3, on_result=results.append)
+    run_until_done(app, runner)
+    assert results == [5]
+
+def test_task_runner_delivers_error(app):
+    runner = TaskRunner()
+    errors = []
+    runner.submit(lambda: 1 / 0, on_error=errors.append)
+    run_until_done(app, runner)
+    assert isinstance(errors[0], ZeroDivisionError)
+
+def test_task_runner_progress_and_cancel(app):
+    runner = TaskRunner()
+    started = threading.Event()
+    release = threading.Event()
+    results, progress = [], []
+
+    def work(progress):
+        started.set()
+        release.wait(5)
+        for i in range(3):
+            progress(i + 1, 3)
+        return "done"
+
+    first = runner.submit(work, key="calc", with_progress=True, on_result=results.append, on_progress=lambda d, t: progress.append(d))
+    started.wait(5)
+    runner.submit(lambda: "latest", key="calc", on_result=results.append)
+    assert first.cancelled
+    release.set()
+    run_until_done(app, runner)
+    assert results == ["latest"]
+    assert progress == []
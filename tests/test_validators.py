@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+import numpy as np
+from logic.validators import ColumnRule, ValidationError, check_number, validate_column, validate_columns, validate_type
+
+def test_validate_type_float():
+    assert validate_type("0.5", float) == (True, 0.5)
+    assert validate_type("abc", float)[0] is False
+
+def test_check_number_bounds():
+    assert check_number("12", "Teams", int, 1) == (12, None)
+    value, error = check_number("0", "Teams", int, 1)
+    assert value is None
+    assert isinstance(error, ValidationError)
+    assert error.name == "Teams"
+
+def test_check_number_not_a_number():
+    value, error = check_number("abc", "Proportion")
+    assert value is None
+    assert "Proportion" in str(error)
+
+def test_validate_column_reports_rows():
+    values = np.array(["0.1", "abc", "1.5", "0.4"], dtype=object)
+    array, errors = validate_column(values, "proportion", ColumnRule(float, 0, 1))
+    assert [e.row for e in errors] == [1, 2]
+    assert array[0] == 0.1
+
+def test_validate_column_int_and_exclusive_bounds():
+    _, errors = validate_column([1, 2.5, 0], "recall_period", ColumnRule(int, 0, exclusive_min=True))
+    assert [e.row for e in errors] == [1, 2]
+
+def test_validate_columns_skips_missing_columns():
+    table = {"proportion": [0.2, 0.3]}
+    rules = {"proportion": ColumnRule(float, 0, 1), "design_effect": ColumnRule(float, 1)}
+    assert validate_columns(table, rules) == []
+
+def test_validators_do_not_import_qt():
+    code = "import sys, logic.validators; print('PyQt6' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+    assert output.strip() == "False"
@@ -0,0 +1,71 @@
+import pytest
+from openpyxl import load_workbook
+from logic.tab4_xlsform import HH_QUESTION_BANK, SURVEY_COLUMNS, QuestionBank
+
+CHOICES = {'yes_no': (('yes', 'Yes'), ('no', 'No'))}
+
+def test_resolve_adds_requirements_before_first_use():
+    assert HH_QUESTION_BANK.resolve(['fcs', 'muac', 'mortality']) == ['metadata', 'fcs', 'hh_roster', 'muac', 'mortality']
+    assert HH_QUESTION_BANK.resolve([]) == ['metadata']
+
+def test_compile_form_concatenates_indicator_rows():
+    form = HH_QUESTION_BANK.compile_form(['water_quantity', 'sanitation'])
+    names = [row[SURVEY_COLUMNS.index('name')] for row in form.survey]
+    assert names.index('hh_size') < names.index('water_lpd') < names.index('latrine_type')
+    assert [row[0] for row in form.survey].count('begin_group') == len(form.keys)
+    assert {row[0] for row in form.choices} == {'yes_no', 'sex', 'latrine_type'}
+
+def test_full_form_writes_valid_workbook(tmp_path):
+    form = HH_QUESTION_BANK.compile_form(HH_QUESTION_BANK.keys)
+    path = tmp_path / 'hh.xlsx'
+    form.write(path, 'IPHRA Household Survey', 'iphra_hh', version='1')
+    workbook = load_workbook(path, read_only=True)
+    assert workbook.sheetnames == ['survey', 'choices', 'settings']
+    rows = list(workbook['survey'].values)
+    assert rows[0] == SURVEY_COLUMNS
+    assert len(rows) == len(form.survey) + 1
+    assert list(workbook['settings'].values)[1] == ('IPHRA Household Survey', 'iphra_hh', '1')
+
+def test_bank_rejects_undefined_references():
+    indicators = [{'key': 'a', 'label': 'A', 'module': 'general', 'survey': (('integer', 'x', 'X', {'relevant': '${y} > 0'}),)}]
+    with pytest.raises(ValueError, match=r'\$\{y\}'):
+        QuestionBank(indicators, CHOICES)
+
+def test_bank_rejects_circular_requirements_and_duplicate_names():
+    circular = [{'key': 'a', 'label': 'A', 'module': 'm', 'requires': ('b',), 'survey': ()},
+                {'key': 'b', 'label': 'B', 'module': 'm', 'requires': ('a',), 'survey': ()}]
+    with pytest.raises(ValueError, match='Circular'):
+        QuestionBank(circular, CHOICES)
+    duplicate = [{'key': 'a', 'label': 'A', 'module': 'm', 'survey': (('text', 'x', 'X'),)},
+                 {'key': 'b', 'label': 'B', 'module': 'm', 'survey': (('text', 'x', 'X'),)}]
+    with pytest.raises(ValueError, match='used by both'):
+        QuestionBank(duplicate, CHOICES)
+
+def test_bank_rejects_undefined_choice_lists():
+    indicators = [{'key': 'a', 'label': 'A', 'module': 'm', 'survey': (('select_one colours', 'x', 'X'),)}]
+    with pytest.raises(ValueError, match='colours'):
+        QuestionBank(indicators, CHOICES)
+
+def test_hh_bank_fragments_compile():
+    assert len(HH_QUESTION_BANK.compile_all()) == len(HH_QUESTION_BANK)
+
+def test_fragments_are_compiled_once():
+    indicators = [{'key': 'a', 'label': 'A', 'module': 'm', 'survey': (('text', 'x', 'X'),)},
+                  {'key': 'b', 'label': 'B', 'module': 'm', 'requires': ('a',), 'survey': (('text', 'y', '${x}'),)}]
+    bank = QuestionBank(indicators, CHOICES)
+    bank.compile_form(['a'])
+    bank.compile_form(['a', 'b'])
+    stats = bank._cache.stats()
+    assert stats['misses'] == 2
+    assert stats['hits'] == 1
+
+def test_expand_uses_topological_order_regardless_of_input_order():
+    assert HH_QUESTION_BANK.expand(['muac', 'fcs']) == ['metadata', 'hh_roster', 'fcs', 'muac']
+    assert HH_QUESTION_BANK.expand([]) == ['metadata']
+    order = HH_QUESTION_BANK.order
+    for key in order:
+        assert all(order.index(required) <= order.index(key) for required in HH_QUESTION_BANK.closure(key))
+
+def test_expand_rejects_unknown_indicator():
+    with pytest.raises(ValueError):
+        HH_QUESTION_BANK.expand(['nope'])
@@ -0,0 +1,73 @@
+# ui/indicator_picker.py
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QAbstractItemView, QListWidgetItem
+from logic.tab4_search import IndicatorIndex
+from ui.models import IndicatorFilterProxy, IndicatorListModel
+
+class IndicatorPicker:
+    """
+    Connects a full indicator view, an ordered selection list and an optional search box to a question bank.
+
+    The full view shows the bank through an IndicatorFilterProxy, so typing in the search box filters it from
+    the bank's inverted index. Items hold the indicator key as Qt.ItemDataRole.UserRole data. Adding an
+    indicator (button or double click) also adds the indicators it requires, ahead of it; the selection can be
+    reordered by dragging.
+    """
+
+    def __init__(self, full_view, ordered_list, bank, search_input=None):
+        self.full_view = full_view
+        self.ordered_list = ordered_list
+        self.bank = bank
+        self.model = IndicatorListModel(bank, full_view)
+        self.proxy = IndicatorFilterProxy(IndicatorIndex(bank), full_view)
+        self.proxy.setSourceModel(self.model)
+        full_view.setModel(self.proxy)
+        full_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        full_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        full_view.doubleClicked.connect(lambda index: self.add([index.data(Qt.ItemDataRole.UserRole)]))
+        ordered_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        ordered_list.setDragDropMode(QAbstractItemView.DragDropMode.InternalMove)
+        if search_input is not None:
+            search_input.textChanged.connect(self.proxy.set_query)
+
+    def _item(self, key):
+        item = QListWidgetItem(self.bank.label(key))
+        item.setData(Qt.ItemDataRole.UserRole, key)
+        return item
+
+    def selected_keys(self):
+        """The keys in the ordered list, top to bottom."""
+        return [self.ordered_list.item(row).data(Qt.ItemDataRole.UserRole) for row in range(self.ordered_list.count())]
+
+    def add(self, keys=None):
+        """Append keys (default: the visible items selected in the full view) and their requirements not yet in the selection."""
+        if keys is None:
+            keys = [index.data(Qt.ItemDataRole.UserRole) for index in self.full_view.selectionModel().selectedIndexes()]
+            keys.sort(key=self.bank.keys.index)
+        present = set(self.selected_keys())
+        for key in keys:
+            for required in self.bank.closure(key):
+                if required not in present:
+                    present.add(required)
+                    self.ordered_list.addItem(self._item(required))
+
+    def remove(self):
+        """Remove the items selected in the ordered list."""
+        for item in self.ordered_list.selectedItems():
+            self.ordered_list.takeItem(self.ordered_list.row(item))
+
+    def set_keys(self, keys):
+        """
+        Replace the selection with keys, repainting once.
+
+        keys must already include their requirements, each after the ones it needs (e.g. from
+        QuestionBank.expand), so they are added as they are.
+        """
+        self.ordered_list.setUpdatesEnabled(False)
+        try:
+            self.ordered_list.clear()
+            for key in keys:
+                self.ordered_list.addItem(self._item(key))
+        finally:
+            self.ordered_list.setUpdatesEnabled(True)
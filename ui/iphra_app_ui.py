@@ -64,6 +64,10 @@ class Ui_MainWindow(object):
         self.ss_clustersampling = QtWidgets.QRadioButton(parent=self.layoutWidget_2)
         self.ss_clustersampling.setObjectName("ss_clustersampling")
         self.horizontalLayout_27.addWidget(self.ss_clustersampling)
+        self.ss_live_update = QtWidgets.QCheckBox(parent=self.layoutWidget_2)
+        self.ss_live_update.setChecked(True)
+        self.ss_live_update.setObjectName("ss_live_update")
+        self.horizontalLayout_27.addWidget(self.ss_live_update)
         self.layoutWidget1 = QtWidgets.QWidget(parent=self.samplesizeTab)
         self.layoutWidget1.setGeometry(QtCore.QRect(11, 11, 472, 701))
         self.layoutWidget1.setObjectName("layoutWidget1")
@@ -114,6 +118,12 @@ class Ui_MainWindow(object):
         self.ss_hh_calculate = QtWidgets.QPushButton(parent=self.layoutWidget1)
         self.ss_hh_calculate.setObjectName("ss_hh_calculate")
         self.verticalLayout_15.addWidget(self.ss_hh_calculate)
+        self.ss_hh_sweep = QtWidgets.QPushButton(parent=self.layoutWidget1)
+        self.ss_hh_sweep.setObjectName("ss_hh_sweep")
+        self.verticalLayout_15.addWidget(self.ss_hh_sweep)
+        self.ss_hh_simulate = QtWidgets.QPushButton(parent=self.layoutWidget1)
+        self.ss_hh_simulate.setObjectName("ss_hh_simulate")
+        self.verticalLayout_15.addWidget(self.ss_hh_simulate)
         self.gridLayout_5 = QtWidgets.QGridLayout()
         self.gridLayout_5.setObjectName("gridLayout_5")
         self.ss_hh_result_label = QtWidgets.QLabel(parent=self.layoutWidget1)
@@ -305,6 +315,9 @@ class Ui_MainWindow(object):
         self.ss_planning_calculate = QtWidgets.QPushButton(parent=self.layoutWidget2)
         self.ss_planning_calculate.setObjectName("ss_planning_calculate")
         self.horizontalLayout_26.addWidget(self.ss_planning_calculate)
+        self.ss_planning_optimize = QtWidgets.QPushButton(parent=self.layoutWidget2)
+        self.ss_planning_optimize.setObjectName("ss_planning_optimize")
+        self.horizontalLayout_26.addWidget(self.ss_planning_optimize)
         self.verticalLayout_20.addLayout(self.horizontalLayout_26)
         self.gridLayout = QtWidgets.QGridLayout()
         self.gridLayout.setObjectName("gridLayout")
@@ -412,16 +425,12 @@ class Ui_MainWindow(object):
         self.sampling_clustersampling_select.setObjectName("sampling_clustersampling_select")
         self.horizontalLayout_2.addWidget(self.sampling_clustersampling_select)
         self.verticalLayout_23.addLayout(self.horizontalLayout_2)
-        self.sampling_table = QtWidgets.QTableWidget(parent=self.layoutWidget3)
-        self.sampling_table.setRowCount(100)
-        self.sampling_table.setColumnCount(3)
+        self.sampling_filter_input = QtWidgets.QLineEdit(parent=self.layoutWidget3)
+        self.sampling_filter_input.setObjectName("sampling_filter_input")
+        self.verticalLayout_23.addWidget(self.sampling_filter_input)
+        self.sampling_table = QtWidgets.QTableView(parent=self.layoutWidget3)
+        self.sampling_table.setSortingEnabled(True)
         self.sampling_table.setObjectName("sampling_table")
-        item = QtWidgets.QTableWidgetItem()
-        self.sampling_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.sampling_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.sampling_table.setHorizontalHeaderItem(2, item)
         self.sampling_table.horizontalHeader().setVisible(True)
         self.verticalLayout_23.addWidget(self.sampling_table)
         self.horizontalLayout_28 = QtWidgets.QHBoxLayout()
@@ -441,6 +450,9 @@ class Ui_MainWindow(object):
         self.sampling_draw_sample = QtWidgets.QPushButton(parent=self.layoutWidget3)
         self.sampling_draw_sample.setObjectName("sampling_draw_sample")
         self.horizontalLayout_29.addWidget(self.sampling_draw_sample)
+        self.sampling_simulate_draws = QtWidgets.QPushButton(parent=self.layoutWidget3)
+        self.sampling_simulate_draws.setObjectName("sampling_simulate_draws")
+        self.horizontalLayout_29.addWidget(self.sampling_simulate_draws)
         self.sampling_export_sampling_results = QtWidgets.QPushButton(parent=self.layoutWidget3)
         self.sampling_export_sampling_results.setObjectName("sampling_export_sampling_results")
         self.horizontalLayout_29.addWidget(self.sampling_export_sampling_results)
@@ -484,8 +496,18 @@ class Ui_MainWindow(object):
         self.splitter = QtWidgets.QSplitter(parent=self.splitter_3)
         self.splitter.setOrientation(QtCore.Qt.Orientation.Horizontal)
         self.splitter.setObjectName("splitter")
-        self.tool_design_indicator_list_full = QtWidgets.QListWidget(parent=self.splitter)
+        self.tool_design_indicator_search_widget = QtWidgets.QWidget(parent=self.splitter)
+        self.tool_design_indicator_search_widget.setObjectName("tool_design_indicator_search_widget")
+        self.tool_design_indicator_search_layout = QtWidgets.QVBoxLayout(self.tool_design_indicator_search_widget)
+        self.tool_design_indicator_search_layout.setContentsMargins(0, 0, 0, 0)
+        self.tool_design_indicator_search_layout.setObjectName("tool_design_indicator_search_layout")
+        self.tool_design_indicator_search = QtWidgets.QLineEdit(parent=self.tool_design_indicator_search_widget)
+        self.tool_design_indicator_search.setClearButtonEnabled(True)
+        self.tool_design_indicator_search.setObjectName("tool_design_indicator_search")
+        self.tool_design_indicator_search_layout.addWidget(self.tool_design_indicator_search)
+        self.tool_design_indicator_list_full = QtWidgets.QListView(parent=self.tool_design_indicator_search_widget)
         self.tool_design_indicator_list_full.setObjectName("tool_design_indicator_list_full")
+        self.tool_design_indicator_search_layout.addWidget(self.tool_design_indicator_list_full)
         self.tool_design_indicator_list_ordered = QtWidgets.QListWidget(parent=self.splitter)
         self.tool_design_indicator_list_ordered.setObjectName("tool_design_indicator_list_ordered")
         self.main.addTab(self.toolTab, "")
@@ -502,8 +524,18 @@ class Ui_MainWindow(object):
         self.splitter_5.setGeometry(QtCore.QRect(560, 80, 512, 192))
         self.splitter_5.setOrientation(QtCore.Qt.Orientation.Horizontal)
         self.splitter_5.setObjectName("splitter_5")
-        self.ki_tool_communityki_indicator_list_full = QtWidgets.QListWidget(parent=self.splitter_5)
+        self.ki_tool_communityki_indicator_search_widget = QtWidgets.QWidget(parent=self.splitter_5)
+        self.ki_tool_communityki_indicator_search_widget.setObjectName("ki_tool_communityki_indicator_search_widget")
+        self.ki_tool_communityki_indicator_search_layout = QtWidgets.QVBoxLayout(self.ki_tool_communityki_indicator_search_widget)
+        self.ki_tool_communityki_indicator_search_layout.setContentsMargins(0, 0, 0, 0)
+        self.ki_tool_communityki_indicator_search_layout.setObjectName("ki_tool_communityki_indicator_search_layout")
+        self.ki_tool_communityki_indicator_search = QtWidgets.QLineEdit(parent=self.ki_tool_communityki_indicator_search_widget)
+        self.ki_tool_communityki_indicator_search.setClearButtonEnabled(True)
+        self.ki_tool_communityki_indicator_search.setObjectName("ki_tool_communityki_indicator_search")
+        self.ki_tool_communityki_indicator_search_layout.addWidget(self.ki_tool_communityki_indicator_search)
+        self.ki_tool_communityki_indicator_list_full = QtWidgets.QListView(parent=self.ki_tool_communityki_indicator_search_widget)
         self.ki_tool_communityki_indicator_list_full.setObjectName("ki_tool_communityki_indicator_list_full")
+        self.ki_tool_communityki_indicator_search_layout.addWidget(self.ki_tool_communityki_indicator_list_full)
         self.ki_tool_communityki_indicator_list_ordered = QtWidgets.QListWidget(parent=self.splitter_5)
         self.ki_tool_communityki_indicator_list_ordered.setObjectName("ki_tool_communityki_indicator_list_ordered")
         self.ki_tool_fslki_label = QtWidgets.QLabel(parent=self.kitoolsTab)
@@ -517,8 +549,18 @@ class Ui_MainWindow(object):
         self.splitter_6.setGeometry(QtCore.QRect(560, 350, 512, 192))
         self.splitter_6.setOrientation(QtCore.Qt.Orientation.Horizontal)
         self.splitter_6.setObjectName("splitter_6")
-        self.ki_tool_fslki_indicator_list_full = QtWidgets.QListWidget(parent=self.splitter_6)
+        self.ki_tool_fslki_indicator_search_widget = QtWidgets.QWidget(parent=self.splitter_6)
+        self.ki_tool_fslki_indicator_search_widget.setObjectName("ki_tool_fslki_indicator_search_widget")
+        self.ki_tool_fslki_indicator_search_layout = QtWidgets.QVBoxLayout(self.ki_tool_fslki_indicator_search_widget)
+        self.ki_tool_fslki_indicator_search_layout.setContentsMargins(0, 0, 0, 0)
+        self.ki_tool_fslki_indicator_search_layout.setObjectName("ki_tool_fslki_indicator_search_layout")
+        self.ki_tool_fslki_indicator_search = QtWidgets.QLineEdit(parent=self.ki_tool_fslki_indicator_search_widget)
+        self.ki_tool_fslki_indicator_search.setClearButtonEnabled(True)
+        self.ki_tool_fslki_indicator_search.setObjectName("ki_tool_fslki_indicator_search")
+        self.ki_tool_fslki_indicator_search_layout.addWidget(self.ki_tool_fslki_indicator_search)
+        self.ki_tool_fslki_indicator_list_full = QtWidgets.QListView(parent=self.ki_tool_fslki_indicator_search_widget)
         self.ki_tool_fslki_indicator_list_full.setObjectName("ki_tool_fslki_indicator_list_full")
+        self.ki_tool_fslki_indicator_search_layout.addWidget(self.ki_tool_fslki_indicator_list_full)
         self.ki_tool_fslki_indicator_list_ordered = QtWidgets.QListWidget(parent=self.splitter_6)
         self.ki_tool_fslki_indicator_list_ordered.setObjectName("ki_tool_fslki_indicator_list_ordered")
         self.ki_tool_healthki_label = QtWidgets.QLabel(parent=self.kitoolsTab)
@@ -532,8 +574,18 @@ class Ui_MainWindow(object):
         self.splitter_7.setGeometry(QtCore.QRect(20, 260, 512, 192))
         self.splitter_7.setOrientation(QtCore.Qt.Orientation.Horizontal)
         self.splitter_7.setObjectName("splitter_7")
-        self.ki_tool_healthki_indicator_list_full = QtWidgets.QListWidget(parent=self.splitter_7)
+        self.ki_tool_healthki_indicator_search_widget = QtWidgets.QWidget(parent=self.splitter_7)
+        self.ki_tool_healthki_indicator_search_widget.setObjectName("ki_tool_healthki_indicator_search_widget")
+        self.ki_tool_healthki_indicator_search_layout = QtWidgets.QVBoxLayout(self.ki_tool_healthki_indicator_search_widget)
+        self.ki_tool_healthki_indicator_search_layout.setContentsMargins(0, 0, 0, 0)
+        self.ki_tool_healthki_indicator_search_layout.setObjectName("ki_tool_healthki_indicator_search_layout")
+        self.ki_tool_healthki_indicator_search = QtWidgets.QLineEdit(parent=self.ki_tool_healthki_indicator_search_widget)
+        self.ki_tool_healthki_indicator_search.setClearButtonEnabled(True)
+        self.ki_tool_healthki_indicator_search.setObjectName("ki_tool_healthki_indicator_search")
+        self.ki_tool_healthki_indicator_search_layout.addWidget(self.ki_tool_healthki_indicator_search)
+        self.ki_tool_healthki_indicator_list_full = QtWidgets.QListView(parent=self.ki_tool_healthki_indicator_search_widget)
         self.ki_tool_healthki_indicator_list_full.setObjectName("ki_tool_healthki_indicator_list_full")
+        self.ki_tool_healthki_indicator_search_layout.addWidget(self.ki_tool_healthki_indicator_list_full)
         self.ki_tool_healthki_indicator_list_ordered = QtWidgets.QListWidget(parent=self.splitter_7)
         self.ki_tool_healthki_indicator_list_ordered.setObjectName("ki_tool_healthki_indicator_list_ordered")
         self.ki_tool_healthobs_label = QtWidgets.QLabel(parent=self.kitoolsTab)
@@ -547,15 +599,25 @@ class Ui_MainWindow(object):
         self.splitter_8.setGeometry(QtCore.QRect(20, 530, 512, 192))
         self.splitter_8.setOrientation(QtCore.Qt.Orientation.Horizontal)
         self.splitter_8.setObjectName("splitter_8")
-        self.ki_tool_healthobs_indicator_list_full = QtWidgets.QListWidget(parent=self.splitter_8)
+        self.ki_tool_healthobs_indicator_search_widget = QtWidgets.QWidget(parent=self.splitter_8)
+        self.ki_tool_healthobs_indicator_search_widget.setObjectName("ki_tool_healthobs_indicator_search_widget")
+        self.ki_tool_healthobs_indicator_search_layout = QtWidgets.QVBoxLayout(self.ki_tool_healthobs_indicator_search_widget)
+        self.ki_tool_healthobs_indicator_search_layout.setContentsMargins(0, 0, 0, 0)
+        self.ki_tool_healthobs_indicator_search_layout.setObjectName("ki_tool_healthobs_indicator_search_layout")
+        self.ki_tool_healthobs_indicator_search = QtWidgets.QLineEdit(parent=self.ki_tool_healthobs_indicator_search_widget)
+        self.ki_tool_healthobs_indicator_search.setClearButtonEnabled(True)
+        self.ki_tool_healthobs_indicator_search.setObjectName("ki_tool_healthobs_indicator_search")
+        self.ki_tool_healthobs_indicator_search_layout.addWidget(self.ki_tool_healthobs_indicator_search)
+        self.ki_tool_healthobs_indicator_list_full = QtWidgets.QListView(parent=self.ki_tool_healthobs_indicator_search_widget)
         self.ki_tool_healthobs_indicator_list_full.setObjectName("ki_tool_healthobs_indicator_list_full")
+        self.ki_tool_healthobs_indicator_search_layout.addWidget(self.ki_tool_healthobs_indicator_list_full)
         self.ki_tool_healthobs_indicator_list_ordered = QtWidgets.QListWidget(parent=self.splitter_8)
         self.ki_tool_healthobs_indicator_list_ordered.setObjectName("ki_tool_healthobs_indicator_list_ordered")
         self.ki_tool_design_instructions = QtWidgets.QTextBrowser(parent=self.kitoolsTab)
         self.ki_tool_design_instructions.setGeometry(QtCore.QRect(20, 20, 511, 151))
         self.ki_tool_design_instructions.setObjectName("ki_tool_design_instructions")
         self.layoutWidget5 = QtWidgets.QWidget(parent=self.kitoolsTab)
-        self.layoutWidget5.setGeometry(QtCore.QRect(610, 570, 421, 131))
+        self.layoutWidget5.setGeometry(QtCore.QRect(610, 570, 421, 165))
         self.layoutWidget5.setObjectName("layoutWidget5")
         self.gridLayout_6 = QtWidgets.QGridLayout(self.layoutWidget5)
         self.gridLayout_6.setContentsMargins(0, 0, 0, 0)
@@ -590,6 +652,9 @@ class Ui_MainWindow(object):
         self.ki_tool_waterpointobs_create_xlsform = QtWidgets.QPushButton(parent=self.layoutWidget5)
         self.ki_tool_waterpointobs_create_xlsform.setObjectName("ki_tool_waterpointobs_create_xlsform")
         self.gridLayout_6.addWidget(self.ki_tool_waterpointobs_create_xlsform, 2, 1, 1, 1)
+        self.ki_tool_create_all_xlsforms = QtWidgets.QPushButton(parent=self.layoutWidget5)
+        self.ki_tool_create_all_xlsforms.setObjectName("ki_tool_create_all_xlsforms")
+        self.gridLayout_6.addWidget(self.ki_tool_create_all_xlsforms, 3, 0, 1, 2)
         self.layoutWidget6 = QtWidgets.QWidget(parent=self.kitoolsTab)
         self.layoutWidget6.setGeometry(QtCore.QRect(690, 40, 369, 29))
         self.layoutWidget6.setObjectName("layoutWidget6")
@@ -779,8 +844,13 @@ class Ui_MainWindow(object):
         self.quality_mortality_summary_table_enum.setObjectName("quality_mortality_summary_table_enum")
         self.quality_sectoral_tab.addTab(self.quality_mortality_tab, "")
         self.quality_instructions = QtWidgets.QTextBrowser(parent=self.qualityTab)
-        self.quality_instructions.setGeometry(QtCore.QRect(10, 10, 361, 701))
+        self.quality_instructions.setGeometry(QtCore.QRect(10, 10, 361, 661))
         self.quality_instructions.setObjectName("quality_instructions")
+        self.quality_group_by_input = QtWidgets.QComboBox(parent=self.qualityTab)
+        self.quality_group_by_input.setGeometry(QtCore.QRect(10, 681, 361, 30))
+        self.quality_group_by_input.setObjectName("quality_group_by_input")
+        self.quality_group_by_input.addItem("")
+        self.quality_group_by_input.addItem("")
         self.main.addTab(self.qualityTab, "")
         self.datacleaningTab = QtWidgets.QWidget()
         self.datacleaningTab.setObjectName("datacleaningTab")
@@ -1413,12 +1483,15 @@ class Ui_MainWindow(object):
         self.ss_srs_select.setText(_translate("MainWindow", "Simple Random Sampling"))
         self.ss_systematic_select.setText(_translate("MainWindow", "Systematic Random Sampling"))
         self.ss_clustersampling.setText(_translate("MainWindow", "Cluster Sampling"))
+        self.ss_live_update.setText(_translate("MainWindow", "Live Update"))
         self.ss_hh_box_label.setText(_translate("MainWindow", "Household Sample Size Calculator"))
         self.ss_hh_prev_label.setText(_translate("MainWindow", "Estimated Prevalence (%)"))
         self.ss_hh_precision_label.setText(_translate("MainWindow", "Desired Precision (+/-)"))
         self.ss_hh_deff_label.setText(_translate("MainWindow", "Design Effect"))
         self.ss_hh_nonresponse_label.setText(_translate("MainWindow", "Non-Response Rate (%)"))
         self.ss_hh_calculate.setText(_translate("MainWindow", "Calculate"))
+        self.ss_hh_sweep.setText(_translate("MainWindow", "Sensitivity Grid..."))
+        self.ss_hh_simulate.setText(_translate("MainWindow", "Simulate Precision..."))
         self.ss_hh_result_label.setText(_translate("MainWindow", "Sample Size (Households)"))
         self.ss_hh_result_value.setText(_translate("MainWindow", "TextLabel"))
         self.ss_ind_box_label.setText(_translate("MainWindow", "Individual Sample Size Calculator"))
@@ -1449,6 +1522,7 @@ class Ui_MainWindow(object):
         self.ss_mortality_hh_value.setText(_translate("MainWindow", "TextLabel"))
         self.ss_planning_box_label.setText(_translate("MainWindow", "Planning Parameters"))
         self.ss_planning_calculate.setText(_translate("MainWindow", "Calculate"))
+        self.ss_planning_optimize.setText(_translate("MainWindow", "Optimize..."))
         self.ss_planning_nonwork_label.setText(_translate("MainWindow", "# non-work hours (intros, breaks, etc.) per day"))
         self.ss_planning_interview_label.setText(_translate("MainWindow", "Avg. Interview Time + Walking to Next HH"))
         self.ss_planning_end_label.setText(_translate("MainWindow", "Daily End Time"))
@@ -1466,21 +1540,18 @@ class Ui_MainWindow(object):
         self.sampling_srs_select.setText(_translate("MainWindow", "Simple Random Sampling"))
         self.sampling_systematic_select.setText(_translate("MainWindow", "Systematic Random Sampling"))
         self.sampling_clustersampling_select.setText(_translate("MainWindow", "Cluster Sampling"))
-        item = self.sampling_table.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "PSU Name"))
-        item = self.sampling_table.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Population Size"))
-        item = self.sampling_table.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Selected PSUs"))
+        self.sampling_filter_input.setPlaceholderText(_translate("MainWindow", "Filter PSUs by name..."))
         self.sampling_num_psu_label.setText(_translate("MainWindow", "Number of Clusters/Primary Sampling Units to Sample:"))
         self.sampling_load_sframe.setText(_translate("MainWindow", "Load Sampling Frame (CSV)"))
         self.sampling_draw_sample.setText(_translate("MainWindow", "Draw Sample"))
+        self.sampling_simulate_draws.setText(_translate("MainWindow", "Simulate Replicate Draws"))
         self.sampling_export_sampling_results.setText(_translate("MainWindow", "Export Sampling Results"))
         self.main.setTabText(self.main.indexOf(self.samplingTab), _translate("MainWindow", "Sampling"))
         self.tool_design_indicator_select_label.setText(_translate("MainWindow", "Household Kobo Tool Builder"))
         self.tool_design_add_indicator.setText(_translate("MainWindow", "Add Indicators"))
         self.tool_design_remove_indicator.setText(_translate("MainWindow", "Remove Indicators"))
         self.tool_design_export_xlsform.setText(_translate("MainWindow", "Create XLSForm"))
+        self.tool_design_indicator_search.setPlaceholderText(_translate("MainWindow", "Search indicators..."))
         self.main.setTabText(self.main.indexOf(self.toolTab), _translate("MainWindow", "HH Tool Design"))
         self.ki_tool_communityki_label.setText(_translate("MainWindow", "Community Key Informant Tool Builder"))
         self.ki_tool_fslki_label.setText(_translate("MainWindow", "FSL Provider Key Informant Tool Builder"))
@@ -1492,18 +1563,23 @@ class Ui_MainWindow(object):
         self.ki_tool_latrineobs_create_xlsform.setText(_translate("MainWindow", "Create XLSForm"))
         self.ki_tool_waterpointobs_label.setText(_translate("MainWindow", "Water Point Observation Tool"))
         self.ki_tool_waterpointobs_create_xlsform.setText(_translate("MainWindow", "Create XLSForm"))
+        self.ki_tool_create_all_xlsforms.setText(_translate("MainWindow", "Create All XLSForms..."))
         self.ki_tool_communityki_add_indicator.setText(_translate("MainWindow", "Add Indicators"))
         self.ki_tool_communityki_remove_indicator.setText(_translate("MainWindow", "Remove Indicators"))
         self.ki_tool_communityki_create_xlsform.setText(_translate("MainWindow", "Create XLSForm"))
+        self.ki_tool_communityki_indicator_search.setPlaceholderText(_translate("MainWindow", "Search indicators..."))
         self.ki_tool_fslki_add_indicator.setText(_translate("MainWindow", "Add Indicators"))
         self.ki_tool_fslki_remove_indicator.setText(_translate("MainWindow", "Remove Indicators"))
         self.ki_tool_fslki_create_xlsform.setText(_translate("MainWindow", "Create XLSForm"))
+        self.ki_tool_fslki_indicator_search.setPlaceholderText(_translate("MainWindow", "Search indicators..."))
         self.ki_tool_healthki_add_indicator.setText(_translate("MainWindow", "Add Indicators"))
         self.ki_tool_healthki_remove_indicator.setText(_translate("MainWindow", "Remove Indicators"))
         self.ki_tool_healthki_create_xlsform.setText(_translate("MainWindow", "Create XLSForm"))
+        self.ki_tool_healthki_indicator_search.setPlaceholderText(_translate("MainWindow", "Search indicators..."))
         self.ki_tool_healthobs_add_indicator.setText(_translate("MainWindow", "Add Indicators"))
         self.ki_tool_healthobs_remove_indicator.setText(_translate("MainWindow", "Remove Indicators"))
         self.ki_tool_healthobs_create_xlsform.setText(_translate("MainWindow", "Create XLSForm"))
+        self.ki_tool_healthobs_indicator_search.setPlaceholderText(_translate("MainWindow", "Search indicators..."))
         self.main.setTabText(self.main.indexOf(self.kitoolsTab), _translate("MainWindow", "KI Tool Design"))
         self.data_import_file_select.setText(_translate("MainWindow", "Import IPHRA HH Survey Excel File"))
         self.data_import_sheet_select_label.setText(_translate("MainWindow", "Excel Sheet Select"))
@@ -1518,6 +1594,8 @@ class Ui_MainWindow(object):
         self.quality_sectoral_tab.setTabText(self.quality_sectoral_tab.indexOf(self.quality_nutrition_tab), _translate("MainWindow", "Nutrition"))
         self.quality_sectoral_tab.setTabText(self.quality_sectoral_tab.indexOf(self.quality_muac_tab), _translate("MainWindow", "MUAC"))
         self.quality_sectoral_tab.setTabText(self.quality_sectoral_tab.indexOf(self.quality_mortality_tab), _translate("MainWindow", "Mortality"))
+        self.quality_group_by_input.setItemText(0, _translate("MainWindow", "Flags by enumerator"))
+        self.quality_group_by_input.setItemText(1, _translate("MainWindow", "Flags by team"))
         self.main.setTabText(self.main.indexOf(self.qualityTab), _translate("MainWindow", "Data Quality"))
         self.cleaning_create_cleaning_log.setText(_translate("MainWindow", "Generate Cleaning Logs from Imported Data"))
         self.cleaning_import_cleaning_log.setText(_translate("MainWindow", "Import Cleaning Logs"))
@@ -0,0 +1,80 @@
+# ui/live.py
+#
+# Live recalculation for input panels. Edits are collected until the user
+# pauses typing, then only the outputs that depend on the edited inputs (per a
+# logic.dependencies.DependencyGraph) are recalculated; all others are left
+# untouched. Handlers should start heavy work on a TaskRunner so the event loop
+# is never blocked.
+
+from PyQt6.QtCore import QObject, QTimer
+from PyQt6.QtWidgets import QAbstractButton, QComboBox, QDateTimeEdit, QLineEdit
+
+from ui.qt_validators import suppressed_errors
+
+DEBOUNCE_MSECS = 300
+INVALID_TEXT = "-"
+
+def _change_signal(widget):
+    if isinstance(widget, QLineEdit):
+        return widget.textChanged
+    if isinstance(widget, QAbstractButton):
+        return widget.toggled
+    if isinstance(widget, QDateTimeEdit):
+        return widget.dateTimeChanged
+    if isinstance(widget, QComboBox):
+        return widget.currentIndexChanged
+    raise TypeError(f"Cannot watch widgets of type {type(widget).__name__}.")
+
+class LiveRecalculator(QObject):
+    """
+    Recalculates the nodes of a dependency graph shortly after their input widgets change.
+
+    Parameters:
+        graph (logic.dependencies.DependencyGraph): Inputs are widget names, nodes are outputs
+        delay (int): Milliseconds without edits before recalculating
+    """
+
+    def __init__(self, graph, delay=DEBOUNCE_MSECS, parent=None):
+        super().__init__(parent)
+        self.graph = graph
+        self.enabled = True
+        self._handlers = {}
+        self._changed = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.recalculate)
+
+    def watch(self, name, widget):
+        """Treat changes to widget as changes to the graph input name."""
+        _change_signal(widget).connect(lambda *_: self.input_changed(name))
+
+    def set_handler(self, node, handler, outputs=()):
+        """
+        Recalculate node by calling handler(). If the handler hits invalid input (it calls show_error), the
+        outputs (labels) are set to INVALID_TEXT instead of keeping a result for old inputs.
+        """
+        self._handlers[node] = (handler, tuple(outputs))
+
+    def input_changed(self, name):
+        if not self.enabled:
+            return
+        self._changed.add(name)
+        self._timer.start()  # restarts the countdown while the user keeps typing
+
+    def recalculate(self):
+        """Run the handlers of every node affected by the inputs changed since the last recalculation."""
+        self._timer.stop()
+        changed, self._changed = self._changed, set()
+        recalculated = []
+        for node in self.graph.affected(changed):
+            if node not in self._handlers:
+                continue
+            handler, outputs = self._handlers[node]
+            with suppressed_errors() as errors:
+                handler()
+            if errors:
+                for label in outputs:
+                    label.setText(INVALID_TEXT)
+            recalculated.append(node)
+        return recalculated
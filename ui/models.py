@@ -0,0 +1,346 @@
+# ui/models.py
+#
+# Qt item models that read directly from NumPy-backed logic objects. Views only
+# ask for visible cells, so nothing is converted to Python objects up front.
+
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from PyQt6.QtCore import QAbstractItemModel, QAbstractListModel, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+
+class SampleSizeGridModel(QAbstractTableModel):
+    """
+    Long-format table over a logic.tab2_sweep.SampleSizeGrid: one row per grid cell, one column per swept
+    parameter plus the sample size. Rows are exposed in pages through canFetchMore/fetchMore.
+    """
+
+    PAGE_SIZE = 10_000
+
+    def __init__(self, grid, parent=None):
+        super().__init__(parent)
+        self._grid = grid
+        self._headers = [name.replace('_', ' ').capitalize() for name in grid.axis_names] + ['Sample size']
+        self._loaded = min(self.PAGE_SIZE, grid.size)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < self._grid.size
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.PAGE_SIZE, self._grid.size - self._loaded)
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        row, column = index.row(), index.column()
+        if column < len(self._grid.axis_names):
+            return f"{self._grid.cell_parameters(row, row + 1)[column][0]:g}"
+        return str(int(self._grid.cell_sample_sizes(row, row + 1)[0]))
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+class SamplingFrameModel(QAbstractTableModel):
+    """
+    Table over a logic.tab3_frame.SamplingFrame with PSU Name / Population Size / Selected PSUs columns.
+
+    The model keeps an index array of the frame rows currently shown. Sorting and filtering only rebuild that
+    array with NumPy, and cells are formatted when the view asks for them.
+    """
+
+    HEADERS = ('PSU Name', 'Population Size', 'Selected PSUs')
+
+    def __init__(self, frame, parent=None):
+        super().__init__(parent)
+        self._frame = frame
+        self._selected = np.zeros(len(frame), dtype=bool)
+        self._filter = ''
+        self._sort = None
+        self._rows = np.arange(len(frame))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def frame_row(self, row):
+        """Return the frame position shown at a view row."""
+        return int(self._rows[row])
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return self._frame.name(row)
+            elif column == 1:
+                return str(self._frame.populations[row])
+            return "Yes" if self._selected[row] else ""
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == 1:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return str(self._rows[section] + 1)
+
+    def set_selected(self, selected):
+        """Mark the PSUs at the given frame positions as selected, clearing any previous selection."""
+        self._selected[:] = False
+        self._selected[selected] = True
+        if self._sort is not None and self._sort[0] == 2:
+            self.sort(*self._sort)
+        elif len(self._rows):
+            self.dataChanged.emit(self.index(0, 2), self.index(len(self._rows) - 1, 2))
+
+    def set_filter(self, text):
+        """Show only PSUs whose name contains text (case-insensitive)."""
+        self._filter = text.strip().casefold()
+        self._update_rows()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort = (column, order) if 0 <= column < len(self.HEADERS) else None
+        self._update_rows()
+
+    def _update_rows(self):
+        self.beginResetModel()
+        if self._filter:
+            matches = self._frame.folded_labels.contains(self._filter)
+            rows = np.flatnonzero(matches[self._frame.name_codes])
+        else:
+            rows = np.arange(len(self._frame))
+
+        if self._sort is not None:
+            column, order = self._sort
+            # name labels are sorted, so ordering by code orders by name
+            keys = (self._frame.name_codes, self._frame.populations, self._selected)[column][rows]
+            positions = np.argsort(keys, kind='stable')
+            if order == Qt.SortOrder.DescendingOrder:
+                positions = positions[::-1]
+            rows = rows[positions]
+        self._rows = rows
+        self.endResetModel()
+
+class SurveyDataModel(QAbstractTableModel):
+    """
+    Table over a logic.tab6_import.SurveyData, usually memory-mapped from the import cache.
+
+    Cells are formatted a block at a time: when the view asks for a cell, the block_rows rows around it are
+    formatted for that column only and kept in an LRU cache of max_blocks blocks. Scrolling reads only the
+    pages of the columns on screen, and the table as a whole is never converted to strings.
+    """
+
+    def __init__(self, data, block_rows=128, max_blocks=1024, parent=None):
+        super().__init__(parent)
+        self._data = data
+        self._columns = list(data.columns.values())
+        self._names = data.names
+        self._block_rows = block_rows
+        self._max_blocks = max_blocks
+        self._blocks = OrderedDict()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._data)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def _block(self, block, column):
+        key = (block, column)
+        texts = self._blocks.get(key)
+        if texts is not None:
+            self._blocks.move_to_end(key)
+            return texts
+        start = block * self._block_rows
+        texts = self._columns[column].text(slice(start, start + self._block_rows))
+        self._blocks[key] = texts
+        if len(self._blocks) > self._max_blocks:
+            self._blocks.popitem(last=False)
+        return texts
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            block, offset = divmod(index.row(), self._block_rows)
+            return self._block(block, index.column())[offset]
+        if role == Qt.ItemDataRole.TextAlignmentRole and self._columns[index.column()].kind == 'number':
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._names[section]
+        return str(section + 1)
+
+    def cached_blocks(self):
+        return len(self._blocks)
+
+class DataFrameModel(QAbstractTableModel):
+    """A small pandas DataFrame shown read-only, e.g. a quality summary. Numbers are right-aligned; NaN is blank."""
+
+    def __init__(self, frame, parent=None):
+        super().__init__(parent)
+        self._frame = frame
+        self._numeric = [pd.api.types.is_numeric_dtype(dtype) for dtype in frame.dtypes]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._frame)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._frame.columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self._frame.iat[index.row(), index.column()]
+            if pd.isna(value):
+                return ""
+            return f"{value:,}" if isinstance(value, (int, np.integer)) else str(value)
+        if role == Qt.ItemDataRole.TextAlignmentRole and self._numeric[index.column()]:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return str(self._frame.columns[section])
+        return str(section + 1)
+
+class IndicatorListModel(QAbstractListModel):
+    """The indicators of a logic.tab4_xlsform.QuestionBank: label for display, key as UserRole data."""
+
+    def __init__(self, bank, parent=None):
+        super().__init__(parent)
+        self._bank = bank
+        self._keys = bank.keys
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        key = self._keys[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._bank.label(key)
+        if role == Qt.ItemDataRole.UserRole:
+            return key
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"Sector: {self._bank.definition(key)['module']}"
+        return None
+
+class IndicatorFilterProxy(QSortFilterProxyModel):
+    """
+    Filters an IndicatorListModel with a logic.tab4_search.IndicatorIndex.
+
+    set_query computes the matching rows once from the index; filterAcceptsRow is then a mask lookup.
+    """
+
+    def __init__(self, index, parent=None):
+        super().__init__(parent)
+        self._index = index
+        self._accepted = None
+
+    def set_query(self, text):
+        self._accepted = self._index.match(text) if text.strip() else None
+        self.invalidateRowsFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self._accepted is None or bool(self._accepted[source_row])
+
+class FormPreviewModel(QAbstractItemModel):
+    """
+    A logic.tab4_preview tree shown in a QTreeView, loaded lazily.
+
+    A node's rows are only handed to the view when it asks for them (canFetchMore/fetchMore), in batches of
+    fetch_batch, so the view lays out the top-level groups and whatever the user expands, not the whole form.
+    """
+
+    HEADERS = ("Question", "Name", "Type", "Details")
+
+    def __init__(self, root, fetch_batch=200, parent=None):
+        super().__init__(parent)
+        self._root = root
+        self._fetch_batch = fetch_batch
+        self._fetched = {}
+
+    def _node(self, index):
+        return index.internalPointer() if index.isValid() else self._root
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self._node(parent).children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return self._fetched.get(id(self._node(parent)), 0)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        return parent.column() <= 0 and len(self._node(parent)) > 0
+
+    def canFetchMore(self, parent):
+        node = self._node(parent)
+        return self._fetched.get(id(node), 0) < len(node)
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        fetched = self._fetched.get(id(node), 0)
+        count = min(self._fetch_batch, len(node) - fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(parent, fetched, fetched + count - 1)
+        self._fetched[id(node)] = fetched + count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return (node.label, node.name, node.type, node.details)[index.column()]
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == 3:
+            return node.details or None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
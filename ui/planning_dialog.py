@@ -0,0 +1,133 @@
+# ui/planning_dialog.py
+
+from PyQt6.QtWidgets import (QAbstractItemView, QComboBox, QDialog, QDialogButtonBox, QFormLayout, QHBoxLayout, QLabel,
+                             QLineEdit, QTableWidget, QTableWidgetItem, QVBoxLayout)
+
+from logic.tab2_planning import optimize_fieldwork
+from logic.validators import check_number
+
+TOP_PLANS = 25
+HEADERS = ("Teams", "Enumerators / Team", "PSUs / Team / Day", "Households / PSU", "PSUs", "Days", "Cost")
+
+class FieldworkOptimizerDialog(QDialog):
+    """
+    Searches teams x enumerators x cluster size for the fastest or cheapest fieldwork plan.
+
+    The search is re-run on every edit. The plan chosen with OK is available as selected_plan
+    (teams, enumerators, psus_per_day, cluster_size).
+    """
+
+    def __init__(self, households, available_minutes, interview_minutes, travel_minutes, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Fieldwork Planning Optimizer")
+        self.resize(720, 560)
+        self._workday = (households, available_minutes, interview_minutes, travel_minutes)
+        self._plans = None
+        self._costs = None
+        self.selected_plan = None
+
+        self.max_teams_input = QLineEdit("10")
+        self.max_enumerators_input = QLineEdit("6")
+        self.cluster_min_input = QLineEdit("10")
+        self.cluster_max_input = QLineEdit("30")
+        self.objective_input = QComboBox()
+        self.objective_input.addItem("Fewest days", 'days')
+        self.objective_input.addItem("Lowest cost", 'cost')
+        self.enumerator_cost_input = QLineEdit("1")
+        self.team_cost_input = QLineEdit("0")
+        self.max_days_input = QLineEdit()
+        self.max_days_input.setPlaceholderText("No limit")
+
+        cluster_row = QHBoxLayout()
+        for caption, edit in (("from", self.cluster_min_input), ("to", self.cluster_max_input)):
+            cluster_row.addWidget(QLabel(caption))
+            cluster_row.addWidget(edit)
+
+        form = QFormLayout()
+        form.addRow("Maximum # of teams", self.max_teams_input)
+        form.addRow("Maximum # of enumerators / team", self.max_enumerators_input)
+        form.addRow("Households / PSU", cluster_row)
+        form.addRow("Optimize for", self.objective_input)
+        form.addRow("Daily cost per enumerator", self.enumerator_cost_input)
+        form.addRow("Daily cost per team (vehicle, supervisor)", self.team_cost_input)
+        form.addRow("Maximum # of days", self.max_days_input)
+
+        self.summary_label = QLabel()
+        self.table = QTableWidget(0, len(HEADERS))
+        self.table.setHorizontalHeaderLabels(HEADERS)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(form)
+        layout.addWidget(self.summary_label)
+        layout.addWidget(self.table)
+        layout.addWidget(buttons)
+
+        for edit in (self.max_teams_input, self.max_enumerators_input, self.cluster_min_input, self.cluster_max_input,
+                     self.enumerator_cost_input, self.team_cost_input, self.max_days_input):
+            edit.textChanged.connect(self.optimize)
+        self.objective_input.currentIndexChanged.connect(self.optimize)
+        self.optimize()
+
+    def _read_inputs(self):
+        # invalid input while typing is shown in the summary instead of a message box
+        values = {}
+        for name, edit, expected_type, max_value in (
+                ('max_teams', self.max_teams_input, int, 500), ('max_enumerators', self.max_enumerators_input, int, 50),
+                ('cluster_min', self.cluster_min_input, int, 200), ('cluster_max', self.cluster_max_input, int, 200),
+                ('enumerator_day_cost', self.enumerator_cost_input, float, None), ('team_day_cost', self.team_cost_input, float, None)):
+            min_value = 1 if expected_type is int else 0
+            values[name], error = check_number(edit.text(), name, expected_type, min_value, max_value)
+            if error is not None:
+                return None
+        values['max_days'] = None
+        if self.max_days_input.text().strip():
+            values['max_days'], error = check_number(self.max_days_input.text(), 'max_days', int, min_value=1)
+            if error is not None:
+                return None
+        if values['cluster_max'] < values['cluster_min']:
+            return None
+        return values
+
+    def optimize(self):
+        values = self._read_inputs()
+        if values is None:
+            self._show_plans(None, "Enter up to 500 teams, 50 enumerators / team and 1 to 200 households / PSU.")
+            return
+        households, available_minutes, interview_minutes, travel_minutes = self._workday
+        objective = self.objective_input.currentData()
+        self._plans = optimize_fieldwork(
+            households, available_minutes, interview_minutes, travel_minutes, values['max_teams'], values['max_enumerators'],
+            range(values['cluster_min'], values['cluster_max'] + 1), objective,
+            values['enumerator_day_cost'], values['team_day_cost'], values['max_days'])
+        self._costs = self._plans.cost(values['enumerator_day_cost'], values['team_day_cost'])
+        if len(self._plans.num_days) == 0:
+            self._show_plans(None, "No plan fits these limits.")
+        else:
+            self._show_plans(self._plans, f"{len(self._plans.num_days):,} feasible plans for {households:,} households, best {TOP_PLANS} shown.")
+
+    def _show_plans(self, plans, message):
+        self.summary_label.setText(message)
+        rows = 0 if plans is None else min(TOP_PLANS, len(plans.num_days))
+        self.table.setRowCount(rows)
+        for row in range(rows):
+            values = (plans.teams[row], plans.enumerators[row], plans.psus_per_day[row], plans.cluster_size[row],
+                      plans.num_psus[row], plans.num_days[row])
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(str(int(value))))
+            self.table.setItem(row, len(values), QTableWidgetItem(f"{self._costs[row]:,.0f}"))
+        if rows:
+            self.table.selectRow(0)
+
+    def accept(self):
+        row = self.table.currentRow()
+        if self._plans is not None and 0 <= row < self.table.rowCount():
+            self.selected_plan = tuple(int(getattr(self._plans, name)[row])
+                                       for name in ('teams', 'enumerators', 'psus_per_day', 'cluster_size'))
+        super().accept()
@@ -0,0 +1,94 @@
+# ui/precision_dialog.py
+
+from PyQt6.QtWidgets import QDialog, QFormLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QVBoxLayout
+
+from logic.tab2_precision import icc_from_design_effect, simulate_precision
+from ui.qt_validators import validate_float, validate_int
+
+DEFAULT_CLUSTERS = 30
+DEFAULT_CLUSTER_SIZE = 20
+
+class PrecisionSimulationDialog(QDialog):
+    """Simulates a household cluster survey many times and reports the precision it actually achieves."""
+
+    def __init__(self, tasks, proportion=50, margin_of_error=5, design_effect=2, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Precision Simulation")
+        self.resize(480, 420)
+        self._tasks = tasks
+
+        icc = icc_from_design_effect(max(design_effect, 1), DEFAULT_CLUSTER_SIZE)
+        self.prevalence_input = QLineEdit(f"{proportion:g}")
+        self.precision_input = QLineEdit(f"{margin_of_error:g}")
+        self.icc_input = QLineEdit(f"{icc:.4g}")
+        self.clusters_input = QLineEdit(str(DEFAULT_CLUSTERS))
+        self.cluster_size_input = QLineEdit(str(DEFAULT_CLUSTER_SIZE))
+        self.replicates_input = QLineEdit("10000")
+
+        form = QFormLayout()
+        form.addRow("Estimated Prevalence (%)", self.prevalence_input)
+        form.addRow("Desired Precision (+/- %)", self.precision_input)
+        form.addRow("Intra-Cluster Correlation (ICC)", self.icc_input)
+        form.addRow("Number of Clusters", self.clusters_input)
+        form.addRow("Households per Cluster", self.cluster_size_input)
+        form.addRow("Number of Simulated Surveys", self.replicates_input)
+
+        self.simulate_button = QPushButton("Simulate")
+        self.summary_label = QLabel()
+        self.summary_label.setWordWrap(True)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.simulate_button)
+        buttons.addStretch()
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(form)
+        layout.addLayout(buttons)
+        layout.addWidget(self.summary_label)
+        layout.addStretch()
+
+        self.simulate_button.clicked.connect(self.simulate)
+
+    def simulate(self):
+        proportion = validate_float(self.prevalence_input.text(), "Estimated Prevalence (%)", 0.01, 99.99, parent=self)
+        margin_of_error = validate_float(self.precision_input.text(), "Desired Precision (+/- %)", 0.01, 100, parent=self)
+        icc = validate_float(self.icc_input.text(), "Intra-Cluster Correlation (ICC)", 0, 0.99, parent=self)
+        clusters = validate_int(self.clusters_input.text(), "Number of Clusters", 2, parent=self)
+        cluster_size = validate_int(self.cluster_size_input.text(), "Households per Cluster", 1, parent=self)
+        replicates = validate_int(self.replicates_input.text(), "Number of Simulated Surveys", 100, 1_000_000, parent=self)
+        if None in (proportion, margin_of_error, icc, clusters, cluster_size, replicates):
+            return
+
+        self.simulate_button.setEnabled(False)
+        self.summary_label.setText("Simulating...")
+        self._tasks.submit(simulate_precision, proportion / 100, margin_of_error / 100, icc, clusters, cluster_size, replicates,
+                           key='ss_precision', with_progress=True,
+                           on_progress=self.show_progress, on_result=self.show_summary, on_error=self.show_error,
+                           on_finished=self.simulation_finished)
+
+    def done(self, result):
+        # closing stops a running simulation. Cancellation is what keeps a deleted dialog from being updated:
+        # TaskRunner wraps the result and error slots in lambdas it owns and drops their deliveries once the
+        # task is cancelled. Only the progress and finished slots are bound methods that Qt disconnects when
+        # the dialog is deleted.
+        self._tasks.cancel('ss_precision')
+        super().done(result)
+
+    def show_progress(self, done, total):
+        self.summary_label.setText(f"Simulating... {done:,} of {total:,}")
+
+    def simulation_finished(self):
+        self.simulate_button.setEnabled(True)
+
+    def show_summary(self, summary):
+        percentiles = summary.half_width_percentiles((5, 50, 95))
+        self.summary_label.setText(
+            f"{summary.replicates:,} simulated surveys of {summary.clusters} clusters x {summary.cluster_size} households\n"
+            f"Achieved precision (+/- %): median {100 * percentiles[50]:.2f}, "
+            f"90% of surveys between {100 * percentiles[5]:.2f} and {100 * percentiles[95]:.2f}\n"
+            f"Surveys meeting the target of +/- {100 * summary.margin_of_error:.2f}%: {100 * summary.share_meeting_target:.1f}%\n"
+            f"Confidence interval coverage: {100 * summary.coverage:.1f}%\n"
+            f"Empirical design effect: {summary.design_effect:.2f}")
+
+    def show_error(self, error):
+        self.summary_label.setText(f"Simulation failed: {error}")
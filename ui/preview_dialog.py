@@ -0,0 +1,27 @@
+# ui/preview_dialog.py
+
+from PyQt6.QtWidgets import QDialog, QTreeView, QVBoxLayout
+
+from logic.tab4_preview import build_preview
+from ui.models import FormPreviewModel
+
+class FormPreviewDialog(QDialog):
+    """Shows a compiled form as a tree of groups and questions, without writing it to a workbook."""
+
+    def __init__(self, form, title, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Preview: {title}")
+        self.resize(900, 600)
+
+        self.model = FormPreviewModel(build_preview(form), parent=self)
+        self.view = QTreeView()
+        # every row is one line, so the view can skip measuring rows it does not show
+        self.view.setUniformRowHeights(True)
+        self.view.setAlternatingRowColors(True)
+        self.view.setModel(self.model)
+        self.view.setColumnWidth(0, 360)
+        self.view.setColumnWidth(1, 160)
+        self.view.setColumnWidth(2, 160)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.view)
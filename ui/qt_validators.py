@@ -0,0 +1,44 @@
+# ui/qt_validators.py
+#
+# Thin Qt adapter over logic.validators: same checks, but errors are shown to
+# the user in a message box.
+
+from contextlib import contextmanager
+from PyQt6.QtWidgets import QMessageBox
+from logic.validators import check_number
+
+# message lists of active suppressed_errors() blocks, innermost last
+_suppressed = []
+
+def validate_float(text, name, min_value=None, max_value=None, parent=None):
+    value, error = check_number(text, name, float, min_value, max_value)
+    if error is not None:
+        show_error(str(error), parent)
+    return value
+
+def validate_int(text, name, min_value=None, max_value=None, parent=None):
+    value, error = check_number(text, name, int, min_value, max_value)
+    if error is not None:
+        show_error(str(error), parent)
+    return value
+
+def show_error(message, parent=None):
+    if _suppressed:
+        _suppressed[-1].append(message)
+        return
+    QMessageBox.warning(parent, "Input Error", message)
+
+@contextmanager
+def suppressed_errors():
+    """
+    Collect errors instead of showing them, e.g. while recalculating as the user types.
+
+    Yields:
+        list of str: The messages show_error was called with inside the block
+    """
+    messages = []
+    _suppressed.append(messages)
+    try:
+        yield messages
+    finally:
+        _suppressed.pop()
@@ -0,0 +1,124 @@
+# ui/sweep_dialog.py
+
+from PyQt6.QtWidgets import (QDialog, QFileDialog, QFormLayout, QHBoxLayout, QLabel, QLineEdit,
+                             QPushButton, QTableView, QVBoxLayout)
+
+from logic.tab2_sweep import sweep_count, sweep_range, sweep_sample_size
+from ui.models import SampleSizeGridModel
+from ui.qt_validators import show_error, validate_float
+
+# parameter name -> (label, default from, to, step, divisor to convert the entered value,
+#                    min and max of the from/to values, the same bounds as the Sample Size tab inputs)
+SWEEP_AXES = {
+    'proportion': ("Estimated Prevalence (%)", "5", "50", "5", 100, 0, 100),
+    'margin_of_error': ("Desired Precision (+/- %)", "2", "10", "1", 100, 0.01, 100),
+    'design_effect': ("Design Effect", "1", "3", "0.5", 1, 1, None),
+}
+# the most scenarios one grid may have: about 8 MB of sample sizes, exported in a few seconds
+MAX_GRID_CELLS = 1_000_000
+
+class SampleSizeSweepDialog(QDialog):
+    """Builds a household sample size sensitivity grid and shows it in a paged table."""
+
+    def __init__(self, tasks, sample_design, population_size, non_response, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Sample Size Sensitivity Grid")
+        self.resize(640, 520)
+        self._tasks = tasks
+        self._sample_design = sample_design
+        self._population_size = population_size
+        self._non_response = non_response
+        self._grid = None
+
+        form = QFormLayout()
+        self._inputs = {}
+        for name, (label, start, stop, step, *_) in SWEEP_AXES.items():
+            row = QHBoxLayout()
+            edits = tuple(QLineEdit(value) for value in (start, stop, step))
+            for caption, edit in zip(("from", "to", "step"), edits):
+                row.addWidget(QLabel(caption))
+                row.addWidget(edit)
+            form.addRow(label, row)
+            self._inputs[name] = edits
+
+        self.generate_button = QPushButton("Generate Grid")
+        self.export_button = QPushButton("Export Grid (CSV)")
+        self.export_button.setEnabled(False)
+        self.summary_label = QLabel()
+        self.table = QTableView()
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.generate_button)
+        buttons.addWidget(self.export_button)
+        buttons.addStretch()
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(form)
+        layout.addLayout(buttons)
+        layout.addWidget(self.summary_label)
+        layout.addWidget(self.table)
+
+        self.generate_button.clicked.connect(self.generate_grid)
+        self.export_button.clicked.connect(self.export_grid)
+
+    def _read_axes(self):
+        ranges = {}
+        for name, (label, _, _, _, divisor, min_value, max_value) in SWEEP_AXES.items():
+            start_edit, stop_edit, step_edit = self._inputs[name]
+            values = [validate_float(start_edit.text(), label, min_value, max_value, parent=self),
+                      validate_float(stop_edit.text(), label, min_value, max_value, parent=self),
+                      validate_float(step_edit.text(), f"{label} step", parent=self)]
+            if any(value is None for value in values):
+                return None
+            start, stop, step = (value / divisor for value in values)
+            try:
+                ranges[name] = (start, stop, step, sweep_count(start, stop, step))
+            except ValueError as e:
+                show_error(f"Invalid range for {label}: {e}", self)
+                return None
+        # counted before any values are built, so a tiny step cannot allocate a huge axis
+        cells = 1
+        for *_, count in ranges.values():
+            cells *= count
+        if cells > MAX_GRID_CELLS:
+            show_error(f"The grid would have {cells:,} scenarios; at most {MAX_GRID_CELLS:,} are allowed. "
+                       "Use larger steps or narrower ranges.", self)
+            return None
+        return {name: sweep_range(start, stop, step) for name, (start, stop, step, _) in ranges.items()}
+
+    def generate_grid(self):
+        axes = self._read_axes()
+        if axes is None:
+            return
+        self.generate_button.setEnabled(False)
+        self.summary_label.setText("Calculating...")
+        self._tasks.submit(sweep_sample_size, 'household', self._sample_design, axes,
+                           population_size=self._population_size, non_response=self._non_response,
+                           key='ss_sweep', on_result=self.show_grid, on_error=self.show_error,
+                           on_finished=self.sweep_finished)
+
+    def done(self, result):
+        # as in PrecisionSimulationDialog: cancelling drops the result of a sweep still running
+        self._tasks.cancel('ss_sweep')
+        super().done(result)
+
+    def sweep_finished(self):
+        self.generate_button.setEnabled(True)
+
+    def show_grid(self, grid):
+        self._grid = grid
+        self.table.setModel(SampleSizeGridModel(grid, self.table))
+        self.summary_label.setText(f"{grid.size:,} scenarios, sample size {grid.sample_sizes.min():,} to {grid.sample_sizes.max():,} households")
+        self.export_button.setEnabled(True)
+
+    def show_error(self, error):
+        self.summary_label.setText(f"Calculation failed: {error}")
+
+    def export_grid(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Sensitivity Grid", "sample_size_grid.csv", "CSV files (*.csv)")
+        if not path:
+            return
+        try:
+            self._grid.export_csv(path)
+        except OSError as e:
+            show_error(f"Could not export the grid: {e}", self)
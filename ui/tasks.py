@@ -0,0 +1,137 @@
+# ui/tasks.py
+#
+# Background execution for MainApp handlers. Work runs on a QThreadPool and its
+# results, errors and progress are delivered back to the GUI thread through
+# queued signals, so handlers never block the event loop.
+#
+# Logic functions stay Qt-free: a task that wants progress reporting receives a
+# plain progress(done, total) callback. Calling it after the task was cancelled
+# raises TaskCancelled inside the worker, which unwinds the computation.
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+class TaskCancelled(Exception):
+    """Raised inside a worker when its task has been cancelled."""
+
+class TaskSignals(QObject):
+    progress = pyqtSignal(int, int)
+    result = pyqtSignal(object)
+    error = pyqtSignal(object)
+    finished = pyqtSignal()
+
+class Task(QRunnable):
+    """
+    A unit of background work.
+
+    Parameters:
+        fn (callable): The function to run in a worker thread
+        *args, **kwargs: Passed to fn
+        with_progress (bool): Pass a progress(done, total) callback to fn as the keyword argument 'progress'
+    """
+
+    def __init__(self, fn, *args, with_progress=False, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = TaskSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._cancelled = False
+        if with_progress:
+            self._kwargs['progress'] = self.report_progress
+
+    @property
+    def cancelled(self):
+        return self._cancelled
+
+    def cancel(self):
+        """Request cancellation. Results of a cancelled task are never delivered."""
+        self._cancelled = True
+
+    def report_progress(self, done, total):
+        if self._cancelled:
+            raise TaskCancelled()
+        self.signals.progress.emit(int(done), int(total))
+
+    def run(self):
+        try:
+            if self._cancelled:
+                return
+            result = self._fn(*self._args, **self._kwargs)
+        except TaskCancelled:
+            pass
+        except Exception as e:
+            if not self._cancelled:
+                self.signals.error.emit(e)
+        else:
+            if not self._cancelled:
+                self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+class TaskRunner(QObject):
+    """
+    Submits Tasks to a thread pool and keeps them alive until they finish.
+
+    Tasks may be submitted under a key (e.g. the name of the output they update). Submitting a new task
+    with the same key cancels the previous one, so only the latest result for an output is shown.
+    """
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self._running = set()
+        self._latest = {}
+
+    def submit(self, fn, *args, key=None, on_result=None, on_error=None, on_progress=None, on_finished=None, with_progress=False, **kwargs):
+        """
+        Run fn(*args, **kwargs) in the background.
+
+        Parameters:
+            fn (callable): The function to run
+            key (str or None): Cancels any running task submitted with the same key
+            on_result, on_error, on_progress, on_finished (callable or None): Called on the GUI thread
+            with_progress (bool): Pass a progress(done, total) callback to fn
+
+        Returns:
+            Task: The submitted task, which can be cancelled
+        """
+        if key is not None and key in self._latest:
+            self._latest[key].cancel()
+
+        task = Task(fn, *args, with_progress=with_progress, **kwargs)
+        # a task cancelled after emitting may still have a queued delivery; drop it
+        if on_result is not None:
+            task.signals.result.connect(lambda result: None if task.cancelled else on_result(result))
+        if on_error is not None:
+            task.signals.error.connect(lambda error: None if task.cancelled else on_error(error))
+        if on_progress is not None:
+            task.signals.progress.connect(on_progress)
+        if on_finished is not None:
+            task.signals.finished.connect(on_finished)
+        task.signals.finished.connect(lambda: self._release(task, key))
+
+        self._running.add(task)
+        if key is not None:
+            self._latest[key] = task
+        self.pool.start(task)
+        return task
+
+    def cancel(self, key):
+        """Cancel the running task submitted under key, if any."""
+        task = self._latest.get(key)
+        if task is not None:
+            task.cancel()
+
+    def cancel_all(self):
+        for task in list(self._running):
+            task.cancel()
+
+    def wait(self, msecs=-1):
+        """Block until all pool work has finished (used on shutdown and in tests)."""
+        return self.pool.waitForDone(msecs)
+
+    def _release(self, task, key):
+        self._running.discard(task)
+        if key is not None and self._latest.get(key) is task:
+            del self._latest[key]